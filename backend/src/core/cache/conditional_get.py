@@ -0,0 +1,81 @@
+"""
+조건부 GET (ETag / 304)
+
+응답이 의존하는 데이터 버전(데이터셋 버전, 규칙 버전 등)과 요청 사용자, 경로,
+정규화된 쿼리 파라미터로 ETag를 만들고, If-None-Match가 같으면 서비스 계층을
+실행하지 않고 304를 반환합니다. (버전은 데이터보다 먼저 읽으므로 그 사이 데이터가
+바뀌어도 다음 요청의 ETag가 달라져 새 응답을 받음)
+
+사용법:
+    dataset_etag = conditional_get(fetch_transactions_version)
+
+    @router.get("/monthly", dependencies=[Depends(dataset_etag)])
+    def monthly_stats(...): ...
+
+    # Response를 직접 반환하는 경로는 ETag 값을 받아 헤더에 추가
+    def get_items(etag: str = Depends(dataset_etag)): ...
+"""
+import hashlib
+import json
+from typing import Callable
+
+from fastapi import Request, Response
+
+from src.core.context.user_context import USER_ID_HEADER, get_current_user_id
+from src.core.exceptions.errors import NotModifiedError
+
+# 사용자별 응답이므로 공유 캐시에 저장하지 않고, 매번 ETag로 재검증
+CACHE_CONTROL = "private, no-cache"
+
+
+# --------------------------------
+# public functions
+# --------------------------------
+def conditional_get(
+    *version_getters: Callable[[], int | str],
+    vary: tuple[str, ...] = (),
+) -> Callable[[Request, Response], str]:
+    """ETag 확인 의존성 생성
+
+    Args:
+        version_getters: 응답이 의존하는 데이터 버전 조회 함수 (버전 번호 또는 상태 토큰)
+        vary: ETag에 포함할 요청 헤더 (Accept 등 응답 형식을 바꾸는 헤더)
+
+    Returns:
+        ETag를 응답 헤더에 설정하고 반환하는 의존성
+        (If-None-Match가 일치하면 NotModifiedError → 304)
+    """
+    vary_header = ", ".join([USER_ID_HEADER, *vary])
+
+    def check_etag(request: Request, response: Response) -> str:
+        versions = [getter() for getter in version_getters]
+        etag = make_etag(request, versions, vary)
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": vary_header}
+
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise NotModifiedError(headers)
+        response.headers.update(headers)
+        return etag
+
+    return check_etag
+
+
+def make_etag(request: Request, versions: list[int | str], vary: tuple[str, ...] = ()) -> str:
+    """(사용자, 경로, 쿼리 파라미터, 데이터 버전, vary 헤더)의 ETag (쿼리 파라미터 순서 무관)"""
+    key = {
+        "user": get_current_user_id(),
+        "path": request.url.path,
+        "query": sorted(request.query_params.multi_items()),
+        "versions": versions,
+        "headers": [request.headers.get(name, "") for name in vary],
+    }
+    digest = hashlib.sha1(json.dumps(key, ensure_ascii=False).encode("utf-8")).hexdigest()
+    return f'"{digest[:20]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더에 etag가 있는지 확인 (약한 비교, "*"는 모두 일치)"""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return any(candidate == "*" or candidate.removeprefix("W/") == etag for candidate in candidates)
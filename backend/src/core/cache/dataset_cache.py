@@ -0,0 +1,166 @@
+"""
+프로세스 전역 데이터셋 캐시
+
+파일 식별자(inode, mtime, 크기)를 버전 키로 사용하여,
+파일이 바뀌지 않은 동안에는 한 번 디코딩한 DataFrame을 재사용합니다.
+(내용 해시는 조회마다 파일 전체를 읽어야 하므로 사용하지 않음, 저장은 atomic_write로
+새 파일을 만들어 교체하므로 내용이 바뀌면 inode도 바뀜)
+
+사용법:
+    df = get_cached_frame(path, lambda: pd.read_parquet(path))
+
+    # 다른 파일에서 파생된 항목은 depends_on의 버전도 키에 포함
+    df = get_cached_frame(overlay_path, loader, depends_on=[base_path])
+
+    # 같은 파일의 일부 컬럼만 읽은 결과는 variant로 구분하여 따로 캐시
+    df = get_cached_frame(path, lambda: pd.read_parquet(path, columns=cols), variant=tuple(cols))
+
+주의:
+    반환되는 DataFrame은 캐시 원본의 스냅샷입니다. 앱 시작 시(main.py) pandas Copy-on-Write를
+    활성화하면 얕은 복사본을 반환하고, 활성화되지 않은 환경(스크립트 등)에서는 깊은 복사본을
+    반환하므로 어느 경우든 스냅샷을 수정해도 캐시 원본에는 영향이 없습니다.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, Sequence
+
+import pandas as pd
+
+from src.core.utils.dataframe_utils import snapshot_frame
+
+logger = logging.getLogger(__name__)
+
+# 캐시 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+# 파티션마다 전체 컬럼 + 분석별 컬럼 선택 결과가 따로 저장되므로 여유 있게 설정
+MAX_CACHE_ENTRIES = 256
+
+FileVersion = tuple[int, int, int, int]
+# (대상 파일 버전, 의존 파일 버전...)
+CacheVersion = tuple[FileVersion | None, ...]
+# (파일 경로, variant)
+CacheKey = tuple[Path, tuple]
+
+_lock = threading.Lock()
+_entries: "OrderedDict[CacheKey, tuple[CacheVersion, pd.DataFrame]]" = OrderedDict()
+# 로드 중인 항목별 (락, 대기 수) - 로드가 끝나 대기하는 스레드가 없으면 제거
+_load_locks: dict[CacheKey, tuple[threading.Lock, list[int]]] = {}
+_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+
+# --------------------------------
+# public functions
+# --------------------------------
+def get_file_version(path: Path) -> FileVersion | None:
+    """파일 버전 키 조회 (파일이 없으면 None)"""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def get_cached_frame(
+    path: Path,
+    loader: Callable[[], pd.DataFrame],
+    depends_on: Sequence[Path] = (),
+    variant: tuple = (),
+) -> pd.DataFrame:
+    """캐시된 DataFrame 스냅샷 반환 (버전이 바뀌었으면 loader로 다시 로드)
+
+    Args:
+        path: 데이터 파일 경로 (캐시 키)
+        loader: 캐시 미스 시 DataFrame을 로드하는 함수
+        depends_on: 함께 버전을 확인할 파일 경로 (하나라도 바뀌면 다시 로드)
+        variant: 같은 파일에서 다르게 로드한 결과 구분 (예: 선택한 컬럼 목록)
+
+    Raises:
+        FileNotFoundError: 파일이 없는 경우
+    """
+    version = _get_cache_version(path, depends_on)
+    if version[0] is None:
+        raise FileNotFoundError(path)
+
+    key = (path, variant)
+    snapshot = _get_if_fresh(key, version, record_stats=True)
+    if snapshot is not None:
+        return snapshot
+
+    # 같은 항목에 대한 동시 미스는 한 번만 디코딩 (나머지는 대기 후 캐시 사용)
+    with _load_lock(key):
+        snapshot = _get_if_fresh(key, version, record_stats=False)
+        if snapshot is not None:
+            return snapshot
+
+        frame = loader()
+        # 로드 도중 파일이 교체되었을 수 있으므로 로드 후 버전으로 저장
+        loaded_version = _get_cache_version(path, depends_on)
+        with _lock:
+            if loaded_version == version:
+                _entries[key] = (version, frame)
+                _entries.move_to_end(key)
+                while len(_entries) > MAX_CACHE_ENTRIES:
+                    _entries.popitem(last=False)
+        logger.debug(f"데이터셋 캐시 로드: {path} {variant or ''} ({len(frame)}행)")
+        return snapshot_frame(frame)
+
+
+def invalidate_cached_frame(path: Path | None = None) -> None:
+    """캐시 무효화 (path가 None이면 전체, 해당 파일의 모든 variant 포함)"""
+    with _lock:
+        if path is None:
+            _entries.clear()
+        else:
+            for key in [key for key in _entries if key[0] == path]:
+                del _entries[key]
+        _stats["invalidations"] += 1
+
+
+def get_cache_stats() -> dict:
+    """캐시 히트/미스 통계 조회"""
+    with _lock:
+        total = _stats["hits"] + _stats["misses"]
+        return {
+            **_stats,
+            "entries": len(_entries),
+            "hit_ratio": round(_stats["hits"] / total, 4) if total else 0.0,
+        }
+
+
+# --------------------------------
+# private functions
+# --------------------------------
+def _get_cache_version(path: Path, depends_on: Sequence[Path]) -> CacheVersion:
+    """대상 파일과 의존 파일들의 버전 조회"""
+    return (get_file_version(path), *(get_file_version(dep) for dep in depends_on))
+
+
+def _get_if_fresh(key: CacheKey, version: CacheVersion, record_stats: bool) -> pd.DataFrame | None:
+    """버전이 일치하는 캐시 항목이 있으면 스냅샷 반환"""
+    with _lock:
+        entry = _entries.get(key)
+        hit = entry is not None and entry[0] == version
+        if record_stats:
+            _stats["hits" if hit else "misses"] += 1
+        if not hit:
+            return None
+        _entries.move_to_end(key)
+        return snapshot_frame(entry[1])
+
+
+@contextmanager
+def _load_lock(key: CacheKey) -> Iterator[None]:
+    """캐시 항목별 로드 락 (같은 항목을 로드하려는 스레드가 모두 끝나면 제거)"""
+    with _lock:
+        lock, waiters = _load_locks.setdefault(key, (threading.Lock(), [0]))
+        waiters[0] += 1
+    try:
+        with lock:
+            yield
+    finally:
+        with _lock:
+            waiters[0] -= 1
+            if waiters[0] == 0:
+                del _load_locks[key]
@@ -7,4 +7,18 @@ IS_DEPLOYMENT = os.getenv("RAILWAY_ENVIRONMENT") is not None or os.getenv("PORT"
 # CORS 설정
 ALLOWED_ORIGINS = [
     "https://banksalad-backend.up.railway.app",
-]
\ No newline at end of file
+]
+
+# 업로드 변환 작업 설정
+UPLOAD_MAX_WORKERS = int(os.getenv("UPLOAD_MAX_WORKERS", "2"))        # 동시에 변환하는 최대 작업 수
+UPLOAD_MAX_PENDING_JOBS = int(os.getenv("UPLOAD_MAX_PENDING_JOBS", "20"))  # 대기 가능한 최대 작업 수
+UPLOAD_JOB_HISTORY_SIZE = 200                                           # 보관하는 완료 작업 수
+
+# 거래 수정 델타 로그 설정
+TRANSACTION_DELTA_COMPACTION_BYTES = int(os.getenv("TRANSACTION_DELTA_COMPACTION_BYTES", str(64 * 1024)))  # 이 크기를 넘으면 파티션에 반영
+
+# 데이터셋 변경 로그 설정
+CHANGE_LOG_MAX_BYTES = int(os.getenv("CHANGE_LOG_MAX_BYTES", str(4 * 1024 * 1024)))  # 이 크기를 넘으면 오래된 변경 내역부터 삭제
+
+# 대시보드 분석 설정
+DASHBOARD_MAX_WORKERS = int(os.getenv("DASHBOARD_MAX_WORKERS", "6"))  # 대시보드 분석 항목을 동시에 실행하는 스레드 수
@@ -0,0 +1,91 @@
+"""
+요청 사용자 컨텍스트
+
+요청 헤더(X-User-Id)로 사용자를 식별하고, 요청 처리 동안
+ContextVar에 보관하여 Repository 계층에서 사용자별 데이터셋을 선택합니다.
+
+사용법:
+    app.add_middleware(UserContextMiddleware)
+
+    user_id = get_current_user_id()
+"""
+import re
+from contextvars import ContextVar, Token
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+
+USER_ID_HEADER = "X-User-Id"
+DEFAULT_USER_ID = "default"
+
+# 경로에 그대로 사용되므로 영문/숫자/-/_ 만 허용 (경로 순회 방지)
+_USER_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+_current_user_id: ContextVar[str] = ContextVar("current_user_id", default=DEFAULT_USER_ID)
+
+
+# --------------------------------
+# public functions
+# --------------------------------
+def get_current_user_id() -> str:
+    """현재 요청의 사용자 ID 조회 (없으면 기본 사용자)"""
+    return _current_user_id.get()
+
+
+def set_current_user_id(user_id: str) -> Token:
+    """현재 컨텍스트의 사용자 ID 설정"""
+    validate_user_id(user_id)
+    return _current_user_id.set(user_id)
+
+
+def reset_current_user_id(token: Token) -> None:
+    """사용자 ID 설정 복원"""
+    _current_user_id.reset(token)
+
+
+def resolve_user_id(user_id: str | None) -> str:
+    """명시된 사용자 ID가 없으면 현재 요청의 사용자 ID 반환"""
+    if user_id is None:
+        return get_current_user_id()
+    validate_user_id(user_id)
+    return user_id
+
+
+def validate_user_id(user_id: str) -> None:
+    """사용자 ID 형식 검증"""
+    if not _USER_ID_PATTERN.match(user_id):
+        raise ValueError(f"사용자 ID 형식이 올바르지 않습니다: {user_id!r}")
+
+
+# --------------------------------
+# middleware
+# --------------------------------
+class UserContextMiddleware:
+    """X-User-Id 헤더를 읽어 요청 사용자 컨텍스트를 설정하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        header_name = USER_ID_HEADER.lower().encode("latin-1")
+        raw_user_id = dict(scope["headers"]).get(header_name)
+        user_id = raw_user_id.decode("latin-1").strip() if raw_user_id else DEFAULT_USER_ID
+
+        try:
+            token = set_current_user_id(user_id)
+        except ValueError as e:
+            response = JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"detail": str(e)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            reset_current_user_id(token)
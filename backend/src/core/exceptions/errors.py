@@ -0,0 +1,32 @@
+"""도메인 공통 예외 (HTTP 상태 코드는 http_exceptions.py에서 매핑)"""
+
+
+class VersionConflictError(Exception):
+    """낙관적 동시성 제어 실패 (요청한 버전과 현재 버전이 다름, 409)"""
+
+    def __init__(self, resource: str, expected_version: int, current_version: int):
+        self.resource = resource
+        self.expected_version = expected_version
+        self.current_version = current_version
+        super().__init__(
+            f"{resource} 변경 충돌: 다른 요청에 의해 이미 변경되었습니다 "
+            f"(요청 버전: {expected_version}, 현재 버전: {current_version})"
+        )
+
+
+class NotModifiedError(Exception):
+    """조건부 GET에서 클라이언트가 가진 응답이 최신 (304)"""
+
+    def __init__(self, headers: dict[str, str]):
+        self.headers = headers
+        super().__init__(f"변경 없음: {headers.get('ETag')}")
+
+
+def check_version(resource: str, expected_version: int | None, current_version: int) -> None:
+    """요청 버전 확인 (expected_version이 None이면 확인하지 않음)
+
+    Raises:
+        VersionConflictError: 버전이 다른 경우
+    """
+    if expected_version is not None and expected_version != current_version:
+        raise VersionConflictError(resource, expected_version, current_version)
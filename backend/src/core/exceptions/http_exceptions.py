@@ -1,8 +1,10 @@
-from fastapi import Request, status
+from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 import logging
 
+from src.core.exceptions.errors import NotModifiedError, VersionConflictError
+
 logger = logging.getLogger(__name__)
 
 def setup_http_exception_handlers(app):
@@ -37,6 +39,20 @@ def setup_http_exception_handlers(app):
             },
         )
     
+    @app.exception_handler(VersionConflictError)
+    async def version_conflict_handler(request: Request, exc: VersionConflictError):
+        """동시 수정 충돌 (409)"""
+        logger.warning(f"버전 충돌: {exc}")
+        return JSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content={"detail": str(exc), "current_version": exc.current_version},
+        )
+
+    @app.exception_handler(NotModifiedError)
+    async def not_modified_handler(request: Request, exc: NotModifiedError):
+        """조건부 GET 응답 변경 없음 (304, 본문 없음)"""
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=exc.headers)
+
     @app.exception_handler(FileNotFoundError)
     async def file_not_found_handler(request: Request, exc: FileNotFoundError):
         """파일/리소스 없음 (404)"""
@@ -1,20 +1,88 @@
+import bisect
+
 import pandas as pd
 
+# 정렬 불변식 표시용 DataFrame.attrs 키 (값: 내림차순으로 정렬된 컬럼명)
+SORTED_DESC_ATTR = "sorted_desc_by"
+
+
 # ======================= filter utils =======================
 def filter_by_date_range(
     df: pd.DataFrame,
     start_date: str | None,
     end_date: str | None
 ) -> pd.DataFrame:
-    """날짜 범위로 데이터 필터링"""
+    """날짜 범위로 데이터 필터링
+
+    거래일시 내림차순 정렬이 표시된 데이터는 이진 탐색으로 구간을 찾아 슬라이스로 반환합니다.
+    """
+    start = pd.to_datetime(start_date) if start_date else None
+    end = pd.to_datetime(end_date) if end_date else None
+    if is_sorted_desc(df, "거래일시"):
+        return slice_sorted_desc(df, "거래일시", start, end)
+
     # 시작일 필터링
-    if start_date:
-        df = df[df["거래일시"] >= pd.to_datetime(start_date)]
+    if start is not None:
+        df = df[df["거래일시"] >= start]
     # 종료일 필터링
-    if end_date:
-        df = df[df["거래일시"] <= pd.to_datetime(end_date)]
+    if end is not None:
+        df = df[df["거래일시"] <= end]
     return df
 
+
+# ======================= sorted utils =======================
+def mark_sorted_desc(df: pd.DataFrame, column: str = "거래일시") -> pd.DataFrame:
+    """column 기준 내림차순 정렬되어 있음을 표시 (저장소에서 로드 직후 호출)"""
+    df.attrs[SORTED_DESC_ATTR] = column
+    return df
+
+
+def is_sorted_desc(df: pd.DataFrame, column: str = "거래일시") -> bool:
+    """column 기준 내림차순 정렬 표시 여부
+
+    attrs는 정렬 등 순서를 바꾸는 연산 뒤에도 남으므로,
+    행 순서가 로드 시점과 같은지(인덱스 오름차순) 함께 확인합니다.
+    """
+    return (
+        df.attrs.get(SORTED_DESC_ATTR) == column
+        and column in df.columns
+        and df.index.is_monotonic_increasing
+    )
+
+
+def slice_sorted_desc(
+    df: pd.DataFrame,
+    column: str,
+    start: pd.Timestamp | None,
+    end: pd.Timestamp | None,
+    end_inclusive: bool = True,
+) -> pd.DataFrame:
+    """내림차순 정렬된 datetime 컬럼에서 start <= 값 <= end 구간을 이진 탐색으로 슬라이스 (O(log n))
+
+    Args:
+        end_inclusive: False면 값 < end
+    """
+    # datetime64 → int64 뷰 (복사 없음), 내림차순이므로 부호를 바꿔 오름차순으로 탐색
+    values = df[column].to_numpy()
+    ints = values.view("i8")
+    descending_key = lambda value: -int(value)  # noqa: E731
+
+    def to_key(bound: pd.Timestamp) -> int:
+        # 컬럼과 같은 단위(ns/us/ms)의 정수로 변환
+        return -int(pd.Timestamp(bound).to_datetime64().astype(values.dtype).view("i8"))
+
+    stop = len(ints)
+    if start is not None:
+        # 값 >= start 인 앞쪽 구간의 끝
+        stop = bisect.bisect_right(ints, to_key(start), key=descending_key)
+    begin = 0
+    if end is not None:
+        # 값 > end (또는 >= end) 인 앞쪽 구간 건너뛰기
+        end_key = to_key(end)
+        search = bisect.bisect_left if end_inclusive else bisect.bisect_right
+        begin = search(ints, end_key, key=descending_key)
+    return df.iloc[begin:max(begin, stop)]
+
 # ======================= parse utils =======================
 def filter_expense_only(df: pd.DataFrame) -> pd.DataFrame:
     """지출 데이터만 필터링 및 금액 절댓값 변환"""
@@ -33,14 +101,12 @@ def validate_datetime_column(df: pd.DataFrame) -> None:
         raise ValueError("거래일시 데이터 타입 오류 - parquet 파일을 확인해주세요.")
 
 
-# ======================= enrich utils =======================
-def enrich_with_time_data(df: pd.DataFrame) -> pd.DataFrame:
-    """시간, 요일 데이터 추가"""
-    # 시간 데이터 추가
-    df["hour"] = df["거래일시"].dt.hour
-    # 요일 데이터 추가
-    df["day_of_week"] = df["거래일시"].dt.day_name()
-    # 일자 데이터 추가
-    df["date"] = df["거래일시"].dt.date
-    # 데이터프레임 반환
-    return df
\ No newline at end of file
+
+# ======================= copy utils =======================
+def snapshot_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """공유 중인 DataFrame의 수정 가능한 스냅샷
+
+    pandas Copy-on-Write가 켜져 있으면(앱 시작 시 활성화) 얕은 복사로 충분하고,
+    꺼져 있으면 수정이 원본에 반영되지 않도록 깊은 복사를 반환합니다.
+    """
+    return df.copy(deep=not pd.get_option("mode.copy_on_write"))
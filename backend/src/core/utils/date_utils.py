@@ -1,5 +1,7 @@
 import calendar
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
+
+import pandas as pd
 
 
 def get_month_date_range(year: int, month: int) -> Tuple[str, str]:
@@ -48,4 +50,31 @@ def parse_date_params(
     """
     if year and month:
         return get_month_date_range(year, month)
-    return start_date, end_date
\ No newline at end of file
+    return start_date, end_date
+
+def to_month_key(date_str: Optional[str]) -> Optional[Tuple[int, int]]:
+    """날짜 문자열을 (연도, 월) 키로 변환 (월별 파티션 선택용)
+    
+    Example:
+        >>> to_month_key('2025-12-15')
+        (2025, 12)
+        >>> to_month_key(None) is None
+        True
+    """
+    if not date_str:
+        return None
+    timestamp = pd.to_datetime(date_str)
+    return timestamp.year, timestamp.month
+
+
+def iter_months(start: Tuple[int, int], end: Tuple[int, int]) -> Iterator[Tuple[int, int]]:
+    """start ~ end (포함) 범위의 (연도, 월) 순회
+    
+    Example:
+        >>> list(iter_months((2024, 11), (2025, 1)))
+        [(2024, 11), (2024, 12), (2025, 1)]
+    """
+    year, month = start
+    while (year, month) <= end:
+        yield year, month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
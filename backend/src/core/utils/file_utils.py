@@ -0,0 +1,102 @@
+"""
+파일 쓰기 유틸
+
+- atomic_write: 같은 디렉토리의 임시 파일에 쓴 뒤 os.replace로 교체
+  (읽는 쪽은 락 없이도 항상 이전 파일 또는 완성된 새 파일만 보게 됨)
+- InterProcessLock: 여러 uvicorn 워커 사이의 읽기-수정-쓰기 구간 직렬화
+  (fcntl 권고 락, 같은 스레드에서 중첩 진입 가능)
+"""
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경: 프로세스 내 락만 사용
+    fcntl = None
+
+_locks_guard = threading.Lock()
+_locks: dict[Path, "InterProcessLock"] = {}
+
+
+# ======================= write utils =======================
+def atomic_write(path: Path, write: Callable[[Path], None]) -> None:
+    """임시 파일에 쓴 뒤 원자적으로 교체
+
+    Args:
+        path: 최종 파일 경로
+        write: 임시 파일 경로를 받아 내용을 쓰는 함수
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+    try:
+        write(tmp_path)
+        with open(tmp_path, "rb+") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_text(path: Path, text: str) -> None:
+    """텍스트 파일 원자적 저장 (UTF-8)"""
+    atomic_write(path, lambda tmp_path: tmp_path.write_text(text, encoding="utf-8"))
+
+
+# ======================= lock utils =======================
+class InterProcessLock:
+    """프로세스 간 배타 락 (lock 파일에 fcntl.flock)
+
+    같은 프로세스의 스레드끼리는 RLock으로 직렬화하고,
+    가장 바깥 진입에서만 flock을 잡으므로 중첩해서 사용할 수 있습니다.
+
+    사용법:
+        with get_file_lock(path):
+            ...  # 읽기-수정-쓰기
+    """
+
+    def __init__(self, lock_path: Path):
+        self.lock_path = lock_path
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd: int | None = None
+
+    def __enter__(self) -> "InterProcessLock":
+        self._thread_lock.acquire()
+        try:
+            if self._depth == 0 and fcntl is not None:
+                self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                except BaseException:
+                    os.close(fd)
+                    raise
+                self._fd = fd
+        except BaseException:
+            self._thread_lock.release()
+            raise
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._depth -= 1
+        if self._depth == 0 and self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+        self._thread_lock.release()
+
+
+def get_file_lock(lock_path: Path) -> InterProcessLock:
+    """lock 파일 경로별 락 조회 (없으면 생성)"""
+    with _locks_guard:
+        lock = _locks.get(lock_path)
+        if lock is None:
+            lock = _locks[lock_path] = InterProcessLock(lock_path)
+        return lock
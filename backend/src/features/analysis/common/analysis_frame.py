@@ -0,0 +1,210 @@
+"""
+분석용 거래내역 프레임
+
+과소비/반복 소비/시간대/소비 성향/절약 기회 분석이 공통으로 사용하는 데이터입니다.
+(데이터셋 버전, 조회 기간, 컬럼)별로 한 번 로드하여 날짜 필터링 → 지출 필터링 → 검증을 거치고,
+분석마다 필요한 파생 컬럼은 처음 사용할 때 한 번만 계산하여 보관합니다.
+
+컬럼은 분석마다 선언한 REQUIRED_COLUMNS만 디코딩하며, 같은 기간에 요청한 컬럼을 모두 가진
+프레임이 이미 있으면 그 프레임을 재사용합니다. (대시보드는 항목들의 컬럼 합집합을 먼저 로드)
+
+    frame = load_analysis_frame(year=2025, month=1, columns=["거래일시", "타입", "금액"])
+    frame.transactions                       ← 조회 기간의 전체 거래 (수입 포함)
+    frame.expenses                           ← 지출만 (금액 절댓값)
+    frame.with_columns("hour", "week")       ← 지출 + 파생 컬럼
+
+파생 컬럼 (지출 행 기준):
+    hour        시 (0~23)
+    weekday     요일 번호 (월=0 ~ 일=6)
+    day_name    요일 이름 (Monday ~ Sunday)
+    day         일 (1~31)
+    date        날짜 (datetime.date)
+    week        ISO 주 번호 (1~53)
+    month       월 (Period[M])
+    is_weekend  주말(토, 일) 여부
+
+반환하는 DataFrame은 보관 중인 원본의 스냅샷(Copy-on-Write가 켜져 있으면 얕은 복사본)이므로,
+컬럼을 추가/수정해도 다른 요청에 영향이 없습니다.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+import pandas as pd
+
+from src.core.context.user_context import resolve_user_id
+from src.core.utils.date_utils import parse_date_params
+from src.core.utils.dataframe_utils import (
+    filter_by_date_range,
+    filter_expense_only,
+    snapshot_frame,
+    validate_datetime_column,
+)
+from src.features.transaction.repository.transaction_repository import get_transactions_version, load_transactions
+
+logger = logging.getLogger(__name__)
+
+# 보관하는 분석 프레임 수 ((사용자, 데이터셋 버전, 조회 기간, 컬럼)별, 초과 시 가장 오래 사용되지 않은 프레임 제거)
+MAX_FRAME_ENTRIES = 32
+
+# (사용자, 데이터셋 버전, 시작일, 종료일, 컬럼 (None이면 전체))
+FrameKey = tuple[str, int, str | None, str | None, frozenset[str] | None]
+
+# 파생 컬럼 이름 → 지출 거래일시에서 계산하는 함수
+_DERIVED_COLUMNS: dict[str, Callable[[pd.Series], pd.Series]] = {
+    "hour": lambda dates: dates.dt.hour,
+    "weekday": lambda dates: dates.dt.dayofweek,
+    "day_name": lambda dates: dates.dt.day_name(),
+    "day": lambda dates: dates.dt.day,
+    "date": lambda dates: dates.dt.date,
+    "week": lambda dates: dates.dt.isocalendar().week,
+    "month": lambda dates: dates.dt.to_period("M"),
+}
+
+_lock = threading.Lock()
+_frames: "OrderedDict[FrameKey, AnalysisFrame]" = OrderedDict()
+
+
+class AnalysisFrame:
+    """조회 기간의 분석용 거래내역 (파생 컬럼은 처음 사용 시 계산하여 보관)
+
+    사용법:
+        frame = load_analysis_frame(year, month)
+        if frame.empty:
+            return []
+        df = frame.with_columns("hour", "day_name")
+    """
+
+    def __init__(self, transactions: pd.DataFrame, version: int):
+        self.version = version
+        self._transactions = transactions
+
+        expenses = transactions
+        if not expenses.empty:
+            expenses = filter_expense_only(expenses)
+        if not expenses.empty:
+            validate_datetime_column(expenses)
+        self._expenses = expenses
+
+        self._derived: dict[str, pd.Series] = {}
+        self._build_lock = threading.RLock()
+
+    @property
+    def empty(self) -> bool:
+        """지출 거래가 없는지 여부"""
+        return self._expenses.empty
+
+    @property
+    def transactions(self) -> pd.DataFrame:
+        """조회 기간의 전체 거래 (수입/지출/이체 포함, 스냅샷)"""
+        return snapshot_frame(self._transactions)
+
+    @property
+    def expenses(self) -> pd.DataFrame:
+        """조회 기간의 지출 거래 (금액 절댓값, 스냅샷)"""
+        return snapshot_frame(self._expenses)
+
+    def column(self, name: str) -> pd.Series:
+        """지출 행의 파생 컬럼 (처음 사용 시 계산)
+
+        Raises:
+            ValueError: 지원하지 않는 파생 컬럼인 경우
+        """
+        series = self._derived.get(name)
+        if series is not None:
+            return series
+        with self._build_lock:
+            series = self._derived.get(name)
+            if series is None:
+                series = self._build(name)
+                self._derived[name] = series
+        return series
+
+    def with_columns(self, *names: str) -> pd.DataFrame:
+        """지출 거래에 파생 컬럼을 붙인 DataFrame (새 DataFrame, 원본은 그대로)"""
+        if self._expenses.empty:
+            return self.expenses
+        return self._expenses.assign(**{name: self.column(name) for name in names})
+
+    def _build(self, name: str) -> pd.Series:
+        """파생 컬럼 계산 (is_weekend는 weekday에서 계산)"""
+        if name == "is_weekend":
+            return self.column("weekday").isin([5, 6])
+        build = _DERIVED_COLUMNS.get(name)
+        if build is None:
+            raise ValueError(f"지원하지 않는 파생 컬럼입니다: {name}")
+        return build(self._expenses["거래일시"])
+
+
+# --------------------------------
+# public functions
+# --------------------------------
+def load_analysis_frame(
+    year: int | None = None,
+    month: int | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    user_id: str | None = None,
+    columns: list[str] | None = None,
+) -> AnalysisFrame:
+    """조회 기간의 분석 프레임 조회 ((사용자, 데이터셋 버전, 조회 기간, 컬럼)별 캐시)
+
+    year/month가 모두 주어지면 해당 월, 아니면 start_date~end_date (없으면 전체 기간)
+    columns: 분석에 필요한 컬럼 (None이면 전체, 파일에 없는 컬럼은 무시)
+    """
+    user_id = resolve_user_id(user_id)
+    start_date, end_date = parse_date_params(year, month, start_date, end_date)
+    column_set = frozenset(columns) if columns is not None else None
+
+    # 버전을 데이터보다 먼저 읽음 (그 사이 변경되면 다음 조회에서 다시 생성)
+    version = get_transactions_version(user_id)
+    key = (user_id, version, start_date, end_date, column_set)
+    with _lock:
+        cached_key = _find_frame_key(key)
+        if cached_key is not None:
+            _frames.move_to_end(cached_key)
+            return _frames[cached_key]
+
+    frame = AnalysisFrame(_load_window(user_id, start_date, end_date, columns), version)
+    logger.debug(
+        f"분석 프레임 생성: user={user_id}, 기간={start_date}~{end_date}, "
+        f"컬럼={sorted(column_set) if column_set is not None else '전체'} (버전 {version})"
+    )
+
+    with _lock:
+        _frames[key] = frame
+        _frames.move_to_end(key)
+        while len(_frames) > MAX_FRAME_ENTRIES:
+            _frames.popitem(last=False)
+    return frame
+
+
+# --------------------------------
+# private functions
+# --------------------------------
+def _find_frame_key(key: FrameKey) -> FrameKey | None:
+    """요청한 컬럼을 모두 가진 같은 (사용자, 버전, 조회 기간)의 프레임 키 (_lock 안에서 호출)"""
+    if key in _frames:
+        return key
+    prefix, column_set = key[:4], key[4]
+    for cached_key in reversed(_frames):
+        if cached_key[:4] != prefix:
+            continue
+        cached_columns = cached_key[4]
+        if cached_columns is None or (column_set is not None and column_set <= cached_columns):
+            return cached_key
+    return None
+
+
+def _load_window(
+    user_id: str,
+    start_date: str | None,
+    end_date: str | None,
+    columns: list[str] | None,
+) -> pd.DataFrame:
+    """조회 기간의 거래내역 로드 (조회 기간에 해당하는 월의 요청 컬럼만 읽은 뒤 날짜 필터링)"""
+    df = load_transactions(start_date, end_date, user_id=user_id, columns=columns)
+    if df.empty:
+        return df
+    return filter_by_date_range(df, start_date, end_date)
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+from typing import Any, Optional
+
+
+# ============================================================
+# API 응답 모델
+# ============================================================
+class DashboardSection(BaseModel):
+    """대시보드 분석 항목 결과"""
+    data: Any = None              # 개별 분석 API와 같은 응답 (실패 시 None)
+    elapsed_ms: float             # 항목 실행 시간
+    error: Optional[str] = None   # 실패 사유 (성공 시 None)
+
+
+class DashboardResponse(BaseModel):
+    """대시보드 응답 (월별 통계 / 과소비 / 반복 소비 / 시간대 / 소비 성향 / 절약 기회)"""
+    month: str                    # 조회 월 (YYYY-MM)
+    version: int                  # 분석에 사용한 데이터셋 버전
+    elapsed_ms: float             # 전체 실행 시간
+    sections: dict[str, DashboardSection]
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, Query
+
+from src.core.cache.conditional_get import conditional_get
+from src.features.analysis.dashboard.model.dashboard import DashboardResponse
+from src.features.analysis.dashboard.service.dashboard_service import analyze_dashboard
+from src.features.analysis.overspending.service.rule_service import get_overspending_rules_state
+from src.features.transaction.service.transaction_service import fetch_transactions_version
+
+dashboard_router = APIRouter(prefix="/analysis/dashboard", tags=["대시보드"])
+
+# 조회 응답 ETag (데이터셋 버전 / 규칙 파일 상태가 같으면 304)
+_dataset_rules_etag = conditional_get(fetch_transactions_version, get_overspending_rules_state)
+
+
+@dashboard_router.get("", response_model=DashboardResponse, dependencies=[Depends(_dataset_rules_etag)])
+def get_dashboard(
+    year: int = Query(..., description="조회할 연도", examples=[2024]),
+    month: int = Query(..., ge=1, le=12, description="조회할 월 (1~12)", examples=[12]),
+):
+    """대시보드 분석 (월별 통계 / 과소비 / 반복 소비 / 시간대 / 소비 성향 / 절약 기회를 동시에 실행)"""
+    return analyze_dashboard(year, month)
@@ -0,0 +1,173 @@
+"""
+대시보드 분석
+
+홈 화면이 월마다 호출하던 분석 API 6개(월별 통계 / 과소비 / 반복 소비 / 시간대 /
+소비 성향 / 절약 기회)를 한 번에 실행합니다.
+
+1. 조회 월의 분석 프레임을 항목들의 컬럼 합집합으로 먼저 한 번 로드 (이후 항목들은 캐시된 프레임을 공유)
+2. 항목별 분석을 스레드 풀에서 동시에 실행 (요청의 사용자 컨텍스트를 복사해서 실행)
+3. 절약 기회는 같은 요청의 반복 소비/과소비 결과를 받아 다시 분석하지 않음
+
+항목 하나가 실패해도 나머지 결과는 반환하며, 실패한 항목은 error에 사유를 담습니다.
+"""
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from src.core.config.settings import DASHBOARD_MAX_WORKERS
+from src.features.analysis.common.analysis_frame import load_analysis_frame
+from src.features.analysis.dashboard.model.dashboard import DashboardResponse, DashboardSection
+from src.features.analysis.overspending.model.overspending_response import (
+    OverspendingPatternsResponse,
+    RecurringPatternsResponse,
+    TimeBasedPatternsResponse,
+)
+from src.features.analysis.overspending.service import overspending_service, recurring_service, time_analysis_service
+from src.features.analysis.overspending.service.overspending_service import analyze_overspending
+from src.features.analysis.overspending.service.recurring_service import analyze_recurring
+from src.features.analysis.overspending.service.time_analysis_service import analyze_time_based_spending
+from src.features.analysis.statistic.service.statistic_service import get_monthly_stats
+from src.features.saving.model.saving import SavingsOpportunitiesResponse
+from src.features.saving.service import saving_service
+from src.features.saving.service.saving_service import RECURRING_MIN_COUNT, analyze_savings_opportunities
+from src.features.user.repository import personality_repository
+from src.features.user.service.personality_service import analyze_spending_personality
+
+logger = logging.getLogger(__name__)
+
+# 응답의 항목 순서
+SECTION_NAMES = ["monthly_stats", "overspending", "recurring", "time_based", "personality", "savings"]
+
+# 조회 월 분석 프레임을 사용하는 항목들의 컬럼 합집합 (월별 통계는 컬럼 저장소를 사용)
+SHARED_FRAME_COLUMNS = sorted(set().union(
+    overspending_service.REQUIRED_COLUMNS,
+    recurring_service.REQUIRED_COLUMNS,
+    time_analysis_service.REQUIRED_COLUMNS,
+    personality_repository.REQUIRED_COLUMNS,
+    saving_service.REQUIRED_COLUMNS,
+))
+
+# 예상하지 못한 오류의 사용자 메시지 (상세 내용은 로그에만 기록)
+UNEXPECTED_ERROR_MESSAGE = "분석 중 오류가 발생했습니다."
+
+_executor: ThreadPoolExecutor | None = None
+_lock = threading.Lock()
+
+
+# --------------------------------
+# public functions
+# --------------------------------
+def analyze_dashboard(year: int, month: int) -> DashboardResponse:
+    """조회 월의 대시보드 분석 (항목별 결과와 실행 시간)"""
+    started = time.perf_counter()
+
+    # 항목들이 공유할 분석 프레임을 먼저 로드 (동시에 같은 프레임을 여러 번 만들지 않도록)
+    frame = load_analysis_frame(year=year, month=month, columns=SHARED_FRAME_COLUMNS)
+
+    executor = _get_executor()
+    submit = lambda task: executor.submit(contextvars.copy_context().run, _run_section, task)
+
+    # 절약 기회가 기다리는 항목을 먼저 등록
+    # (스레드 풀은 등록 순서대로 실행하므로, 절약 기회가 시작될 때 두 항목은 이미 실행 중이거나 완료됨)
+    recurring = submit(lambda: analyze_recurring(year=year, month=month, min_count=RECURRING_MIN_COUNT))
+    overspending = submit(lambda: analyze_overspending(year=year, month=month))
+    futures: dict[str, Future] = {
+        "recurring": recurring,
+        "overspending": overspending,
+        "savings": submit(lambda: analyze_savings_opportunities(
+            year=year,
+            month=month,
+            recurring_patterns=_result_or_none(recurring),
+            overspending_patterns=_result_or_none(overspending),
+        )),
+        "monthly_stats": submit(lambda: get_monthly_stats(year, month)),
+        "time_based": submit(lambda: analyze_time_based_spending(year=year, month=month)),
+        "personality": submit(lambda: analyze_spending_personality(year=year, month=month)),
+    }
+
+    sections = {}
+    for name in SECTION_NAMES:
+        data, elapsed_ms, error = _wait_section(futures[name])
+        sections[name] = DashboardSection(data=_to_response(name, data), elapsed_ms=elapsed_ms, error=error)
+
+    elapsed_ms = _elapsed_ms(started)
+    logger.info(
+        f"대시보드 분석 완료: {year}-{month:02d} {elapsed_ms:.0f}ms "
+        f"({', '.join(f'{name}={section.elapsed_ms:.0f}' for name, section in sections.items())})"
+    )
+    return DashboardResponse(
+        month=f"{year}-{month:02d}",
+        version=frame.version,
+        elapsed_ms=elapsed_ms,
+        sections=sections,
+    )
+
+
+def shutdown_dashboard_executor() -> None:
+    """앱 종료 시 대기 중인 분석 취소 및 실행 중인 분석 완료 대기"""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+# --------------------------------
+# private functions
+# --------------------------------
+def _get_executor() -> ThreadPoolExecutor:
+    """분석 스레드 풀 조회 (없으면 생성)"""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=DASHBOARD_MAX_WORKERS, thread_name_prefix="dashboard")
+        return _executor
+
+
+def _run_section(task: Callable[[], Any]) -> tuple[Any, float, str | None]:
+    """항목 실행 (스레드 풀) → (결과, 실행 시간 ms, 실패 사유)"""
+    started = time.perf_counter()
+    try:
+        return task(), _elapsed_ms(started), None
+    except (ValueError, FileNotFoundError) as e:
+        return None, _elapsed_ms(started), str(e)
+    except Exception as e:
+        logger.error(f"대시보드 항목 분석 실패: {e}", exc_info=True)
+        return None, _elapsed_ms(started), UNEXPECTED_ERROR_MESSAGE
+
+
+def _wait_section(future: Future) -> tuple[Any, float, str | None]:
+    """항목 결과 대기 (앱 종료로 취소된 경우 실패로 처리)"""
+    try:
+        return future.result()
+    except CancelledError:
+        return None, 0.0, UNEXPECTED_ERROR_MESSAGE
+
+
+def _result_or_none(future: Future) -> Any:
+    """다른 항목의 결과 (실패했으면 None → 절약 기회 분석에서 다시 분석)"""
+    data, _, error = _wait_section(future)
+    return None if error else data
+
+
+def _to_response(name: str, data: Any) -> Any:
+    """항목 결과를 개별 분석 API와 같은 응답 형태로 변환"""
+    if data is None:
+        return None
+    if name == "overspending":
+        return OverspendingPatternsResponse(count=len(data), patterns=data)
+    if name == "recurring":
+        return RecurringPatternsResponse(count=len(data), patterns=data)
+    if name == "time_based":
+        return TimeBasedPatternsResponse(count=len(data), patterns=data)
+    if name == "savings":
+        return SavingsOpportunitiesResponse(count=len(data), opportunities=data)
+    return data
+
+
+def _elapsed_ms(started: float) -> float:
+    """started(perf_counter) 이후 경과 시간 (ms, 소수 첫째 자리)"""
+    return round((time.perf_counter() - started) * 1000, 1)
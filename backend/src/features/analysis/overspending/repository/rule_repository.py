@@ -1,17 +1,51 @@
+"""
+과소비 규칙 저장소
+
+규칙 파일(overspending_rules.json)은 파일 상태(장치, inode, mtime, 크기)별로 한 번만 읽어
+컴파일된 RuleSet으로 보관합니다. 조회 시에는 파일 상태만 확인하고 (내용은 읽지 않음),
+다른 워커가 파일을 바꾼 경우에만 다시 읽습니다. 이 프로세스에서 저장한 경우에는
+저장한 내용으로 바로 교체하므로 다시 읽지 않습니다.
+
+조회 응답 ETag에는 규칙 버전과 파일 상태를 함께 사용하므로(get_rules_state),
+버전을 올리지 않고 파일을 직접 수정해도 ETag가 달라집니다.
+"""
+import copy
 import json
+import threading
 from pathlib import Path
 import logging
 
-from src.core.config.paths import SRC_DIR
+from src.core.cache.dataset_cache import FileVersion, get_file_version
+from src.core.config.paths import DATA_DIR, SRC_DIR
+from src.core.utils.file_utils import InterProcessLock, atomic_write_text, get_file_lock
+from src.features.analysis.overspending.util.rule_set import RuleSet
 
 logger = logging.getLogger(__name__)
 
 
 OVERSPENDING_RULES_PATH = SRC_DIR / "features" / "analysis" / "overspending" / "data" / "overspending_rules.json"
+# 락 파일은 소스 트리 대신 런타임 데이터 디렉토리에 생성
+OVERSPENDING_RULES_LOCK_PATH = DATA_DIR / ".overspending_rules.lock"
+
+# 파일 상태 (장치, inode, mtime_ns, 크기) - 파일이 없으면 None
+FileSignature = FileVersion | None
+
+_lock = threading.Lock()
+_cached: tuple[FileSignature, RuleSet] | None = None
 
 # --------------------------------
 # public functions
 # --------------------------------
+def load_rule_set() -> RuleSet:
+    """컴파일된 규칙 집합 조회 (파일 상태가 같으면 보관 중인 규칙 집합, 반환값은 수정하지 않음)
+
+    Raises:
+        ValueError: 규칙 파일 형식이 올바르지 않은 경우
+    """
+    _, rule_set = _load_cached()
+    return rule_set
+
+
 def load_rules_from_file(include_disabled: bool = False) -> list[dict]:
     """규칙 파일에서 JSON 데이터 로드
     
@@ -21,36 +55,100 @@ def load_rules_from_file(include_disabled: bool = False) -> list[dict]:
     Returns:
         규칙 리스트 (enabled 필터링 적용)
     """
-    # 파일이 없으면 빈 리스트 반환
-    if not OVERSPENDING_RULES_PATH.exists():
-        logger.warning(f"규칙 파일이 없습니다: {OVERSPENDING_RULES_PATH}. 빈 규칙 리스트를 반환합니다.")
-        return []
+    rules, _ = load_rules_with_version(include_disabled=include_disabled)
+    return rules
 
-    data = _load_json_file(OVERSPENDING_RULES_PATH)
 
-    rules = data.get("rules")
-    if not isinstance(rules, list):
-        raise ValueError("규칙 파일 형식이 올바르지 않습니다")
+def load_rules_with_version(include_disabled: bool = False) -> tuple[list[dict], int]:
+    """규칙 목록과 규칙 파일 버전을 함께 로드 (같은 시점의 파일 기준)
+
+    Returns:
+        (규칙 리스트, 버전) - 버전이 없는 기존 파일은 0
+        (호출한 쪽에서 수정할 수 있도록 보관 중인 규칙의 복사본 반환)
+    """
+    rule_set = load_rule_set()
 
     # enabled 필터링
-    if not include_disabled:
-        rules = [r for r in rules if r.get("enabled", True)]
+    if include_disabled:
+        rules = rule_set.rules
+    else:
+        rules = [r for r in rule_set.rules if r.get("enabled", True)]
 
-    return rules
+    return copy.deepcopy(rules), rule_set.version
+
+
+def get_rules_state() -> str:
+    """규칙 파일 상태 토큰 (ETag용, 규칙 버전 + 파일 상태)
+
+    저장 API를 거치지 않고 버전은 그대로 둔 채 파일을 수정한 경우에도 달라집니다.
+    """
+    signature, rule_set = _load_cached()
+    return ":".join(str(value) for value in (rule_set.version, *(signature or ())))
 
-def save_rules_to_file(rules: list[dict]) -> bool:
-    """과소비 규칙을 JSON 파일에 저장"""
-    data = {"rules": rules}
-    if not OVERSPENDING_RULES_PATH.exists():
-        OVERSPENDING_RULES_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with open(OVERSPENDING_RULES_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-    return True
+
+def rules_write_lock() -> InterProcessLock:
+    """규칙 파일 읽기-수정-쓰기 구간 락 (여러 워커 간 직렬화, 중첩 가능)"""
+    return get_file_lock(OVERSPENDING_RULES_LOCK_PATH)
+
+
+def save_rules_to_file(rules: list[dict]) -> int:
+    """과소비 규칙을 JSON 파일에 저장 (임시 파일 + os.replace, 버전 1 증가)
+
+    Returns:
+        저장 후 규칙 파일 버전
+    """
+    with rules_write_lock():
+        _, version = load_rules_with_version(include_disabled=True)
+        data = {"version": version + 1, "rules": rules}
+        atomic_write_text(OVERSPENDING_RULES_PATH, json.dumps(data, ensure_ascii=False, indent=2))
+
+        # 저장한 내용으로 보관 중인 규칙 집합 교체 (다시 읽지 않음, 호출한 쪽의 이후 수정과 분리)
+        _install(_get_file_signature(), _compile(copy.deepcopy(data)))
+    return version + 1
 
 
 # --------------------------------
 # private functions
 # --------------------------------
+def _compile(data: dict) -> RuleSet:
+    """규칙 파일 내용 검증 및 컴파일"""
+    rules = data.get("rules")
+    if not isinstance(rules, list):
+        raise ValueError("규칙 파일 형식이 올바르지 않습니다")
+    return RuleSet(rules, int(data.get("version", 0)))
+
+
+def _load_cached() -> tuple[FileSignature, RuleSet]:
+    """보관 중인 (파일 상태, 규칙 집합) 조회 (파일 상태가 바뀌었으면 다시 읽어 교체)"""
+    signature = _get_file_signature()
+    cached = _cached
+    if cached is not None and cached[0] == signature:
+        return cached
+
+    if signature is None:
+        logger.warning(f"규칙 파일이 없습니다: {OVERSPENDING_RULES_PATH}. 빈 규칙 리스트를 반환합니다.")
+        rule_set = RuleSet([], 0)
+    else:
+        data = _load_json_file(OVERSPENDING_RULES_PATH)
+        rule_set = _compile(data)
+        logger.info(f"과소비 규칙 파일 로드: {len(rule_set.rules)}개 (버전 {rule_set.version})")
+
+    _install(signature, rule_set)
+    return signature, rule_set
+
+
+def _install(signature: FileSignature, rule_set: RuleSet) -> None:
+    """보관 중인 규칙 집합 교체"""
+    global _cached
+    with _lock:
+        _cached = (signature, rule_set)
+
+
+def _get_file_signature() -> FileSignature:
+    """규칙 파일 상태 (내용은 읽지 않음, 파일이 없으면 None)"""
+    return get_file_version(OVERSPENDING_RULES_PATH)
+
+
 def _load_json_file(path: Path) -> dict:
     try:
         with open(path, "r", encoding="utf-8") as f:
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
+
+from src.core.cache.conditional_get import conditional_get
 
 from src.features.analysis.overspending.model.overspending_response import (
     OverspendingPatternsResponse,
@@ -8,12 +10,22 @@ from src.features.analysis.overspending.model.overspending_response import (
 
 from src.features.analysis.overspending.service.overspending_service import analyze_overspending
 from src.features.analysis.overspending.service.recurring_service import analyze_recurring
+from src.features.analysis.overspending.service.rule_service import get_overspending_rules_state
 from src.features.analysis.overspending.service.time_analysis_service import analyze_time_based_spending
+from src.features.transaction.service.transaction_service import fetch_transactions_version
 
 
 analysis_router = APIRouter(prefix="/analysis", tags=["과소비"])
 
-@analysis_router.get("/overspending", response_model=OverspendingPatternsResponse)
+# 조회 응답 ETag (데이터셋 버전 / 규칙 파일 상태가 같으면 304)
+_dataset_etag = conditional_get(fetch_transactions_version)
+_dataset_rules_etag = conditional_get(fetch_transactions_version, get_overspending_rules_state)
+
+@analysis_router.get(
+    "/overspending",
+    response_model=OverspendingPatternsResponse,
+    dependencies=[Depends(_dataset_rules_etag)],
+)
 def get_overspending_patterns(
     year: int | None = Query(None, description="조회할 연도"),
     month: int | None = Query(None, ge=1, le=12, description="조회할 월"),
@@ -24,7 +36,7 @@ def get_overspending_patterns(
     patterns = analyze_overspending(year=year, month=month, start_date=start_date, end_date=end_date)
     return OverspendingPatternsResponse(count=len(patterns), patterns=patterns)
 
-@analysis_router.get("/recurring", response_model=RecurringPatternsResponse)
+@analysis_router.get("/recurring", response_model=RecurringPatternsResponse, dependencies=[Depends(_dataset_etag)])
 def get_recurring_patterns(
     year: int | None = Query(None, description="조회할 연도"),
     month: int | None = Query(None, ge=1, le=12, description="조회할 월"),
@@ -35,7 +47,7 @@ def get_recurring_patterns(
     return RecurringPatternsResponse(count=len(patterns), patterns=patterns)
 
 
-@analysis_router.get("/time-based", response_model=TimeBasedPatternsResponse)
+@analysis_router.get("/time-based", response_model=TimeBasedPatternsResponse, dependencies=[Depends(_dataset_etag)])
 def get_time_based_patterns(
     year: int | None = Query(None, description="조회할 연도"),
     month: int | None = Query(None, ge=1, le=12, description="조회할 월"),
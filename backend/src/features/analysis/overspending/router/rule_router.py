@@ -1,11 +1,16 @@
-from fastapi import APIRouter, HTTPException
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from src.core.cache.conditional_get import conditional_get
 
 from src.features.analysis.overspending.model.overspending_rule_model import (
     OverspendingRule,
     RulesUpdate,
 )
 from src.features.analysis.overspending.service.rule_service import (
-    get_overspending_rules,
+    get_overspending_rules_state,
+    get_overspending_rules_with_version,
     save_overspending_rules,
     add_overspending_rule,
     update_overspending_rule,
@@ -15,56 +20,65 @@ from src.features.analysis.overspending.service.rule_service import (
 
 rule_router = APIRouter(prefix="/rule", tags=["과소비 규칙"])
 
+# 낙관적 동시성 제어: 마지막으로 조회한 규칙 버전 (다르면 409, 생략하면 확인 안 함)
+_EXPECTED_VERSION_QUERY = Query(None, description="마지막으로 조회한 규칙 버전 (다르면 409)")
+
+# 조회 응답 ETag (규칙 파일 상태가 같으면 304)
+_rules_etag = conditional_get(get_overspending_rules_state)
 
-@rule_router.get("/")
+
+@rule_router.get("/", dependencies=[Depends(_rules_etag)])
 def read_overspending_rules():
     """과소비 규칙 조회"""
-    rules = get_overspending_rules()
-    return {"rules": rules}
+    rules, version = get_overspending_rules_with_version()
+    return {"rules": rules, "version": version}
 
 
 @rule_router.post("/")
-def create_overspending_rule(rule: OverspendingRule):
+def create_overspending_rule(rule: OverspendingRule, expected_version: Optional[int] = _EXPECTED_VERSION_QUERY):
     """과소비 규칙 추가"""
     rule_dict = rule.model_dump(exclude_none=True)
-    new_rule = add_overspending_rule(rule_dict)
+    new_rule, version = add_overspending_rule(rule_dict, expected_version)
     
-    return {"message": "규칙이 추가되었습니다", "rule": new_rule}
+    return {"message": "규칙이 추가되었습니다", "rule": new_rule, "version": version}
 
 
 @rule_router.put("/{rule_id}")
-def update_single_overspending_rule(rule_id: int, rule: OverspendingRule):
+def update_single_overspending_rule(
+    rule_id: int,
+    rule: OverspendingRule,
+    expected_version: Optional[int] = _EXPECTED_VERSION_QUERY,
+):
     """과소비 규칙 단일 수정"""
     rule_dict = rule.model_dump(exclude_none=True)
     rule_dict['id'] = rule_id
     
-    updated_rule = update_overspending_rule(rule_id, rule_dict)
+    updated_rule, version = update_overspending_rule(rule_id, rule_dict, expected_version)
     
     if not updated_rule:
         raise HTTPException(status_code=404, detail=f"규칙 ID {rule_id}를 찾을 수 없습니다")
     
-    return {"message": "규칙이 수정되었습니다", "rule": updated_rule}
+    return {"message": "규칙이 수정되었습니다", "rule": updated_rule, "version": version}
 
 
 @rule_router.put("/")
-def update_overspending_rules(rules_update: RulesUpdate):
+def update_overspending_rules(rules_update: RulesUpdate, expected_version: Optional[int] = _EXPECTED_VERSION_QUERY):
     """과소비 규칙 전체 수정"""
     rules_dict = [rule.model_dump(exclude_none=True) for rule in rules_update.rules]
-    success = save_overspending_rules(rules_dict)
+    version = save_overspending_rules(rules_dict, expected_version)
     
-    if not success:
+    if version is None:
         raise HTTPException(status_code=500, detail="규칙 저장 실패")
     
-    return {"message": "규칙이 성공적으로 저장되었습니다", "count": len(rules_dict)}
+    return {"message": "규칙이 성공적으로 저장되었습니다", "count": len(rules_dict), "version": version}
 
 
 @rule_router.delete("/{rule_id}")
-def delete_overspending_rule_endpoint(rule_id: int):
+def delete_overspending_rule_endpoint(rule_id: int, expected_version: Optional[int] = _EXPECTED_VERSION_QUERY):
     """과소비 규칙 삭제"""
-    success = delete_overspending_rule(rule_id)
+    success, version = delete_overspending_rule(rule_id, expected_version)
     
     if not success:
         raise HTTPException(status_code=404, detail=f"규칙 ID {rule_id}를 찾을 수 없습니다")
     
-    return {"message": f"규칙 ID {rule_id}가 삭제되었습니다"}
-
+    return {"message": f"규칙 ID {rule_id}가 삭제되었습니다", "version": version}
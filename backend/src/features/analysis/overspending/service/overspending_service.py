@@ -2,20 +2,22 @@ import pandas as pd
 import logging
 
 from src.features.analysis.overspending.model.overspending_response import OverspendingPattern
-from src.features.analysis.overspending.util.data_preparation import prepare_expense_data
-from src.features.analysis.overspending.util.data_enrichment import enrich_with_analysis_data
-from src.features.analysis.overspending.util.rule_filter import filter_by_rule
+from src.features.analysis.common.analysis_frame import load_analysis_frame
+from src.features.analysis.overspending.util.rule_plan import RuleStats
 from src.features.analysis.overspending.util.overspending_checkers import (
     check_weekly_count,
     check_monthly_count,
     check_monthly_total,
     check_per_transaction,
 )
-from src.features.analysis.overspending.repository.rule_repository import load_rules_from_file
+from src.features.analysis.overspending.repository.rule_repository import load_rule_set
 
 
 logger = logging.getLogger(__name__)
 
+# 이 분석에서 사용하는 컬럼 (load_analysis_frame에서 이 컬럼만 디코딩)
+REQUIRED_COLUMNS = ["거래일시", "타입", "대분류", "금액"]
+
 
 # --------------------------------
 # public functions
@@ -27,13 +29,13 @@ def analyze_overspending(
     end_date: str | None = None,
 ) -> list[OverspendingPattern]:
     """과소비 패턴 분석"""
-    # 공통 데이터 준비
-    df = prepare_expense_data(year, month, start_date, end_date)
-    if df.empty:
+    # 공통 분석 데이터 (조회 기간의 지출, 데이터셋 버전별 캐시)
+    frame = load_analysis_frame(year, month, start_date, end_date, columns=REQUIRED_COLUMNS)
+    if frame.empty:
         return []
 
-    # 시간, 주, 월 데이터 추가
-    df = enrich_with_analysis_data(df)
+    # 시간, 주, 월 데이터 추가 (분석 프레임에서 한 번만 계산)
+    df = frame.with_columns("hour", "week", "month")
     
     # 과소비 패턴 분석
     results = _analyze_overspending_patterns(df)
@@ -46,28 +48,26 @@ def analyze_overspending(
 # private functions
 # --------------------------------
 def _analyze_overspending_patterns(df: pd.DataFrame) -> list[OverspendingPattern]:
-    """과소비 패턴 분석"""
-    # 과소비 규칙 조회
-    rules = load_rules_from_file(include_disabled=False)
+    """과소비 패턴 분석 (활성 규칙 전체를 한 번에 집계)"""
+    # 과소비 규칙 조회 (규칙 파일 버전별로 컴파일된 규칙 집합)
+    rule_set = load_rule_set()
+    # 규칙별 해당 거래 집계 ((규칙, 주, 월)별 한 번의 집계)
+    stats = rule_set.plan.evaluate(df)
     # 과소비 패턴 리스트
     results = []
-    for rule in rules:
-        pattern = _check_overspending(df, rule)
+    for rule, rule_stats in zip(rule_set.enabled_rules, stats):
+        pattern = _check_overspending(rule_stats, rule)
         if pattern:
             results.append(pattern)
     
     return results
 
 
-def _check_overspending(df: pd.DataFrame, rule: dict) -> OverspendingPattern | None:
-    """범용 과소비 체크 함수"""
-    # 데이터 필터링
-    filtered_df = filter_by_rule(df, rule)
-    if filtered_df.empty:
+def _check_overspending(stats: RuleStats | None, rule: dict) -> OverspendingPattern | None:
+    """범용 과소비 체크 함수 (stats: 규칙에 해당하는 거래 집계, 해당 거래가 없으면 None)"""
+    if stats is None:
         return None
 
-    # 총액 계산
-    total_amount = int(filtered_df["금액"].sum())
     # 이유 리스트
     reasons = []
     
@@ -82,7 +82,7 @@ def _check_overspending(df: pd.DataFrame, rule: dict) -> OverspendingPattern | N
     # 각 조건 체크
     for key, checker in checkers.items():
         if key in rule:
-            reason = checker(filtered_df, rule[key], rule.get('name', ''))
+            reason = checker(stats, rule[key], rule.get('name', ''))
             if reason:
                 reasons.append(reason)
 
@@ -92,6 +92,6 @@ def _check_overspending(df: pd.DataFrame, rule: dict) -> OverspendingPattern | N
     # 과소비 패턴 반환
     return OverspendingPattern(
         category=rule["name"],
-        total_amount=total_amount,
+        total_amount=stats.total_amount,
         reasons=reasons
     )
@@ -1,17 +1,28 @@
+import calendar
+
+import numpy as np
 import pandas as pd
 import logging
 
-from src.core.utils.date_utils import parse_date_params
-from src.core.utils.dataframe_utils import (
-    filter_by_date_range,
-    filter_expense_only,
-    validate_datetime_column,
-    enrich_with_time_data,
-)
-from src.features.transaction.repository.transaction_repository import load_transactions
+from src.features.analysis.common.analysis_frame import load_analysis_frame
 
 logger = logging.getLogger(__name__)
 
+# 이 분석에서 사용하는 컬럼 (load_analysis_frame에서 이 컬럼만 디코딩)
+REQUIRED_COLUMNS = ["거래일시", "타입", "내용", "대분류", "결제수단", "금액"]
+
+# 시간대 구간 (hour // 6 → 구간 번호)
+TIME_RANGES = ["00:00-06:00", "06:00-12:00", "12:00-18:00", "18:00-24:00"]
+
+# 요일 번호 → 요일 이름 (월=0 ~ 일=6, Series.dt.day_name과 같은 이름)
+DAY_NAMES = list(calendar.day_name)
+
+# 그룹화 기준: 상호명 + 시간대 + 카테고리 + 결제수단
+GROUPING_COLUMNS = ["내용", "time_bucket", "대분류", "결제수단"]
+
+# 값이 비어 있으면 패턴에서 제외하는 그룹 키 (시간대는 항상 있음)
+NULLABLE_KEY_COLUMNS = ["내용", "대분류", "결제수단"]
+
 
 # --------------------------------
 # public functions
@@ -22,27 +33,13 @@ def analyze_recurring(
     min_count: int = 3
 ) -> list[dict]:
     """반복 소비 패턴 분석"""
-    # 데이터 로드
-    df = load_transactions()
-    if df.empty:
+    # 공통 분석 데이터 (조회 기간의 지출, 데이터셋 버전별 캐시)
+    frame = load_analysis_frame(year, month, columns=REQUIRED_COLUMNS)
+    if frame.empty:
         return []
-    
-    # 데이터 준비 (공통 유틸 사용)
-    start_date, end_date = parse_date_params(year, month)
-    # 날짜 필터링
-    df = filter_by_date_range(df, start_date, end_date)
-    if df.empty:
-        return []
-    
-    # 지출 데이터만 필터링
-    df = filter_expense_only(df)
-    if df.empty:
-        return []
-      
-    # 거래일시 데이터 타입 검증
-    validate_datetime_column(df)
-    # 시간, 요일 데이터 추가
-    df = enrich_with_time_data(df)
+
+    # 시간, 요일 데이터 추가 (분석 프레임에서 한 번만 계산)
+    df = frame.with_columns("hour", "weekday")
     
     # 반복 패턴 탐지
     patterns = _detect_recurring_patterns(df, min_count)
@@ -62,37 +59,51 @@ def _detect_recurring_patterns(df: pd.DataFrame, min_count: int) -> list[dict]:
     2. 동일 시간대 (시간대 그룹화: 0-6, 6-12, 12-18, 18-24)
     3. 동일 요일 (선택적)
     
+    그룹별 건수/총액/첫·마지막 거래일시/요일 수는 한 번의 groupby 집계로 계산하고,
+    최소 반복 횟수를 넘은 그룹만 패턴 딕셔너리로 만듭니다.
+    
     Args:
-        df: 분석할 DataFrame
+        df: 분석할 DataFrame (hour, weekday 컬럼 포함)
         min_count: 최소 반복 횟수
     
     Returns:
         반복 소비 패턴 리스트
     """
-    patterns = []
-    
-    # 시간대 그룹화
-    df["time_range"] = df["hour"].apply(_get_time_range)
-    
-    # 그룹화 기준: 상호명 + 시간대 + 카테고리 + 결제수단
-    grouping_cols = ["내용", "time_range", "대분류", "결제수단"]
-    grouped = df.groupby(grouping_cols)
-    
-    # 그룹화된 데이터 순회
-    for (merchant, time_range, category, payment_method), group in grouped:
-        # 그룹화된 데이터 건수
-        count = len(group)
-        
-        # 건수가 최소 반복 횟수 미만이면 건너뜀
-        if count < min_count:
-            continue
-        
-        # 반복 패턴 딕셔너리 생성
-        pattern = _create_pattern_dict(
-            group, merchant, time_range, category, payment_method, count
-        )
-        # 반복 패턴 리스트에 추가
-        patterns.append(pattern)
+    work = pd.DataFrame({
+        "내용": df["내용"],
+        "time_bucket": _get_time_buckets(df["hour"]),
+        "대분류": df["대분류"],
+        "결제수단": df["결제수단"],
+        "금액": df["금액"],
+        "거래일시": df["거래일시"],
+        "weekday": df["weekday"],
+    })
+    # 그룹 키가 비어 있는 행 제외 (groupby의 dropna와 같은 기준, ngroup이 NaN이 되지 않도록 먼저 제거)
+    work = work.dropna(subset=NULLABLE_KEY_COLUMNS)
+    if work.empty:
+        return []
+    grouped = work.groupby(GROUPING_COLUMNS)
+
+    # 그룹별 집계 (그룹 키 순서)
+    stats = grouped.agg(
+        row_count=("금액", "size"),
+        total_amount=("금액", "sum"),
+        first_datetime=("거래일시", "min"),
+        last_datetime=("거래일시", "max"),
+        weekdays=("weekday", "nunique"),
+        weekday=("weekday", "first"),
+    )
+
+    # 최소 반복 횟수 이상인 그룹만 패턴 생성
+    selected = np.flatnonzero(stats["row_count"].to_numpy() >= min_count)
+    if len(selected) == 0:
+        return []
+    amounts = _collect_amounts(grouped.ngroup().to_numpy(), work["금액"].to_numpy(), selected)
+
+    patterns = [
+        _create_pattern_dict(row, group_amounts)
+        for row, group_amounts in zip(stats.iloc[selected].itertuples(), amounts)
+    ]
     
     # 총액 기준 내림차순 정렬 (내림차순 정렬)
     patterns.sort(key=lambda x: x["total_amount"], reverse=True)
@@ -100,72 +111,59 @@ def _detect_recurring_patterns(df: pd.DataFrame, min_count: int) -> list[dict]:
     return patterns
 
 
-def _get_time_range(hour: int) -> str:
-    """시간을 시간대 범위 문자열로 변환
+def _get_time_buckets(hours: pd.Series) -> np.ndarray:
+    """시간을 시간대 구간 번호로 변환 (0: 00-06시, 1: 06-12시, 2: 12-18시, 3: 18-24시)
     
-    Args:
-        hour: 시간 (0-23)
-    
-    Returns:
-        시간대 범위 문자열 (예: "00:00-06:00")
+    시간이 없는 행은 마지막 구간으로 분류합니다.
     """
-    if 0 <= hour < 6:
-        return "00:00-06:00"
-    elif 6 <= hour < 12:
-        return "06:00-12:00"
-    elif 12 <= hour < 18:
-        return "12:00-18:00"
-    else:
-        return "18:00-24:00"
-
-
-def _create_pattern_dict(
-    group: pd.DataFrame,
-    merchant: str,
-    time_range: str,
-    category: str,
-    payment_method: str,
-    count: int
-) -> dict:
+    values = hours.to_numpy(dtype=float, na_value=np.nan)
+    buckets = np.where(np.isnan(values), len(TIME_RANGES) - 1, np.nan_to_num(values) // 6)
+    return np.clip(buckets, 0, len(TIME_RANGES) - 1).astype(np.int8)
+
+
+def _collect_amounts(group_numbers: np.ndarray, amounts: np.ndarray, selected: np.ndarray) -> list[list]:
+    """선택한 그룹별 금액 목록 (그룹 안에서는 원래 행 순서)"""
+    in_selected = np.isin(group_numbers, selected)
+    rows = np.flatnonzero(in_selected)
+    order = np.argsort(group_numbers[rows], kind="stable")
+    sorted_amounts = amounts[rows[order]].tolist()
+
+    counts = np.bincount(group_numbers[rows], minlength=int(selected[-1]) + 1)[selected]
+    bounds = np.cumsum(counts).tolist()
+    return [sorted_amounts[start:end] for start, end in zip([0, *bounds[:-1]], bounds)]
+
+
+def _create_pattern_dict(row, amounts: list) -> dict:
     """반복 패턴 딕셔너리 생성
     
     Args:
-        group: 그룹화된 DataFrame
-        merchant: 상호명
-        time_range: 시간대 범위
-        category: 카테고리
-        payment_method: 결제수단
-        count: 반복 횟수
+        row: 그룹 집계 행 (Index: 그룹 키, row_count, total_amount, first/last_datetime, weekdays, weekday)
+        amounts: 그룹의 거래 금액 목록
     
     Returns:
         패턴 딕셔너리
     """
-    amounts = group["금액"].tolist()
-    dates = group["거래일시"].dt.date.tolist()
-    
-    # 날짜 정렬
-    sorted_dates = sorted(dates)
-    first_date = sorted_dates[0]
-    last_date = sorted_dates[-1]
+    merchant, time_bucket, category, payment_method = row.Index
+    time_range = TIME_RANGES[time_bucket]
+    count = int(row.row_count)
+    first_date = row.first_datetime.date()
+    last_date = row.last_datetime.date()
     
     # 요일 확인 (모두 같은 요일인지)
-    day_of_week = None
-    days = group["day_of_week"].unique()
-    if len(days) == 1:
-        day_of_week = days[0]
+    day_of_week = DAY_NAMES[int(row.weekday)] if row.weekdays == 1 else None
     
     # 패턴 키 생성
     pattern_key = f"{merchant}_{time_range}_{category}_{payment_method}"
     
     # 평균 금액 계산
-    average_amount = int(sum(amounts) / len(amounts))
-    total_amount = int(sum(amounts))
+    total_amount = int(row.total_amount)
+    average_amount = int(total_amount / count)
     
     # 주기 계산 (일 단위)
     period_days = 0
     if count > 1:
         days_diff = (last_date - first_date).days
-        period_days = days_diff // (count - 1) if count > 1 else 0
+        period_days = days_diff // (count - 1)
     
     return {
         "key": pattern_key,
@@ -181,4 +179,4 @@ def _create_pattern_dict(
         "last_date": last_date.isoformat(),
         "period_days": period_days,
         "amounts": amounts,
-    }
\ No newline at end of file
+    }
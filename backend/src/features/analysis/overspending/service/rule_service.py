@@ -1,9 +1,19 @@
 import logging
 
-from src.features.analysis.overspending.repository.rule_repository import load_rules_from_file, save_rules_to_file
+from src.core.exceptions.errors import check_version
+from src.features.analysis.overspending.repository.rule_repository import (
+    get_rules_state,
+    load_rules_from_file,
+    load_rules_with_version,
+    rules_write_lock,
+    save_rules_to_file,
+)
 
 logger = logging.getLogger(__name__)
 
+# 버전 충돌 메시지에 쓰는 리소스 이름
+_RESOURCE_NAME = "과소비 규칙"
+
 
 # --------------------------------
 # public functions
@@ -24,82 +34,124 @@ def get_overspending_rules(
     return rules
 
 
-def save_overspending_rules(rules: list[dict]) -> bool:
-    """과소비 규칙들을 JSON 파일에 저장"""
-    try:
-        # 과소비 규칙 저장
-        save_rules_to_file(rules)
-        logger.info(f"과소비 규칙 {len(rules)}개 저장 완료")
-        return True
-    except Exception as e:
-        logger.error(f"과소비 규칙 저장 실패: {e}")
-        return False
-
-def add_overspending_rule(rule: dict) -> dict:
-    """과소비 규칙 추가"""
-    rules = load_rules_from_file(include_disabled=True)  # 모든 규칙 로드
-    
-    # ID 자동 생성
-    max_id = max([r.get('id', 0) for r in rules], default=0)
-    rule['id'] = max_id + 1
-    
-    # 규칙 추가
-    rules.append(rule)
-    
-    # 규칙 저장
-    if not save_rules_to_file(rules):
-        raise Exception("규칙 저장 실패")
+def get_overspending_rules_with_version(
+    *,
+    include_disabled: bool = False,
+) -> tuple[list[dict], int]:
+    """과소비 규칙과 규칙 버전 조회 (수정 요청의 expected_version으로 사용)"""
+    rules, version = load_rules_with_version(include_disabled=include_disabled)
+    logger.info(f"과소비 규칙 {len(rules)}개 로드 완료 (버전 {version})")
+    return rules, version
+
+
+def get_overspending_rules_state() -> str:
+    """과소비 규칙 파일 상태 조회 (ETag용, 규칙 버전이 같아도 파일이 바뀌면 달라짐)"""
+    return get_rules_state()
+
+
+def save_overspending_rules(rules: list[dict], expected_version: int | None = None) -> int | None:
+    """과소비 규칙들을 JSON 파일에 저장
+
+    Returns:
+        저장 후 규칙 버전 (저장 실패 시 None)
+
+    Raises:
+        VersionConflictError: expected_version이 현재 버전과 다른 경우
+    """
+    with rules_write_lock():
+        _, current_version = load_rules_with_version(include_disabled=True)
+        check_version(_RESOURCE_NAME, expected_version, current_version)
+        try:
+            # 과소비 규칙 저장
+            version = save_rules_to_file(rules)
+            logger.info(f"과소비 규칙 {len(rules)}개 저장 완료 (버전 {version})")
+            return version
+        except Exception as e:
+            logger.error(f"과소비 규칙 저장 실패: {e}")
+            return None
+
+def add_overspending_rule(rule: dict, expected_version: int | None = None) -> tuple[dict, int]:
+    """과소비 규칙 추가
+
+    Returns:
+        (추가된 규칙, 저장 후 규칙 버전)
+    """
+    with rules_write_lock():
+        rules, current_version = load_rules_with_version(include_disabled=True)  # 모든 규칙 로드
+        check_version(_RESOURCE_NAME, expected_version, current_version)
+        
+        # ID 자동 생성
+        max_id = max([r.get('id', 0) for r in rules], default=0)
+        rule['id'] = max_id + 1
+        
+        # 규칙 추가
+        rules.append(rule)
+        
+        # 규칙 저장
+        version = save_rules_to_file(rules)
     
     logger.info(f"규칙 추가 완료: {rule['name']} (ID: {rule['id']})")
-    return rule
+    return rule, version
 
 
-def update_overspending_rule(rule_id: int, updated_rule: dict) -> dict | None:
-    """과소비 규칙 수정"""
-    # 과소비 규칙 조회
-    rules = load_rules_from_file(include_disabled=True)
-    
-    # ID로 규칙 인덱스 찾기
-    rule_index = _find_rule_index_by_id(rules, rule_id)
-    # ID로 규칙 인덱스가 없으면 규칙 수정 실패 반환
-    if rule_index is None:
-        logger.error(f"규칙 수정 실패: ID {rule_id} 없음")
-        return None
-    
-    # 규칙 ID 업데이트
-    updated_rule['id'] = rule_id
-    rules[rule_index] = updated_rule
-    
-    # 규칙 저장
-    if not save_rules_to_file(rules):
-        logger.error(f"규칙 수정 실패: ID {rule_id} 저장 실패")
-        return None
+def update_overspending_rule(
+    rule_id: int,
+    updated_rule: dict,
+    expected_version: int | None = None,
+) -> tuple[dict | None, int]:
+    """과소비 규칙 수정
+
+    Returns:
+        (수정된 규칙 - 없으면 None, 규칙 버전)
+    """
+    with rules_write_lock():
+        # 과소비 규칙 조회
+        rules, current_version = load_rules_with_version(include_disabled=True)
+        check_version(_RESOURCE_NAME, expected_version, current_version)
+        
+        # ID로 규칙 인덱스 찾기
+        rule_index = _find_rule_index_by_id(rules, rule_id)
+        # ID로 규칙 인덱스가 없으면 규칙 수정 실패 반환
+        if rule_index is None:
+            logger.error(f"규칙 수정 실패: ID {rule_id} 없음")
+            return None, current_version
+        
+        # 규칙 ID 업데이트
+        updated_rule['id'] = rule_id
+        rules[rule_index] = updated_rule
+        
+        # 규칙 저장
+        version = save_rules_to_file(rules)
     
     logger.info(f"규칙 수정 완료: ID {rule_id}")
-    return updated_rule
+    return updated_rule, version
 
 
-def delete_overspending_rule(rule_id: int) -> bool:
-    """과소비 규칙 삭제"""
-    # 과소비 규칙 조회
-    rules = load_rules_from_file(include_disabled=True)
-    # ID로 규칙 인덱스 찾기
-    rule_index = _find_rule_index_by_id(rules, rule_id)
-    # ID로 규칙 인덱스가 없으면 규칙 삭제 실패 반환
-    if rule_index is None:
-        logger.error(f"규칙 삭제 실패: ID {rule_id} 없음")
-        return False
-    
-    # 규칙 삭제
-    deleted_rule = rules.pop(rule_index)
-    
-    # 규칙 저장
-    if not save_rules_to_file(rules):
-        logger.error(f"규칙 삭제 실패: ID {rule_id} 저장 실패")
-        return False
+def delete_overspending_rule(rule_id: int, expected_version: int | None = None) -> tuple[bool, int]:
+    """과소비 규칙 삭제
+
+    Returns:
+        (삭제 여부, 규칙 버전)
+    """
+    with rules_write_lock():
+        # 과소비 규칙 조회
+        rules, current_version = load_rules_with_version(include_disabled=True)
+        check_version(_RESOURCE_NAME, expected_version, current_version)
+        # ID로 규칙 인덱스 찾기
+        rule_index = _find_rule_index_by_id(rules, rule_id)
+        # ID로 규칙 인덱스가 없으면 규칙 삭제 실패 반환
+        if rule_index is None:
+            logger.error(f"규칙 삭제 실패: ID {rule_id} 없음")
+            return False, current_version
+        
+        # 규칙 삭제
+        deleted_rule = rules.pop(rule_index)
+        
+        # 규칙 저장
+        version = save_rules_to_file(rules)
     
     logger.info(f"규칙 삭제 완료: {deleted_rule.get('name')} (ID: {rule_id})")
-    return True
+    return True, version
 
 
 # --------------------------------
@@ -1,16 +1,13 @@
 import pandas as pd
 
 import logging
-from src.core.utils.date_utils import parse_date_params
-from src.core.utils.dataframe_utils import (
-    filter_by_date_range,
-    filter_expense_only,
-    validate_datetime_column,
-)
-from src.features.transaction.repository.transaction_repository import load_transactions
+from src.features.analysis.common.analysis_frame import load_analysis_frame
 
 logger = logging.getLogger(__name__)
 
+# 이 분석에서 사용하는 컬럼 (load_analysis_frame에서 이 컬럼만 디코딩)
+REQUIRED_COLUMNS = ["거래일시", "타입", "금액"]
+
 
 # ----------------------------------------------------------------
 # public functions
@@ -20,28 +17,13 @@ def analyze_time_based_spending(
     month: int | None = None,
 ) -> list[dict]:
     """시간대 소비 분석 (충동 지점 탐지)"""
-    # 데이터 로드
-    df = load_transactions()
-    if df.empty:
-        return []
-    
-    # 데이터 준비
-    # 날짜 파라미터 파싱
-    start_date, end_date = parse_date_params(year, month)
-    # 날짜 필터링
-    df = filter_by_date_range(df, start_date, end_date)
-    if df.empty:
+    # 공통 분석 데이터 (조회 기간의 지출, 데이터셋 버전별 캐시)
+    frame = load_analysis_frame(year, month, columns=REQUIRED_COLUMNS)
+    if frame.empty:
         return []
-    
-    # 지출 데이터만 필터링
-    df = filter_expense_only(df)
-    if df.empty:
-        return []
-    
-    # 거래일시 데이터 타입 검증
-    validate_datetime_column(df)
-    # 시간, 요일, 일자, 주말 여부 데이터 추가
-    df = _enrich_with_extended_time_data(df)
+
+    # 시간, 일자, 주말 여부 데이터 추가 (분석 프레임에서 한 번만 계산)
+    df = frame.with_columns("hour", "day", "is_weekend")
     
     # 시간대별 소비 패턴 분석
     patterns = []
@@ -64,18 +46,6 @@ def analyze_time_based_spending(
     return patterns
 
 
-# ----------------------------------------------------------------
-# private functions - Data Enrichment
-# ----------------------------------------------------------------
-def _enrich_with_extended_time_data(df: pd.DataFrame) -> pd.DataFrame:
-    """시간, 요일, 일자, 주말 여부 데이터 추가 (time_analysis 전용)"""
-    df["hour"] = df["거래일시"].dt.hour
-    df["day_of_week"] = df["거래일시"].dt.dayofweek
-    df["day"] = df["거래일시"].dt.day
-    df["is_weekend"] = df["day_of_week"].isin([5, 6])
-    return df
-
-
 # ----------------------------------------------------------------
 # private functions - Pattern Analysis
 # ----------------------------------------------------------------
@@ -0,0 +1,164 @@
+"""
+과소비 규칙 평가 계획
+
+활성 규칙 전체를 한 번에 평가하기 위한 구조입니다.
+규칙마다 전체 지출을 다시 필터링/집계하지 않고, 규칙에 해당하는 (거래, 규칙) 쌍을 한 번에 만든 뒤
+(규칙, 주, 월)별로 한 번만 집계하여 모든 조건 체크에 사용합니다.
+
+    카테고리 → 규칙     대분류 코드별 규칙 번호 목록 (같은 카테고리의 규칙이 여러 개일 수 있음)
+    규칙 × 시각 마스크  hour_masks[규칙, 시] (마지막 열은 거래일시가 없는 행, 시간대 필터가 없는 규칙만 True)
+    임계값             조건별 규칙 임계값 배열 (조건이 없는 규칙은 NaN)
+
+    plan = RulePlan(rules)
+    stats = plan.evaluate(df)   ← 규칙 순서대로 RuleStats (해당 거래가 없으면 None)
+"""
+import numpy as np
+import pandas as pd
+
+# 조건 체크에 사용하는 규칙 키
+THRESHOLD_KEYS = ["weekly_count", "monthly_count", "monthly_total", "per_transaction"]
+
+# hour_masks에서 거래일시가 없는 행(NaT)의 열 번호
+_MISSING_HOUR = 24
+
+
+class RuleStats:
+    """규칙 하나에 해당하는 거래의 집계 결과"""
+
+    def __init__(
+        self,
+        row_count: int,
+        total_amount: int,
+        high_amount_count: int,
+        weekly_count: int,
+        high_weeks: int,
+        monthly_count: int,
+        high_count_months: int,
+        high_total_months: int,
+    ):
+        self.row_count = row_count                    # 해당 거래 수
+        self.total_amount = total_amount              # 해당 거래 총액
+        self.high_amount_count = high_amount_count    # 건당 금액 임계값 이상 거래 수
+        self.weekly_count = weekly_count              # 주가 있는 거래 수 (주별 거래 수 합)
+        self.high_weeks = high_weeks                  # 주 거래 수 임계값 이상인 주 수
+        self.monthly_count = monthly_count            # 월이 있는 거래 수 (월별 거래 수 합)
+        self.high_count_months = high_count_months    # 월 거래 수 임계값 이상인 월 수
+        self.high_total_months = high_total_months    # 월 총액 임계값 이상인 월 수
+
+
+class RulePlan:
+    """활성 규칙 목록의 평가 계획 (카테고리 → 규칙 목록, 규칙 × 시각 마스크, 조건별 임계값)"""
+
+    def __init__(self, rules: list[dict]):
+        self.rules = rules
+
+        # 카테고리 → 규칙 번호 (카테고리 코드 순으로 정렬한 규칙 번호와 카테고리별 시작 위치/개수)
+        categories = pd.unique(pd.Series([rule["category_filter"] for rule in rules], dtype=object).dropna())
+        self.categories = pd.Index(categories, dtype=object)
+        rule_categories = self.categories.get_indexer([rule["category_filter"] for rule in rules])
+        order = np.argsort(rule_categories, kind="stable")
+        self._rule_order = order[rule_categories[order] >= 0]
+        self._rule_counts = np.bincount(rule_categories[rule_categories >= 0], minlength=len(self.categories))
+        self._rule_offsets = np.cumsum(self._rule_counts) - self._rule_counts
+
+        # 규칙 × 시각(0~23, 거래일시 없음) 마스크
+        hours = np.arange(24)
+        self.hour_masks = np.ones((len(rules), _MISSING_HOUR + 1), dtype=bool)
+        for index, rule in enumerate(rules):
+            if "time_filter" in rule:
+                start_hour, end_hour = rule["time_filter"]
+                if start_hour > end_hour:
+                    self.hour_masks[index, :24] = (hours >= start_hour) | (hours < end_hour)
+                else:
+                    self.hour_masks[index, :24] = (hours >= start_hour) & (hours < end_hour)
+                self.hour_masks[index, _MISSING_HOUR] = False
+
+        # 조건별 임계값 (조건이 없는 규칙은 NaN → 비교 결과가 항상 False)
+        self.thresholds = {
+            key: np.array([rule.get(key, np.nan) for rule in rules], dtype=float)
+            for key in THRESHOLD_KEYS
+        }
+
+    def evaluate(self, df: pd.DataFrame) -> list[RuleStats | None]:
+        """규칙별 집계 (df: hour, week, month 컬럼이 있는 지출, 해당 거래가 없는 규칙은 None)"""
+        results: list[RuleStats | None] = [None] * len(self.rules)
+        if df.empty or not self.rules:
+            return results
+
+        grouped = self._aggregate(df)
+        if grouped.empty:
+            return results
+
+        # 규칙별 합계 (모든 행) / 주별, 월별 합계 (주/월이 없는 행 제외)
+        n_rules = len(self.rules)
+        per_rule = (
+            grouped.groupby("rule")[["rows", "amount", "high_amount"]].sum()
+            .reindex(range(n_rules), fill_value=0)
+        )
+        weekly = grouped.groupby(["rule", "week"])["rows"].sum()
+        monthly = grouped.groupby(["rule", "month"])[["rows", "amount"]].sum()
+
+        weekly_rules = weekly.index.get_level_values("rule")
+        monthly_rules = monthly.index.get_level_values("rule")
+        weekly_count = _sum_by_rule(weekly.to_numpy(), weekly_rules, n_rules)
+        high_weeks = _sum_by_rule(
+            weekly.to_numpy() >= self.thresholds["weekly_count"][weekly_rules], weekly_rules, n_rules
+        )
+        monthly_count = _sum_by_rule(monthly["rows"].to_numpy(), monthly_rules, n_rules)
+        high_count_months = _sum_by_rule(
+            monthly["rows"].to_numpy() >= self.thresholds["monthly_count"][monthly_rules], monthly_rules, n_rules
+        )
+        high_total_months = _sum_by_rule(
+            monthly["amount"].to_numpy() >= self.thresholds["monthly_total"][monthly_rules], monthly_rules, n_rules
+        )
+
+        for index, row in enumerate(per_rule.itertuples(index=False)):
+            if row.rows == 0:
+                continue
+            results[index] = RuleStats(
+                row_count=int(row.rows),
+                total_amount=int(row.amount),
+                high_amount_count=int(row.high_amount),
+                weekly_count=int(weekly_count[index]),
+                high_weeks=int(high_weeks[index]),
+                monthly_count=int(monthly_count[index]),
+                high_count_months=int(high_count_months[index]),
+                high_total_months=int(high_total_months[index]),
+            )
+        return results
+
+    def _aggregate(self, df: pd.DataFrame) -> pd.DataFrame:
+        """(거래, 규칙) 쌍을 만들어 (규칙, 주, 월)별 거래 수, 총액, 건당 고액 거래 수 집계"""
+        # 규칙 카테고리에 해당하는 행과 각 행의 규칙 번호
+        codes = self.categories.get_indexer(df["대분류"])
+        rows = np.flatnonzero(codes >= 0)
+        row_codes = codes[rows]
+        repeats = self._rule_counts[row_codes]
+        pair_rows = np.repeat(rows, repeats)
+        pair_starts = np.repeat(self._rule_offsets[row_codes], repeats)
+        within = np.arange(len(pair_rows)) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+        pair_rules = self._rule_order[pair_starts + within]
+
+        # 규칙 시간대 필터
+        hours = df["hour"].to_numpy(dtype=float, na_value=np.nan)[pair_rows]
+        hour_columns = np.where(np.isnan(hours), _MISSING_HOUR, np.nan_to_num(hours)).astype(np.intp)
+        keep = self.hour_masks[pair_rules, hour_columns]
+        pair_rows, pair_rules = pair_rows[keep], pair_rules[keep]
+
+        pairs = df[["week", "month", "금액"]].take(pair_rows).reset_index(drop=True)
+        pairs["rule"] = pair_rules
+        pairs["high_amount"] = pairs["금액"].to_numpy() >= self.thresholds["per_transaction"][pair_rules]
+
+        return (
+            pairs.groupby(["rule", "week", "month"], dropna=False, sort=False)
+            .agg(rows=("금액", "size"), amount=("금액", "sum"), high_amount=("high_amount", "sum"))
+            .reset_index()
+        )
+
+
+# --------------------------------
+# private functions
+# --------------------------------
+def _sum_by_rule(values: np.ndarray, rules: pd.Index, n_rules: int) -> np.ndarray:
+    """규칙 번호별 합계 (길이 n_rules)"""
+    return np.bincount(np.asarray(rules, dtype=np.intp), weights=values.astype(float), minlength=n_rules)
@@ -0,0 +1,49 @@
+"""
+컴파일된 과소비 규칙 집합
+
+규칙 파일 내용을 한 번 검증하고, 분석에 필요한 구조(활성 규칙 목록, 평가 계획)를 미리 만들어 둡니다.
+규칙 저장소가 파일 버전별로 하나를 만들어 보관하므로, 분석 요청마다 규칙 파일을 읽거나 다시 검증하지 않습니다.
+
+    rule_set = load_rule_set()
+    rule_set.version        ← 규칙 파일 버전
+    rule_set.rules          ← 전체 규칙 (비활성/형식 오류 포함, 파일 내용 그대로)
+    rule_set.enabled_rules  ← 분석에 사용하는 규칙 (활성 + 형식 검증 통과)
+    rule_set.plan           ← enabled_rules의 평가 계획 (카테고리 → 규칙, 규칙 × 시각 마스크)
+"""
+import logging
+
+from pydantic import ValidationError
+
+from src.features.analysis.overspending.model.overspending_rule_model import OverspendingRule
+from src.features.analysis.overspending.util.rule_plan import RulePlan
+
+logger = logging.getLogger(__name__)
+
+
+class RuleSet:
+    """규칙 파일 한 버전의 컴파일 결과 (생성 후 변경하지 않음)"""
+
+    def __init__(self, rules: list[dict], version: int):
+        self.version = version
+        self.rules = rules
+        self.enabled_rules = [
+            rule for index, rule in enumerate(rules)
+            if _is_valid_rule(index, rule) and rule.get("enabled", True)
+        ]
+        self.plan = RulePlan(self.enabled_rules)
+
+
+# --------------------------------
+# private functions
+# --------------------------------
+def _is_valid_rule(index: int, rule: dict) -> bool:
+    """분석에 사용할 수 있는 규칙인지 검증 (형식 오류는 경고 후 분석에서 제외)"""
+    try:
+        validated = OverspendingRule.model_validate(rule, strict=True)
+    except ValidationError as e:
+        logger.warning(f"과소비 규칙 형식 오류로 분석에서 제외: {index}번째 규칙 ({e.error_count()}개 오류)")
+        return False
+    if validated.time_filter is not None and len(validated.time_filter) != 2:
+        logger.warning(f"과소비 규칙 형식 오류로 분석에서 제외: {index}번째 규칙 (time_filter는 [시작 시, 종료 시])")
+        return False
+    return True
@@ -1,12 +1,17 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
 
+from src.core.cache.conditional_get import conditional_get
 from src.features.analysis.statistic.model.statistic import MonthlyStatsResponse
 from src.features.analysis.statistic.service.statistic_service import get_monthly_stats
+from src.features.transaction.service.transaction_service import fetch_transactions_version
 
 statistic_router = APIRouter(prefix="/analysis/statistic", tags=["통계"])
 
+# 조회 응답 ETag (데이터셋 버전이 같으면 304)
+_dataset_etag = conditional_get(fetch_transactions_version)
 
-@statistic_router.get("/monthly", response_model=MonthlyStatsResponse)
+
+@statistic_router.get("/monthly", response_model=MonthlyStatsResponse, dependencies=[Depends(_dataset_etag)])
 def monthly_stats(
     year: int = Query(..., description="조회할 연도", examples=[2024]),
     month: int = Query(..., ge=1, le=12, description="조회할 월 (1~12)", examples=[12])
@@ -1,31 +1,34 @@
+import numpy as np
 import pandas as pd
 import logging
 
-from src.features.transaction.repository.transaction_repository import load_transactions
+from src.features.transaction.repository.transaction_repository import load_transaction_store
+from src.features.transaction.repository.transaction_store import TransactionStore
 from src.features.analysis.statistic.model.statistic import MonthlyStatsResponse, CategoryBreakdown
 
 logger = logging.getLogger(__name__)
 
 def get_monthly_stats(year: int, month: int) -> MonthlyStatsResponse:
     """월별 통계 조회"""
-    # 거래내역 조회
-    df = load_transactions()
-    if df.empty:
+    # 거래내역 조회 (컬럼 저장소에서 해당 월 구간만 이진 탐색)
+    store = load_transaction_store()
+    if len(store) == 0:
         return _empty_response(year, month)
 
     # 월별 거래내역 조회
-    df['month'] = df['거래일시'].dt.to_period('M')
-    monthly = df[df['month'] == f"{year}-{month:02d}"]
-    if monthly.empty:
+    window = store.month_window(year, month)
+    if window.start == window.stop:
         return _empty_response(year, month)
+    amounts = store.amounts[window]
+    category_codes = store.codes('대분류')[window]
     
     # 수입/지출 분리 (금액이 양수이면 수입, 음수이면 지출)
-    income_df = monthly[monthly['금액'] > 0]
-    expense_df = monthly[monthly['금액'] < 0]
+    is_income = amounts > 0
+    is_expense = amounts < 0
     
     # 각각 집계 (카테고리별 금액 합계)
-    income_stats = income_df.groupby('대분류')['금액'].sum()
-    expense_stats = expense_df.groupby('대분류')['금액'].sum().abs()  # 지출은 절댓값으로 집계
+    income_stats = _sum_by_category(store, category_codes[is_income], amounts[is_income])
+    expense_stats = _sum_by_category(store, category_codes[is_expense], amounts[is_expense]).abs()  # 지출은 절댓값으로 집계
     
     # 수입/지출 총합
     total_income = int(income_stats.sum()) if not income_stats.empty else 0
@@ -37,8 +40,8 @@ def get_monthly_stats(year: int, month: int) -> MonthlyStatsResponse:
         total_income=total_income,
         total_expense=total_expense,
         balance=total_income - total_expense,
-        income_count=len(income_df),
-        expense_count=len(expense_df),
+        income_count=int(is_income.sum()),
+        expense_count=int(is_expense.sum()),
         income_breakdown=_build_breakdown(income_stats, total_income),
         expense_breakdown=_build_breakdown(expense_stats, total_expense),
     )
@@ -56,6 +59,17 @@ def _empty_response(year: int, month: int) -> MonthlyStatsResponse:
         expense_breakdown=[],
     )
 
+def _sum_by_category(store: TransactionStore, codes: np.ndarray, amounts: np.ndarray) -> pd.Series:
+    """카테고리 코드별 금액 합계 (index: 카테고리명 오름차순, 카테고리 없는 거래 제외)"""
+    has_category = codes >= 0
+    codes, amounts = codes[has_category], amounts[has_category].astype(np.int64)
+
+    vocabulary = store.vocabulary('대분류')
+    sums = np.zeros(len(vocabulary), dtype=np.int64)
+    np.add.at(sums, codes, amounts)
+    present = np.bincount(codes, minlength=len(vocabulary)) > 0
+    return pd.Series(sums[present], index=vocabulary[present])
+
 def _build_breakdown(stats: pd.Series, total: int) -> list:
     """카테고리별 breakdown 생성"""
     # 카테고리별 금액 합계가 없거나 총합이 0이면 빈 리스트 반환
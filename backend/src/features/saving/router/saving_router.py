@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query
 
+from src.core.cache.conditional_get import conditional_get
+from src.features.analysis.overspending.service.rule_service import get_overspending_rules_state
 from src.features.saving.service.saving_service import analyze_savings_opportunities
+from src.features.transaction.service.transaction_service import fetch_transactions_version
 from src.features.saving.model.saving import (
     SavingsOpportunitiesResponse,
 )
@@ -8,8 +11,11 @@ from src.features.saving.model.saving import (
 
 saving_router = APIRouter(prefix="/saving", tags=["절약"])
 
+# 조회 응답 ETag (데이터셋 버전 / 규칙 파일 상태가 같으면 304, 과소비 분석 결과를 사용하므로 규칙 포함)
+_dataset_rules_etag = conditional_get(fetch_transactions_version, get_overspending_rules_state)
+
 # 절약 기회 분석 (Top 3)
-@saving_router.get("/opportunities")
+@saving_router.get("/opportunities", dependencies=[Depends(_dataset_rules_etag)])
 def get_savings_opportunities(
     year: int | None = Query(None, description="조회할 연도"),
     month: int | None = Query(None, ge=1, le=12, description="조회할 월"),
@@ -4,9 +4,6 @@ import logging
 from typing import Dict, List
 
 from src.features.analysis.overspending.model.overspending_response import OverspendingPattern
-from src.core.utils.dataframe_utils import filter_by_date_range, filter_expense_only
-from src.features.analysis.overspending.service.recurring_service import analyze_recurring
-from src.features.analysis.overspending.service.overspending_service import analyze_overspending
 
 logger = logging.getLogger(__name__)
 
@@ -15,14 +12,12 @@ logger = logging.getLogger(__name__)
 # 반복 소비 기회
 # ============================================================
 def analyze_recurring_opportunities(
-    year: int | None,
-    month: int | None,
+    patterns: List[dict],
     profile: Dict,
     thresholds: Dict
 ) -> List[dict]:
-    """반복 소비 패턴 기반 절약 기회"""
+    """반복 소비 패턴 기반 절약 기회 (patterns: analyze_recurring 결과)"""
     opportunities = []
-    patterns = analyze_recurring(year=year, month=month, min_count=3)
     
     for pattern in patterns:
         opportunity = create_recurring_opportunity(pattern, profile, thresholds)
@@ -73,14 +68,12 @@ def create_recurring_opportunity(
 # 과소비 기회
 # ============================================================
 def analyze_overspending_opportunities(
-    start_date: str | None,
-    end_date: str | None,
+    patterns: List[OverspendingPattern],
     profile: Dict,
     thresholds: Dict
 ) -> List[dict]:
-    """과소비 패턴 기반 절약 기회"""
+    """과소비 패턴 기반 절약 기회 (patterns: analyze_overspending 결과)"""
     opportunities = []
-    patterns = analyze_overspending(start_date=start_date, end_date=end_date)
     
     for pattern in patterns:
         opportunity = create_overspending_opportunity(pattern, profile, thresholds)
@@ -120,18 +113,13 @@ def create_overspending_opportunity(
 # ============================================================
 def analyze_category_opportunities(
     df: pd.DataFrame,
-    start_date: str | None,
-    end_date: str | None,
     profile: Dict,
     thresholds: Dict
 ) -> List[dict]:
-    """카테고리별 초과 지출 기반 절약 기회"""
-    df = filter_by_date_range(df, start_date, end_date)
+    """카테고리별 초과 지출 기반 절약 기회 (df: 조회 기간의 지출, 금액 절댓값)"""
     if df.empty:
         return []
     
-    df = filter_expense_only(df)
-    
     category_stats = calculate_category_stats(df)
     overall_avg = df["금액"].abs().mean()
     
@@ -1,8 +1,10 @@
 import logging
 
 from src.core.utils.date_utils import parse_date_params
-from src.core.utils.dataframe_utils import filter_by_date_range
-from src.features.transaction.repository.transaction_repository import load_transactions
+from src.features.analysis.common.analysis_frame import load_analysis_frame
+from src.features.analysis.overspending.model.overspending_response import OverspendingPattern
+from src.features.analysis.overspending.service.overspending_service import analyze_overspending
+from src.features.analysis.overspending.service.recurring_service import analyze_recurring
 from src.features.saving.service.savings_profile import analyze_user_profile, calculate_dynamic_thresholds
 from src.features.saving.service.saving_opportunities import (
     analyze_recurring_opportunities,
@@ -12,14 +14,28 @@ from src.features.saving.service.saving_opportunities import (
 
 logger = logging.getLogger(__name__)
 
+# 프로필/카테고리 분석에서 사용하는 컬럼 (load_analysis_frame에서 이 컬럼만 디코딩)
+REQUIRED_COLUMNS = ["거래일시", "타입", "대분류", "금액"]
+
+
+# 절약 기회로 보는 반복 소비 최소 횟수
+RECURRING_MIN_COUNT = 3
+
 
 def analyze_savings_opportunities(
     year: int | None = None,
     month: int | None = None,
+    recurring_patterns: list[dict] | None = None,
+    overspending_patterns: list[OverspendingPattern] | None = None,
 ) -> list[dict]:
-    """절약 기회 분석 (Top 3)"""
-    # 거래내역 조회
-    df = load_transactions()
+    """절약 기회 분석 (Top 3)
+
+    Args:
+        recurring_patterns: 같은 기간의 반복 소비 패턴 (min_count=3, None이면 여기서 분석)
+        overspending_patterns: 같은 기간의 과소비 패턴 (None이면 여기서 분석)
+    """
+    # 거래내역 조회 (전체 기간, 공통 분석 프레임)
+    df = load_analysis_frame(columns=REQUIRED_COLUMNS).transactions
     if df.empty:
         return []
     
@@ -30,26 +46,30 @@ def analyze_savings_opportunities(
     # 날짜 파라미터 파싱
     start_date, end_date = parse_date_params(year, month)
     
-    # 필터링된 데이터
-    df_filtered = filter_by_date_range(df, start_date, end_date)
-    if df_filtered.empty:
+    # 조회 기간 데이터 (같은 기간에 이 컬럼을 모두 가진 분석 프레임이 있으면 재사용)
+    window = load_analysis_frame(start_date=start_date, end_date=end_date, columns=REQUIRED_COLUMNS)
+    if window.transactions.empty:
         return []
     
     opportunities = []
     
     # 1. 반복 소비 패턴 기반 절약 기회
+    if recurring_patterns is None:
+        recurring_patterns = analyze_recurring(year=year, month=month, min_count=RECURRING_MIN_COUNT)
     opportunities.extend(
-        analyze_recurring_opportunities(year, month, profile, thresholds)
+        analyze_recurring_opportunities(recurring_patterns, profile, thresholds)
     )
     
     # 2. 과소비 패턴 기반 절약 기회
+    if overspending_patterns is None:
+        overspending_patterns = analyze_overspending(start_date=start_date, end_date=end_date)
     opportunities.extend(
-        analyze_overspending_opportunities(start_date, end_date, profile, thresholds)
+        analyze_overspending_opportunities(overspending_patterns, profile, thresholds)
     )
     
     # 3. 카테고리별 초과 지출 기반 절약 기회
     opportunities.extend(
-        analyze_category_opportunities(df_filtered, start_date, end_date, profile, thresholds)
+        analyze_category_opportunities(window.expenses, profile, thresholds)
     )
     
     # 절약 가능 금액 기준 내림차순 정렬 후 Top 3
@@ -10,10 +10,12 @@ class TransactionQuery(BaseModel):
     """거래내역 조회 쿼리"""
     limit: int = 50
     offset: int = 0
+    cursor: Optional[str] = None  # 이전 응답의 next_cursor (지정하면 offset 무시)
     category: Optional[str] = None
     start_date: Optional[str] = None
     end_date: Optional[str] = None
     merchant: Optional[str] = None
+    merchant_regex: bool = False  # True면 merchant를 정규식으로 검색 (기본: 문자 그대로 포함 검색)
     payment_method: Optional[str] = None
     time_range: Optional[str] = None
     is_weekend: Optional[bool] = None
@@ -42,6 +44,16 @@ class TransactionUpdate(BaseModel):
         }
 
 
+
+class TransactionBulkUpdateItem(TransactionUpdate):
+    """거래내역 일괄 수정 항목 (수정할 거래 ID + 수정 필드)"""
+    id: int
+
+
+class TransactionBulkUpdate(BaseModel):
+    """거래내역 일괄 수정 요청"""
+    updates: list[TransactionBulkUpdateItem]
+
 # ============================================================
 # API 응답 모델
 # ============================================================
@@ -49,4 +61,36 @@ class TransactionListResponse(BaseModel):
     """거래내역 목록 응답"""
     transactions: list[dict]
     total_count: int
-    has_more: bool
\ No newline at end of file
+    has_more: bool
+    version: Optional[int] = None  # 데이터셋 버전 (수정 요청의 expected_version으로 사용)
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+
+
+class TransactionCountResponse(BaseModel):
+    """거래내역 개수 응답"""
+    total_count: int
+    version: Optional[int] = None  # 데이터셋 버전
+
+
+class TransactionBulkUpdateResult(BaseModel):
+    """거래내역 일괄 수정 항목별 결과"""
+    id: int
+    success: bool
+    transaction: Optional[dict] = None  # 수정된 거래내역 (성공 시)
+    error: Optional[str] = None  # 실패 사유
+
+
+class TransactionBulkUpdateResponse(BaseModel):
+    """거래내역 일괄 수정 응답"""
+    results: list[TransactionBulkUpdateResult]  # 요청 순서
+    updated_count: int
+    version: int  # 수정 후 데이터셋 버전
+
+
+class TransactionChangesResponse(BaseModel):
+    """거래내역 변경분 응답 (since 버전 이후 추가/수정/삭제된 거래)"""
+    version: int  # 현재 데이터셋 버전 (다음 요청의 since로 사용)
+    full_resync: bool  # True면 변경분을 알 수 없으므로 목록 전체를 다시 조회
+    inserted: list[dict] = []
+    updated: list[dict] = []
+    deleted: list[int] = []  # 삭제된 거래 ID
@@ -0,0 +1,135 @@
+"""
+사용자 데이터셋 변경 로그
+
+    data/processed/transactions/user_id=<사용자>/_changes.jsonl
+        {"version": 13, "inserted": [120, 121], "updated": [7], "deleted": []}
+
+데이터셋 버전을 올릴 때마다(업로드 저장, 병합, 파티션 삭제, 거래 수정) 그 버전에서
+추가/수정/삭제된 거래 ID를 한 줄씩 기록합니다. 클라이언트가 마지막으로 받은 버전 이후의
+줄을 합치면 그 사이 바뀐 거래만 알 수 있습니다.
+
+기록은 데이터셋 락 안에서 버전 갱신 직전에 수행하고, 조회는 락 없이 수행합니다.
+로그가 일정 크기를 넘으면 오래된 줄부터 잘라내므로, 요청한 버전 이후의 줄이
+빠짐없이 남아 있지 않으면 조회 결과는 None(전체 재동기화 필요)입니다.
+"""
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Iterable
+
+from src.core.config.settings import CHANGE_LOG_MAX_BYTES
+from src.core.utils.file_utils import atomic_write_text
+from src.features.transaction.repository.partition_storage import get_user_dataset_dir
+
+logger = logging.getLogger(__name__)
+
+CHANGE_LOG_FILE_NAME = "_changes.jsonl"
+
+# 거래 ID → 변경 종류 ("inserted" / "updated" / "deleted")
+ChangeSet = dict[int, str]
+
+
+# --------------------------------
+# public functions
+# --------------------------------
+def append_changes(
+    user_id: str,
+    version: int,
+    inserted: Iterable[int] = (),
+    updated: Iterable[int] = (),
+    deleted: Iterable[int] = (),
+) -> None:
+    """버전 하나의 변경 내역 추가 (get_dataset_lock 보유 상태에서 버전 갱신 전에 호출)"""
+    entry = {
+        "version": int(version),
+        "inserted": [int(i) for i in inserted],
+        "updated": [int(i) for i in updated],
+        "deleted": [int(i) for i in deleted],
+    }
+    path = _get_change_log_path(user_id)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+        size = f.tell()
+
+    if size > CHANGE_LOG_MAX_BYTES:
+        _truncate(path)
+
+
+def read_changes(user_id: str, since: int, until: int) -> ChangeSet | None:
+    """since 이후 until까지의 변경을 거래 ID별 최종 변경 종류로 합침
+
+    같은 거래가 여러 번 바뀌면 한 번으로 합칩니다.
+    (추가 후 수정 → 추가, 추가 후 삭제 → 제외, 삭제 후 추가 → 수정)
+
+    Returns:
+        거래 ID → 변경 종류 (since~until 사이 버전의 기록이 모두 남아 있지 않으면 None)
+    """
+    if since > until:
+        return None
+    if since == until:
+        return {}
+
+    entries = [entry for entry in _read_entries(user_id) if since < entry["version"] <= until]
+    if {entry["version"] for entry in entries} != set(range(since + 1, until + 1)):
+        return None
+
+    changes: ChangeSet = {}
+    for entry in sorted(entries, key=lambda item: item["version"]):
+        for transaction_id in entry["inserted"]:
+            changes[transaction_id] = "updated" if changes.get(transaction_id) == "deleted" else "inserted"
+        for transaction_id in entry["updated"]:
+            if changes.get(transaction_id) != "inserted":
+                changes[transaction_id] = "updated"
+        for transaction_id in entry["deleted"]:
+            if changes.get(transaction_id) == "inserted":
+                del changes[transaction_id]
+            else:
+                changes[transaction_id] = "deleted"
+    return changes
+
+
+# --------------------------------
+# private functions
+# --------------------------------
+def _get_change_log_path(user_id: str) -> Path:
+    """변경 로그 파일 경로"""
+    return get_user_dataset_dir(user_id) / CHANGE_LOG_FILE_NAME
+
+
+def _read_entries(user_id: str) -> list[dict]:
+    """변경 로그 줄 목록 (없으면 빈 목록, 추가 도중인 마지막 줄 등 손상된 줄은 건너뜀)"""
+    path = _get_change_log_path(user_id)
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return []
+
+    entries = []
+    for line_no, line in enumerate(lines, start=1):
+        try:
+            entry = json.loads(line)
+            entries.append({
+                "version": int(entry["version"]),
+                "inserted": entry["inserted"],
+                "updated": entry["updated"],
+                "deleted": entry["deleted"],
+            })
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"변경 로그 손상된 줄 무시: {path}:{line_no}")
+    return entries
+
+
+def _truncate(path: Path) -> None:
+    """최근 줄만 남기도록 변경 로그 재작성 (최대 크기의 절반 이하, 마지막 줄은 항상 유지)"""
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    kept, size = [], 0
+    for line in reversed(lines):
+        if kept and size + len(line.encode("utf-8")) > CHANGE_LOG_MAX_BYTES // 2:
+            break
+        kept.append(line)
+        size += len(line.encode("utf-8"))
+    atomic_write_text(path, "".join(reversed(kept)))
+    logger.info(f"변경 로그 정리: {path.parent} ({len(lines)} → {len(kept)}줄)")
@@ -0,0 +1,59 @@
+"""
+사용자 데이터셋 매니페스트 (버전 번호)
+
+    data/processed/transactions/user_id=<사용자>/_manifest.json   ← {"version": 12}
+
+데이터셋이 바뀔 때마다(거래 수정, 업로드 저장, 파티션 삭제) 버전을 1씩 올리며,
+클라이언트가 보낸 버전과 비교하여 동시 수정 충돌(409)을 판별합니다.
+버전 갱신은 데이터셋 락 안에서만 수행하고, 조회는 락 없이 수행합니다.
+"""
+import json
+import logging
+from pathlib import Path
+
+from src.core.utils.file_utils import atomic_write_text
+from src.features.transaction.repository.partition_storage import get_user_dataset_dir
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = "_manifest.json"
+
+
+# --------------------------------
+# public functions
+# --------------------------------
+def get_dataset_version(user_id: str) -> int:
+    """데이터셋 버전 조회 (매니페스트가 없으면 0)"""
+    return int(_read_manifest(user_id).get("version", 0))
+
+
+def bump_dataset_version(user_id: str) -> int:
+    """데이터셋 버전 1 증가 (get_dataset_lock 보유 상태에서 호출)
+
+    Returns:
+        증가된 버전
+    """
+    manifest = _read_manifest(user_id)
+    manifest["version"] = int(manifest.get("version", 0)) + 1
+    atomic_write_text(_get_manifest_path(user_id), json.dumps(manifest, ensure_ascii=False))
+    return manifest["version"]
+
+
+# --------------------------------
+# private functions
+# --------------------------------
+def _get_manifest_path(user_id: str) -> Path:
+    """매니페스트 파일 경로"""
+    return get_user_dataset_dir(user_id) / MANIFEST_FILE_NAME
+
+
+def _read_manifest(user_id: str) -> dict:
+    """매니페스트 읽기 (없거나 손상되었으면 빈 dict)"""
+    path = _get_manifest_path(user_id)
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except ValueError:
+        logger.warning(f"매니페스트 손상: {path}")
+        return {}
@@ -0,0 +1,103 @@
+"""
+거래내역 수정 델타 로그
+
+파티션 파일을 다시 쓰지 않고 수정 내역만 같은 디렉토리의 JSON Lines 파일에 추가합니다.
+    year=2025/month=01/part-0.parquet
+    year=2025/month=01/delta.jsonl      ← {"id": 12, "fields": {"대분류": "식비"}}
+
+읽을 때는 거래 ID별로 필드마다 마지막 값을 모아 파티션 위에 덮어씁니다.
+같은 수정을 여러 번 적용해도 결과가 같으므로, 압축(파티션에 반영) 도중 중단되어
+로그가 남아 있어도 데이터가 깨지지 않습니다.
+"""
+import json
+import logging
+import os
+from pathlib import Path
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DELTA_FILE_NAME = "delta.jsonl"
+
+
+# --------------------------------
+# public functions
+# --------------------------------
+def get_delta_path(partition_path: Path) -> Path:
+    """파티션 파일의 델타 로그 경로"""
+    return partition_path.with_name(DELTA_FILE_NAME)
+
+
+def append_delta(partition_path: Path, transaction_id: int, fields: dict) -> int:
+    """수정 내역 한 건 추가
+
+    Returns:
+        추가 후 델타 로그 크기 (bytes)
+    """
+    return append_deltas(partition_path, [(transaction_id, fields)])
+
+
+def append_deltas(partition_path: Path, edits: list[tuple[int, dict]]) -> int:
+    """수정 내역 여러 건을 한 번의 쓰기로 추가 (fsync 한 번)
+
+    Returns:
+        추가 후 델타 로그 크기 (bytes)
+    """
+    lines = "".join(
+        json.dumps({"id": int(transaction_id), "fields": fields}, ensure_ascii=False) + "\n"
+        for transaction_id, fields in edits
+    )
+    with open(get_delta_path(partition_path), "a", encoding="utf-8") as f:
+        f.write(lines)
+        f.flush()
+        os.fsync(f.fileno())
+        return f.tell()
+
+
+def read_delta(partition_path: Path) -> pd.DataFrame:
+    """델타 로그를 거래 ID별 최종 수정 값으로 정리 (index: id, 수정하지 않은 필드는 NaN)"""
+    records = []
+    with open(get_delta_path(partition_path), encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            try:
+                entry = json.loads(line)
+                records.append({"id": int(entry["id"]), **entry["fields"]})
+            except (ValueError, KeyError, TypeError):
+                # 추가 도중 중단된 마지막 줄 등은 건너뜀
+                logger.warning(f"델타 로그 손상된 줄 무시: {get_delta_path(partition_path)}:{line_no}")
+
+    if not records:
+        return pd.DataFrame(index=pd.Index([], name="id"))
+    # groupby.last는 NaN을 건너뛰므로 필드마다 마지막으로 수정된 값이 남음
+    return pd.DataFrame.from_records(records).groupby("id").last()
+
+
+def apply_delta(frame: pd.DataFrame, overlay: pd.DataFrame) -> pd.DataFrame:
+    """파티션 DataFrame에 수정 값 덮어쓰기"""
+    if overlay.empty or frame.empty:
+        return frame
+
+    mask = frame["id"].isin(overlay.index)
+    if not mask.any():
+        return frame
+
+    frame = frame.copy()
+    row_labels = frame.index[mask]
+    ids = frame.loc[mask, "id"]
+    for col in overlay.columns:
+        # 컬럼 선택으로 읽지 않은 컬럼은 건너뜀
+        if col not in frame.columns:
+            continue
+        values = overlay[col].reindex(ids.to_numpy())
+        edited = values.notna().to_numpy()
+        if not edited.any():
+            continue
+        new_values = values[edited].astype(frame[col].dtype)
+        frame.loc[row_labels[edited], col] = new_values.to_numpy()
+    return frame
+
+
+def remove_delta(partition_path: Path) -> None:
+    """델타 로그 삭제 (파티션에 반영된 후)"""
+    get_delta_path(partition_path).unlink(missing_ok=True)
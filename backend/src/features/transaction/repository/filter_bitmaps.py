@@ -0,0 +1,182 @@
+"""
+거래내역 필터 비트맵
+
+컬럼 저장소(TransactionStore) 행마다 1비트인 조건별 비트맵(np.packbits, 8행 = 1바이트)입니다.
+저장소(데이터셋 버전)별로 한 번 만든 비트맵을 요청 간에 재사용하며,
+필터 조건들은 날짜 구간에 해당하는 바이트 범위만 잘라 AND로 합칩니다.
+
+    대분류 == "식비"   → bitmap[("대분류", 식비 코드)]
+    결제수단 == "현금" → bitmap[("결제수단", 현금 코드)]
+    시간대 09~18시     → bitmap[("hour", 9)] | ... | bitmap[("hour", 17)]
+    주말 / 월 초(1~5일) → bitmap[("weekend",)] / bitmap[("early_month",)]
+
+값별 비트맵은 처음 사용할 때 만들어 저장소 버전이 바뀔 때까지 보관합니다.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+import numpy as np
+
+from src.features.transaction.repository.transaction_store import TransactionStore
+
+logger = logging.getLogger(__name__)
+
+# 보관하는 사용자 비트맵 수 (초과 시 가장 오래 사용되지 않은 비트맵 제거)
+MAX_BITMAP_ENTRIES = 16
+
+BitmapKey = tuple
+
+# 바이트 값별 1비트 개수
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.int64)
+
+_lock = threading.Lock()
+_bitmaps: "OrderedDict[str, FilterBitmaps]" = OrderedDict()
+
+
+class FilterBitmaps:
+    """조건별 비트맵 모음 (저장소 버전별로 한 번 생성, 값별 비트맵은 처음 사용 시 생성)
+
+    사용법:
+        bitmaps = get_filter_bitmaps(user_id, store)
+        window = bitmaps.byte_window(store.date_window(start_date, end_date))
+        combined = bitmaps.equals("대분류", "식비")[window] & bitmaps.weekend()[window]
+        positions = bitmaps.to_positions(combined, row_window)
+    """
+
+    def __init__(self, store: TransactionStore):
+        self.version = store.version
+        self._store = store
+        self._bitmaps: dict[BitmapKey, np.ndarray] = {}
+        self._build_lock = threading.RLock()
+
+    @property
+    def nbytes(self) -> int:
+        """만들어 둔 비트맵 메모리 사용량 (bytes)"""
+        return sum(bitmap.nbytes for bitmap in self._bitmaps.values())
+
+    # ---- 조건별 비트맵 ----
+    def equals(self, column: str, value: str) -> np.ndarray:
+        """column == value 비트맵 (어휘에 없는 값이면 모두 0)"""
+        code = self._store.lookup(column, value)
+        if code is None:
+            return self.empty()
+        return self._get((column, code), lambda: self._store.codes(column) == code)
+
+    def hours(self, start_hour: int, end_hour: int) -> np.ndarray:
+        """start_hour <= 시 < end_hour 비트맵 (start_hour >= end_hour면 자정을 넘는 야간 구간, 0~23 밖의 시각은 무시)"""
+        if start_hour < end_hour:
+            selected = [hour for hour in range(24) if start_hour <= hour < end_hour]
+        else:  # 야간 (22:00-06:00)
+            selected = [hour for hour in range(24) if hour >= start_hour or hour < end_hour]
+
+        def build() -> np.ndarray:
+            combined = self.empty().copy()
+            for hour in selected:
+                np.bitwise_or(combined, self._hour(hour), out=combined)
+            return combined
+
+        return self._get(("hours", start_hour, end_hour), build, packed=True)
+
+    def weekend(self) -> np.ndarray:
+        """주말(토, 일) 비트맵"""
+        store = self._store
+        return self._get(("weekend",), lambda: (store.weekdays() >= 5) & store.valid_timestamps())
+
+    def early_month(self) -> np.ndarray:
+        """월 초(1~5일) 비트맵"""
+        store = self._store
+        return self._get(("early_month",), lambda: (store.days() <= 5) & store.valid_timestamps())
+
+    def empty(self) -> np.ndarray:
+        """모두 0인 비트맵"""
+        return self._get(("empty",), lambda: np.zeros(len(self._store), dtype=bool))
+
+    # ---- 구간 변환 ----
+    @staticmethod
+    def byte_window(row_window: slice) -> slice:
+        """행 구간을 포함하는 비트맵 바이트 구간"""
+        return slice(row_window.start // 8, (row_window.stop + 7) // 8)
+
+    @staticmethod
+    def from_mask(mask: np.ndarray, row_window: slice) -> np.ndarray:
+        """행 구간 마스크를 byte_window 정렬 비트맵으로 변환 (색인 검색 결과 등)"""
+        offset = row_window.start % 8
+        padded = np.zeros(offset + len(mask), dtype=bool)
+        padded[offset:] = mask
+        return np.packbits(padded)
+
+    @staticmethod
+    def to_positions(combined: np.ndarray, row_window: slice) -> np.ndarray:
+        """byte_window 비트맵에서 행 구간 안의 1비트 행 위치 (오름차순)
+
+        0이 아닌 바이트만 풀어서 결과가 적을수록 빠릅니다.
+        """
+        nonzero_bytes = np.flatnonzero(combined)
+        if len(nonzero_bytes) == 0:
+            return np.array([], dtype=np.int64)
+        bits = np.unpackbits(combined[nonzero_bytes]).reshape(-1, 8).astype(bool)
+        first_row = (row_window.start // 8 + nonzero_bytes) * 8
+        positions = (first_row[:, None] + np.arange(8))[bits]
+        return positions[(positions >= row_window.start) & (positions < row_window.stop)]
+
+    @staticmethod
+    def count(combined: np.ndarray, row_window: slice) -> int:
+        """byte_window 비트맵에서 행 구간 안의 1비트 개수 (행 위치를 만들지 않음)"""
+        if row_window.stop <= row_window.start:
+            return 0
+        total = int(_POPCOUNT[combined].sum())
+
+        # 첫/마지막 바이트 중 행 구간 밖의 비트 제외 (큰 비트부터 행 순서)
+        head_bits = row_window.start % 8
+        if head_bits:
+            total -= int(_POPCOUNT[combined[0] & (0xFF << (8 - head_bits) & 0xFF)])
+        tail_bits = (-row_window.stop) % 8
+        if tail_bits:
+            total -= int(_POPCOUNT[combined[-1] & ((1 << tail_bits) - 1)])
+        return total
+
+    # ---- private ----
+    def _hour(self, hour: int) -> np.ndarray:
+        """시각별 비트맵 (처음 사용 시 24개를 한 번에 생성)"""
+        key = ("hour", hour)
+        if key not in self._bitmaps:
+            with self._build_lock:
+                if key not in self._bitmaps:
+                    hours = self._store.hours().astype(np.int8)
+                    valid = self._store.valid_timestamps()
+                    for each_hour in range(24):
+                        self._bitmaps[("hour", each_hour)] = np.packbits((hours == each_hour) & valid)
+        return self._bitmaps[key]
+
+    def _get(self, key: BitmapKey, build: Callable[[], np.ndarray], packed: bool = False) -> np.ndarray:
+        """비트맵 조회 (없으면 생성 후 보관, build는 bool 마스크 또는 packed=True면 비트맵 반환)"""
+        bitmap = self._bitmaps.get(key)
+        if bitmap is not None:
+            return bitmap
+        with self._build_lock:
+            bitmap = self._bitmaps.get(key)
+            if bitmap is None:
+                bitmap = build() if packed else np.packbits(build())
+                self._bitmaps[key] = bitmap
+        return bitmap
+
+
+# --------------------------------
+# public functions
+# --------------------------------
+def get_filter_bitmaps(user_id: str, store: TransactionStore) -> FilterBitmaps:
+    """사용자 컬럼 저장소의 필터 비트맵 조회 (저장소 버전이 바뀌었으면 다시 생성)"""
+    with _lock:
+        bitmaps = _bitmaps.get(user_id)
+        if bitmaps is not None and bitmaps.version == store.version:
+            _bitmaps.move_to_end(user_id)
+            return bitmaps
+
+        bitmaps = FilterBitmaps(store)
+        _bitmaps[user_id] = bitmaps
+        _bitmaps.move_to_end(user_id)
+        while len(_bitmaps) > MAX_BITMAP_ENTRIES:
+            _bitmaps.popitem(last=False)
+    return bitmaps
@@ -0,0 +1,156 @@
+"""
+거래 ID 인덱스
+
+사용자 데이터셋의 거래 ID → (파티션, 파티션 내 행 위치) 해시 인덱스입니다.
+파티션 파일 버전이 바뀔 때만 다시 만들고, 그 사이에는 ID 조회가 O(1)입니다.
+
+거래 수정(델타 로그)은 행 순서와 ID를 바꾸지 않으므로 인덱스를 무효화하지 않습니다.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.core.cache.dataset_cache import FileVersion, get_file_version
+from src.features.transaction.repository.partition_storage import MonthKey, list_partitions, read_partitions
+
+logger = logging.getLogger(__name__)
+
+# 보관하는 사용자 인덱스 수 (초과 시 가장 오래 사용되지 않은 인덱스 제거)
+MAX_INDEX_ENTRIES = 64
+
+IndexVersion = tuple[tuple[Path, FileVersion | None], ...]
+
+_lock = threading.Lock()
+_indexes: "OrderedDict[str, TransactionIdIndex]" = OrderedDict()
+
+
+class TransactionIdIndex:
+    """거래 ID → 행 위치 인덱스 (데이터셋 버전별로 한 번 생성)
+
+    사용법:
+        index = get_transaction_index(user_id)
+        row = index.get(transaction_id)
+        rows = index.get_many([3, 1, 2])
+        part_nos = index.locate_many([3, 1, 2])
+    """
+
+    def __init__(self, partitions: list[tuple[MonthKey, Path]], version: IndexVersion):
+        self.partitions = partitions
+        self.version = version
+
+        ids, part_nos, positions = [], [], []
+        for part_no, item in enumerate(partitions):
+            part_ids = read_partitions([item], columns=["id"]).get("id")
+            if part_ids is None or part_ids.empty:
+                continue
+            ids.append(part_ids.to_numpy())
+            part_nos.append(np.full(len(part_ids), part_no, dtype=np.int32))
+            positions.append(np.arange(len(part_ids), dtype=np.int64))
+
+        all_ids = pd.Index(np.concatenate(ids) if ids else np.array([], dtype=np.int64))
+        part_nos = np.concatenate(part_nos) if part_nos else np.array([], dtype=np.int32)
+        positions = np.concatenate(positions) if positions else np.array([], dtype=np.int64)
+
+        # 중복 ID는 생성 시 한 번만 확인하고, 조회 시에는 최신 월의 행을 사용
+        duplicated = all_ids.duplicated(keep="first")
+        self.duplicate_ids: list[int] = all_ids[duplicated].unique().tolist()
+        if self.duplicate_ids:
+            logger.warning(f"중복된 ID 발견: {self.duplicate_ids[:10]} 등 {len(self.duplicate_ids)}개")
+            keep = ~duplicated
+            all_ids, part_nos, positions = all_ids[keep], part_nos[keep], positions[keep]
+
+        self._ids = all_ids
+        self._part_nos = part_nos
+        self._positions = positions
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def ids(self) -> pd.Index:
+        """데이터셋의 거래 ID (중복 제외)"""
+        return self._ids
+
+    def locate(self, transaction_id: int) -> tuple[tuple[MonthKey, Path], int] | None:
+        """거래 ID의 (파티션, 파티션 내 행 위치) 조회 (없으면 None)"""
+        try:
+            loc = self._ids.get_loc(transaction_id)
+        except KeyError:
+            return None
+        return self.partitions[self._part_nos[loc]], int(self._positions[loc])
+
+    def locate_many(self, transaction_ids: list[int]) -> np.ndarray:
+        """여러 거래 ID의 파티션 번호 (self.partitions 기준, 없는 ID는 -1)"""
+        requested = np.asarray(transaction_ids, dtype=np.int64)
+        if len(self._ids) == 0:
+            return np.full(len(requested), -1, dtype=np.int32)
+        locs = self._ids.get_indexer(requested)
+        return np.where(locs >= 0, self._part_nos[locs], -1).astype(np.int32)
+
+    def get(self, transaction_id: int) -> pd.Series | None:
+        """거래 ID로 행 조회 (없으면 None)"""
+        located = self.locate(transaction_id)
+        if located is None:
+            return None
+        partition, position = located
+        part = read_partitions([partition])
+        if position >= len(part) or part["id"].iat[position] != transaction_id:
+            return None
+        return part.iloc[position]
+
+    def get_many(self, transaction_ids: list[int]) -> pd.DataFrame:
+        """여러 거래 ID로 행 조회 (요청 순서 유지, 없는 ID는 제외)"""
+        requested = np.asarray(transaction_ids, dtype=np.int64)
+        locs = self._ids.get_indexer(requested) if len(requested) else np.array([], dtype=np.int64)
+        order = np.flatnonzero(locs >= 0)
+        if len(order) == 0:
+            return pd.DataFrame()
+
+        found_locs = locs[order]
+        part_nos = self._part_nos[found_locs]
+        positions = self._positions[found_locs]
+
+        # 파티션별로 한 번에 읽은 뒤 요청 순서로 재배열
+        frames, frame_orders = [], []
+        for part_no in np.unique(part_nos):
+            selected = part_nos == part_no
+            part = read_partitions([self.partitions[part_no]])
+            frames.append(part.iloc[positions[selected]])
+            frame_orders.append(order[selected])
+
+        result = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        result = result.iloc[np.argsort(np.concatenate(frame_orders), kind="stable")]
+
+        # 인덱스 생성 이후 파티션이 바뀐 경우 다른 행을 가리킬 수 있으므로 ID 확인
+        matched = result["id"].to_numpy() == requested[order]
+        if not matched.all():
+            result = result[matched]
+        return result.reset_index(drop=True)
+
+
+# --------------------------------
+# public functions
+# --------------------------------
+def get_transaction_index(user_id: str) -> TransactionIdIndex:
+    """사용자 데이터셋의 ID 인덱스 조회 (파티션이 바뀌었으면 다시 생성)"""
+    partitions = list_partitions(user_id)
+    version = tuple((path, get_file_version(path)) for _, path in partitions)
+
+    with _lock:
+        index = _indexes.get(user_id)
+        if index is not None and index.version == version:
+            _indexes.move_to_end(user_id)
+            return index
+
+    index = TransactionIdIndex(partitions, version)
+    logger.debug(f"거래 ID 인덱스 생성: user={user_id} ({len(index)}건, {len(partitions)}개월)")
+    with _lock:
+        _indexes[user_id] = index
+        _indexes.move_to_end(user_id)
+        while len(_indexes) > MAX_INDEX_ENTRIES:
+            _indexes.popitem(last=False)
+    return index
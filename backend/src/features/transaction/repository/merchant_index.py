@@ -0,0 +1,159 @@
+"""
+거래처(내용) n-gram 역색인
+
+컬럼 저장소(TransactionStore)의 내용 어휘에 대한 문자 n-gram → 내용 코드 역색인입니다.
+저장소(데이터셋 버전)가 바뀔 때만 다시 만들고, 그 사이 부분 문자열 검색은
+n-gram 포스팅 리스트 교집합 + 후보 확인으로 처리합니다.
+
+    "스타벅스 강남점" → 바이그램 {"스타", "타벅", "벅스", "스 ", " 강", "강남", "남점"}
+                    트라이그램 {"스타벅", "타벅스", "벅스 ", "스 강", " 강남", "강남점"}
+    검색어 "벅스"    → posting["벅스"]
+    검색어 "스타벅스" → posting["스타벅"] ∩ posting["타벅스"] 후보를 원문과 대조하여 확인
+
+한글은 NFC로 정규화하여 음절 하나가 한 글자가 되도록 맞춘 뒤 음절 단위로 n-gram을 만듭니다.
+(한 글자 검색어는 유니그램, 두 글자는 바이그램, 세 글자 이상은 트라이그램 포스팅 사용)
+바이그램만으로는 "스타"처럼 흔한 조각의 포스팅이 길어 교집합/원문 확인 후보가 많으므로,
+세 글자 이상 검색어는 더 선택적인 트라이그램으로 후보를 줄입니다.
+거래처명은 반복이 많으므로 행이 아니라 고유 내용(어휘) 단위로 색인하고,
+검색 결과는 고유 내용 코드 → 저장소 행 위치로 펼칩니다.
+"""
+import logging
+import threading
+import unicodedata
+from collections import OrderedDict, defaultdict
+
+import numpy as np
+
+from src.features.transaction.repository.transaction_store import TransactionStore
+
+logger = logging.getLogger(__name__)
+
+# 보관하는 사용자 색인 수 (초과 시 가장 오래 사용되지 않은 색인 제거)
+MAX_INDEX_ENTRIES = 64
+
+# 포스팅 리스트를 만드는 n-gram 길이 (검색어 길이가 이보다 짧으면 검색어 길이의 n-gram 사용)
+NGRAM_SIZE = 3
+
+# 검색 결과 행을 고유 내용별 행 목록에서 모으는 최대 고유 내용 수 (초과 시 전체 코드 마스크)
+MAX_SLICE_CODES = 256
+
+_lock = threading.Lock()
+_indexes: "OrderedDict[str, MerchantIndex]" = OrderedDict()
+
+
+class MerchantIndex:
+    """내용 부분 문자열 검색 색인 (데이터셋 버전별로 한 번 생성)
+
+    사용법:
+        index = get_merchant_index(user_id, store)
+        positions = index.search("스타벅스")
+    """
+
+    def __init__(self, store: TransactionStore):
+        self.version = store.version
+
+        # 저장소 어휘 단위로 색인 (빈 내용은 코드 -1 → 검색되지 않음)
+        codes = store.codes("내용") if "내용" in store.columns else np.full(len(store), -1, dtype=np.int8)
+        vocabulary = store.vocabulary("내용") if "내용" in store.columns else []
+        self._codes = codes
+        self._uniques: list[str] = [_normalize(text) for text in vocabulary]
+
+        # 고유 내용별 행 위치 목록 (코드 순으로 정렬한 행 위치 + 코드별 시작 위치, 빈 내용은 맨 앞)
+        self._positions_by_code = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes[codes >= 0], minlength=len(self._uniques))
+        self._code_starts = np.concatenate([[0], np.cumsum(counts)]) + np.count_nonzero(codes < 0)
+
+        # n-gram 길이별 포스팅 리스트 (1 ~ NGRAM_SIZE)
+        postings: list[dict[str, list[int]]] = [defaultdict(list) for _ in range(NGRAM_SIZE)]
+        for code, text in enumerate(self._uniques):
+            for size in range(1, NGRAM_SIZE + 1):
+                for gram in _ngrams(text, size):
+                    postings[size - 1][gram].append(code)
+
+        # 코드 순서대로 추가했으므로 포스팅 리스트는 정렬되어 있음
+        self._postings = [
+            {gram: np.array(codes_, dtype=np.int32) for gram, codes_ in by_gram.items()}
+            for by_gram in postings
+        ]
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def search(self, query: str) -> np.ndarray:
+        """내용에 query가 (문자 그대로) 포함된 저장소 행 위치 (오름차순)"""
+        query = _normalize(query)
+        if not query:
+            return np.flatnonzero(self._codes >= 0)
+
+        matched = self._match_codes(query)
+        if len(matched) == 0:
+            return np.array([], dtype=np.int64)
+
+        # 일치한 고유 내용이 적으면 행 위치 목록만 모음 (O(결과 수))
+        if len(matched) <= MAX_SLICE_CODES:
+            starts, ends = self._code_starts[matched], self._code_starts[matched + 1]
+            positions = np.concatenate([self._positions_by_code[start:end] for start, end in zip(starts, ends)])
+            return np.sort(positions)
+
+        # 고유 내용 코드 → 행 마스크 (마지막 칸은 빈 내용 코드 -1용)
+        hit = np.zeros(len(self._uniques) + 1, dtype=bool)
+        hit[matched] = True
+        return np.flatnonzero(hit[self._codes])
+
+    def _match_codes(self, query: str) -> np.ndarray:
+        """query를 포함하는 고유 내용 코드 (포스팅 교집합 후 원문 확인)"""
+        size = min(len(query), NGRAM_SIZE)
+        if len(query) == size:
+            # 검색어 자체가 n-gram이면 포스팅이 곧 결과
+            return self._postings[size - 1].get(query, np.array([], dtype=np.int32))
+
+        grams = _ngrams(query, size)
+        postings = [self._postings[size - 1].get(gram) for gram in grams]
+        if any(posting is None for posting in postings):
+            return np.array([], dtype=np.int32)
+
+        # 짧은 포스팅부터 교집합 (후보가 빨리 줄어듦)
+        postings.sort(key=len)
+        candidates = postings[0]
+        for posting in postings[1:]:
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+            if len(candidates) == 0:
+                return candidates
+
+        # n-gram이 모두 있어도 연속되지 않을 수 있으므로 원문 확인
+        return np.array([code for code in candidates if query in self._uniques[code]], dtype=np.int32)
+
+
+# --------------------------------
+# public functions
+# --------------------------------
+def get_merchant_index(user_id: str, store: TransactionStore) -> MerchantIndex:
+    """사용자 컬럼 저장소의 내용 색인 조회 (저장소 버전이 바뀌었으면 다시 생성)"""
+    with _lock:
+        index = _indexes.get(user_id)
+        if index is not None and index.version == store.version:
+            _indexes.move_to_end(user_id)
+            return index
+
+    index = MerchantIndex(store)
+    logger.debug(f"내용 색인 생성: user={user_id} ({len(index)}건)")
+
+    with _lock:
+        _indexes[user_id] = index
+        _indexes.move_to_end(user_id)
+        while len(_indexes) > MAX_INDEX_ENTRIES:
+            _indexes.popitem(last=False)
+    return index
+
+
+# --------------------------------
+# private functions
+# --------------------------------
+def _ngrams(text: str, size: int) -> set[str]:
+    """text의 길이 size인 문자 n-gram 집합"""
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def _normalize(text: str) -> str:
+    """검색용 정규화 (한글 자모 조합형 → 완성형 음절)"""
+    return unicodedata.normalize("NFC", str(text))
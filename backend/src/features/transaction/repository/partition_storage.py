@@ -0,0 +1,396 @@
+"""
+사용자별 거래내역 파티션 저장소
+
+디렉토리 구조 (hive 스타일):
+    data/processed/transactions/
+        user_id=<사용자>/
+            year=2025/
+                month=01/part-0.parquet
+                month=02/part-0.parquet
+
+각 파티션 파일은 (거래일시, ID) 내림차순으로 정렬되어 저장되며,
+파티션 목록도 최신 월부터 반환하므로 순서대로 이어 붙이면
+전체 데이터셋의 정렬 순서가 유지됩니다.
+
+거래 수정은 파티션 옆 델타 로그(delta_log.py)에 추가되고 읽을 때 합쳐지며,
+파티션을 다시 쓰면(압축/업로드) 델타 로그는 파티션에 반영된 것으로 보고 삭제됩니다.
+
+쓰기는 사용자 데이터셋 락(여러 워커 간 fcntl 락) 안에서 임시 파일 + os.replace로 수행하고,
+읽기는 락 없이 수행합니다. (파일이 원자적으로 교체되므로 쓰다 만 파일을 읽지 않음)
+
+데이터셋 전체 교체(replace_partitions)는 새 파티션을 사용자 디렉토리 안의 숨김 staging 디렉토리에
+모두 쓴 뒤 연도 디렉토리를 하나씩 rename으로 바꿔 끼우므로, 쓰는 도중 실패해도 기존 파티션이 그대로 남고
+바꿔 끼우는 도중 실패하면 옮긴 디렉토리를 되돌립니다. 여러 연도의 교체가 한 번에 일어나지는 않으므로,
+락 없이 읽는 쪽은 교체 중 잠깐 연도별로 이전/새 파티션이 섞인 목록을 볼 수 있습니다.
+(write_partitions의 월별 저장과 같은 수준이며, 교체가 끝나면 버전이 올라가 캐시된 결과는 다시 만들어짐)
+"""
+import logging
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Iterable
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from src.core.cache.dataset_cache import get_cached_frame, invalidate_cached_frame
+from src.core.config.paths import PROCESSED_DATA_DIR
+from src.core.utils.date_utils import iter_months, to_month_key
+from src.core.utils.file_utils import InterProcessLock, atomic_write, get_file_lock
+from src.features.transaction.repository.delta_log import (
+    append_delta,
+    append_deltas,
+    apply_delta,
+    get_delta_path,
+    read_delta,
+    remove_delta,
+)
+
+logger = logging.getLogger(__name__)
+
+TRANSACTIONS_DIR = PROCESSED_DATA_DIR / "transactions"
+PARTITION_FILE_NAME = "part-0.parquet"
+LOCK_FILE_NAME = ".lock"
+# 데이터셋 교체용 임시 디렉토리 접두사 (year=* 탐색에 걸리지 않도록 숨김 이름 사용)
+STAGING_DIR_PREFIX = ".staging-"
+TRASH_DIR_PREFIX = ".trash-"
+
+MonthKey = tuple[int, int]
+
+
+# --------------------------------
+# public functions
+# --------------------------------
+def get_user_dataset_dir(user_id: str) -> Path:
+    """사용자 데이터셋 디렉토리 경로"""
+    return TRANSACTIONS_DIR / f"user_id={user_id}"
+
+
+def get_partition_path(user_id: str, year: int, month: int) -> Path:
+    """월별 파티션 파일 경로"""
+    return get_user_dataset_dir(user_id) / f"year={year:04d}" / f"month={month:02d}" / PARTITION_FILE_NAME
+
+
+def get_dataset_lock(user_id: str) -> InterProcessLock:
+    """사용자 데이터셋 쓰기 락 (델타 추가 / 파티션 재작성 / 삭제 / 버전 갱신 직렬화)"""
+    return get_file_lock(get_user_dataset_dir(user_id) / LOCK_FILE_NAME)
+
+
+def list_partitions(
+    user_id: str,
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> list[tuple[MonthKey, Path]]:
+    """날짜 범위에 걸치는 파티션 목록 조회 (최신 월 우선)
+
+    시작일/종료일이 모두 주어지면 해당 월의 파티션 경로만 확인하고,
+    그렇지 않으면 사용자 디렉토리를 탐색한 뒤 범위 밖의 월을 제외합니다.
+    """
+    start_key = to_month_key(start_date)
+    end_key = to_month_key(end_date)
+
+    if start_key and end_key:
+        candidates = [
+            ((year, month), get_partition_path(user_id, year, month))
+            for year, month in iter_months(start_key, end_key)
+        ]
+        partitions = [(key, path) for key, path in candidates if path.exists()]
+    else:
+        partitions = [
+            (key, path) for key, path in _scan_partitions(user_id)
+            if (start_key is None or key >= start_key) and (end_key is None or key <= end_key)
+        ]
+
+    partitions.sort(key=lambda item: item[0], reverse=True)
+    return partitions
+
+
+def has_partitions(user_id: str) -> bool:
+    """사용자 데이터셋 존재 여부"""
+    user_dir = get_user_dataset_dir(user_id)
+    return user_dir.exists() and next(user_dir.glob("year=*"), None) is not None
+
+
+def read_partitions(
+    partitions: list[tuple[MonthKey, Path]],
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """파티션 파일들을 읽어 하나의 DataFrame으로 결합 (파티션별 캐시 사용)
+
+    Args:
+        partitions: list_partitions 결과
+        columns: 읽을 컬럼 (None이면 전체, 파일에 없는 컬럼은 무시, id는 항상 포함)
+    """
+    frames = []
+    for _, path in partitions:
+        try:
+            frames.append(_read_partition(path, columns))
+        except FileNotFoundError:
+            # 목록 조회 이후 삭제된 파티션은 건너뜀
+            logger.warning(f"파티션 없음: {path}")
+
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+    return pd.concat(frames, ignore_index=True)
+
+
+def write_partitions(user_id: str, df: pd.DataFrame, replace_all: bool) -> list[MonthKey]:
+    """DataFrame을 월별 파티션으로 나누어 저장
+
+    Args:
+        user_id: 사용자 ID
+        df: 저장할 거래내역 (거래일시 컬럼 필수)
+        replace_all: True면 df에 없는 월의 기존 파티션 삭제 (데이터셋 전체 교체)
+
+    Returns:
+        저장된 파티션의 (연도, 월) 목록
+    """
+    written: list[MonthKey] = []
+    with get_dataset_lock(user_id):
+        for key, part in _split_months(df):
+            _write_partition(get_partition_path(user_id, *key), part)
+            written.append(key)
+
+        if replace_all:
+            remove_partitions_except(user_id, written)
+
+    logger.info(f"파티션 저장 완료: user={user_id}, {len(written)}개월, {len(df)}행")
+    return written
+
+
+def replace_partitions(user_id: str, frames: Iterable[pd.DataFrame]) -> list[MonthKey]:
+    """데이터셋 전체를 frames의 거래로 교체 (staging 디렉토리에 모두 쓴 뒤 연도 디렉토리별로 교체)
+
+    frames를 다 쓰기 전에 실패하면 staging 디렉토리만 삭제되고, 연도 디렉토리를 바꿔 끼우는 도중
+    실패하면 이미 옮긴 디렉토리를 되돌리므로 어느 경우든 기존 파티션이 그대로 남습니다.
+    기존 파티션은 교체가 모두 끝난 뒤에만 삭제합니다.
+
+    Args:
+        user_id: 사용자 ID
+        frames: 저장할 거래내역 (거래일시 컬럼 필수, 한 월이 여러 frame에 나뉘면 안 됨)
+
+    Returns:
+        저장된 파티션의 (연도, 월) 목록
+    """
+    user_dir = get_user_dataset_dir(user_id)
+    written: list[MonthKey] = []
+    with get_dataset_lock(user_id):
+        staging_dir = Path(tempfile.mkdtemp(prefix=STAGING_DIR_PREFIX, dir=user_dir))
+        trash_dir = None
+        old_partitions = _scan_partitions(user_id)
+        moved_out: list[str] = []  # trash로 옮긴 기존 연도 디렉토리
+        moved_in: list[str] = []  # staging에서 옮겨 온 새 연도 디렉토리
+        succeeded = False
+        try:
+            for df in frames:
+                for key, part in _split_months(df):
+                    path = staging_dir / get_partition_path(user_id, *key).relative_to(user_dir)
+                    atomic_write(path, lambda tmp_path: _sort_partition(part).to_parquet(tmp_path, index=False))
+                    written.append(key)
+
+            # 연도 디렉토리별로 기존 디렉토리를 빼고 새 디렉토리를 넣음 (같은 파일 시스템 안의 rename)
+            trash_dir = Path(tempfile.mkdtemp(prefix=TRASH_DIR_PREFIX, dir=user_dir))
+            old_years = {year_dir.name for year_dir in user_dir.glob("year=*")}
+            new_years = {year_dir.name for year_dir in staging_dir.glob("year=*")}
+            for name in sorted(old_years | new_years):
+                if name in old_years:
+                    (user_dir / name).rename(trash_dir / name)
+                    moved_out.append(name)
+                if name in new_years:
+                    (staging_dir / name).rename(user_dir / name)
+                    moved_in.append(name)
+            succeeded = True
+        except BaseException:
+            if moved_out or moved_in:
+                _restore_year_dirs(user_dir, staging_dir, trash_dir, moved_in, moved_out)
+            raise
+        finally:
+            for _, path in old_partitions + _scan_partitions(user_id):
+                invalidate_cached_frame(path)
+                invalidate_cached_frame(get_delta_path(path))
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            if trash_dir is not None and (succeeded or not any(trash_dir.iterdir())):
+                shutil.rmtree(trash_dir, ignore_errors=True)
+
+    logger.info(f"데이터셋 교체 완료: user={user_id}, {len(written)}개월")
+    return written
+
+
+def append_partition_edit(path: Path, transaction_id: int, fields: dict) -> int:
+    """파티션의 거래 한 건 수정 내역을 델타 로그에 추가 (파티션 파일은 그대로)
+
+    Returns:
+        추가 후 델타 로그 크기 (bytes)
+    """
+    with _get_partition_lock(path):
+        if not path.exists():
+            raise FileNotFoundError(path)
+        return append_delta(path, transaction_id, fields)
+
+
+def append_partition_edits(path: Path, edits: list[tuple[int, dict]]) -> int:
+    """파티션의 거래 여러 건 수정 내역을 델타 로그에 한 번에 추가
+
+    Returns:
+        추가 후 델타 로그 크기 (bytes)
+    """
+    with _get_partition_lock(path):
+        if not path.exists():
+            raise FileNotFoundError(path)
+        return append_deltas(path, edits)
+
+
+def compact_partition(path: Path) -> bool:
+    """델타 로그를 파티션 파일에 반영하고 로그 삭제
+
+    Returns:
+        압축 여부 (델타 로그가 없으면 False)
+    """
+    with _get_partition_lock(path):
+        if not path.exists() or not get_delta_path(path).exists():
+            return False
+        merged = apply_delta(pd.read_parquet(path), read_delta(path))
+        _write_partition(path, merged)
+        return True
+
+
+def remove_partitions_except(user_id: str, keep: list[MonthKey]) -> int:
+    """keep에 없는 월의 파티션 삭제
+
+    Returns:
+        삭제된 파티션 수
+    """
+    keep_set = set(keep)
+    removed = 0
+    with get_dataset_lock(user_id):
+        for key, path in _scan_partitions(user_id):
+            if key not in keep_set:
+                _remove_partition(path)
+                removed += 1
+    return removed
+
+
+# --------------------------------
+# private functions
+# --------------------------------
+def _scan_partitions(user_id: str) -> list[tuple[MonthKey, Path]]:
+    """사용자 디렉토리의 모든 파티션 탐색"""
+    partitions = []
+    user_dir = get_user_dataset_dir(user_id)
+    if not user_dir.exists():
+        return partitions
+
+    for year_dir in user_dir.glob("year=*"):
+        for month_dir in year_dir.glob("month=*"):
+            path = month_dir / PARTITION_FILE_NAME
+            if not path.exists():
+                continue
+            try:
+                key = (int(year_dir.name.split("=", 1)[1]), int(month_dir.name.split("=", 1)[1]))
+            except ValueError:
+                logger.warning(f"파티션 디렉토리 이름 오류: {month_dir}")
+                continue
+            partitions.append((key, path))
+    return partitions
+
+
+def _restore_year_dirs(
+    user_dir: Path,
+    staging_dir: Path,
+    trash_dir: Path,
+    moved_in: list[str],
+    moved_out: list[str],
+) -> None:
+    """교체 도중 실패 시 옮긴 연도 디렉토리 되돌리기 (되돌리지 못한 기존 디렉토리는 trash에 남김)"""
+    try:
+        for name in reversed(moved_in):
+            (user_dir / name).rename(staging_dir / name)
+        for name in reversed(moved_out):
+            (trash_dir / name).rename(user_dir / name)
+    except OSError as e:
+        logger.error(f"데이터셋 교체 되돌리기 실패, 기존 파티션이 남아 있음: {trash_dir} ({e})")
+
+
+def _split_months(df: pd.DataFrame) -> list[tuple[MonthKey, pd.DataFrame]]:
+    """DataFrame을 거래일시의 (연도, 월)별로 나눔"""
+    if df.empty:
+        return []
+    dates = df["거래일시"]
+    return [
+        ((int(year), int(month)), part)
+        for (year, month), part in df.groupby([dates.dt.year, dates.dt.month], sort=False)
+    ]
+
+
+def _get_partition_lock(path: Path) -> InterProcessLock:
+    """파티션이 속한 사용자 데이터셋의 쓰기 락 (user_id=*/year=*/month=*/part-0.parquet)"""
+    return get_file_lock(path.parents[2] / LOCK_FILE_NAME)
+
+
+def _read_partition(path: Path, columns: list[str] | None = None) -> pd.DataFrame:
+    """파티션 읽기 (델타 로그가 있으면 수정 내역을 합친 결과, 각각 캐시 사용)
+
+    컬럼을 지정하면 pyarrow에서 해당 컬럼만 디코딩하고, 컬럼 조합별로 따로 캐시합니다.
+    """
+    variant = tuple(columns) if columns is not None else ()
+
+    def load_base() -> pd.DataFrame:
+        return get_cached_frame(path, lambda: _read_parquet_columns(path, columns), variant=variant)
+
+    delta_path = get_delta_path(path)
+    if not delta_path.exists():
+        return load_base()
+    try:
+        # 파티션 또는 델타 로그가 바뀌면 다시 합침 (파티션 디코딩은 캐시 재사용)
+        return get_cached_frame(
+            delta_path,
+            lambda: apply_delta(load_base(), read_delta(path)),
+            depends_on=[path],
+            variant=variant,
+        )
+    except FileNotFoundError:
+        # 확인 직후 압축되어 델타 로그가 삭제된 경우
+        return load_base()
+
+
+def _read_parquet_columns(path: Path, columns: list[str] | None) -> pd.DataFrame:
+    """parquet 파일에서 지정한 컬럼만 디코딩 (id는 델타 로그 적용을 위해 항상 포함)"""
+    if columns is None:
+        return pd.read_parquet(path)
+    # 스키마 확인과 읽기를 한 번 연 파일로 처리 (footer 중복 읽기 방지)
+    parquet_file = pq.ParquetFile(path)
+    available = set(parquet_file.schema_arrow.names)
+    selected = [col for col in dict.fromkeys(["id", *columns]) if col in available]
+    return parquet_file.read(columns=selected).to_pandas()
+
+
+def _write_partition(path: Path, part: pd.DataFrame) -> None:
+    """단일 파티션 저장 (거래일시, ID 내림차순 정렬, 델타 로그는 반영된 것으로 보고 삭제)"""
+    with _get_partition_lock(path):
+        part = _sort_partition(part)
+        try:
+            atomic_write(path, lambda tmp_path: part.to_parquet(tmp_path, index=False))
+            remove_delta(path)
+        finally:
+            invalidate_cached_frame(path)
+            invalidate_cached_frame(get_delta_path(path))
+
+
+def _sort_partition(part: pd.DataFrame) -> pd.DataFrame:
+    """파티션 저장 순서로 정렬 (거래일시, ID 내림차순)"""
+    sort_columns = ["거래일시", "id"] if "id" in part.columns else ["거래일시"]
+    return part.sort_values(sort_columns, ascending=False, kind="stable")
+
+
+def _remove_partition(path: Path) -> None:
+    """파티션 파일 및 빈 디렉토리 삭제"""
+    month_dir = path.parent
+    with _get_partition_lock(path):
+        shutil.rmtree(month_dir, ignore_errors=True)
+        invalidate_cached_frame(path)
+        invalidate_cached_frame(get_delta_path(path))
+    year_dir = month_dir.parent
+    if year_dir.exists() and not any(year_dir.iterdir()):
+        year_dir.rmdir()
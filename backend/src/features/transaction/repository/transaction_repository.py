@@ -1,50 +1,437 @@
+import numpy as np
 import pandas as pd
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable
 
 from src.core.config.paths import PROCESSED_DATA_DIR
+from src.core.config.settings import TRANSACTION_DELTA_COMPACTION_BYTES
+from src.core.context.user_context import DEFAULT_USER_ID, resolve_user_id
+from src.core.exceptions.errors import check_version
+from src.core.utils.dataframe_utils import mark_sorted_desc
+from src.core.utils.file_utils import InterProcessLock
+from src.features.transaction.repository.change_log import ChangeSet, append_changes, read_changes
+from src.features.transaction.repository.dataset_manifest import bump_dataset_version, get_dataset_version
+from src.features.transaction.repository.delta_log import apply_delta
+from src.features.transaction.repository.filter_bitmaps import FilterBitmaps, get_filter_bitmaps
+from src.features.transaction.repository.id_index import get_transaction_index
+from src.features.transaction.repository.merchant_index import get_merchant_index
+from src.features.transaction.repository.partition_storage import (
+    append_partition_edit,
+    append_partition_edits,
+    compact_partition,
+    get_dataset_lock,
+    get_user_dataset_dir,
+    has_partitions,
+    MonthKey,
+    list_partitions,
+    read_partitions,
+    replace_partitions,
+    write_partitions,
+)
+from src.features.transaction.repository.transaction_store import TransactionStore, get_transaction_store
+from src.features.upload.util.row_hash import fill_missing_row_hash
 
 logger = logging.getLogger(__name__)
 
-TRANSACTIONS_PARQUET_PATH = PROCESSED_DATA_DIR / "transactions.parquet"
+# 사용자별 파티션 도입 이전의 단일 파일 (기본 사용자 데이터로 이관)
+LEGACY_TRANSACTIONS_PARQUET_PATH = PROCESSED_DATA_DIR / "transactions.parquet"
 
-def load_transactions() -> pd.DataFrame:
-    """거래내역 parquet 파일 로드"""
-    if not TRANSACTIONS_PARQUET_PATH.exists():
-        logger.warning(f"파일 없음: {TRANSACTIONS_PARQUET_PATH}")
+# 저장소 내부용 컬럼 (API 응답에서 제외)
+INTERNAL_COLUMNS = ["row_hash"]
+
+# 델타 로그 압축용 백그라운드 스레드 (파티션 재작성은 한 번에 하나씩)
+_compaction_lock = threading.Lock()
+_compaction_executor: ThreadPoolExecutor | None = None
+_pending_compactions: set[Path] = set()
+
+
+def load_transactions(
+    start_date: str | None = None,
+    end_date: str | None = None,
+    user_id: str | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """거래내역 로드
+
+    날짜 범위가 주어지면 해당 월의 파티션만 읽습니다.
+    (월 단위로만 걸러지므로 정확한 범위 필터링은 filter_by_date_range로 수행)
+
+    Args:
+        start_date: 시작일 (YYYY-MM-DD)
+        end_date: 종료일 (YYYY-MM-DD)
+        user_id: 사용자 ID (None이면 현재 요청 사용자)
+        columns: 읽을 컬럼 (None이면 전체, id는 항상 포함, 파일에 없는 컬럼은 무시)
+
+    Returns:
+        거래일시 내림차순으로 정렬된 DataFrame (정렬 표시: mark_sorted_desc)
+    """
+    user_id = resolve_user_id(user_id)
+    _migrate_legacy_file(user_id)
+
+    partitions = list_partitions(user_id, start_date, end_date)
+    if not partitions:
+        logger.warning(f"거래내역 없음: user={user_id}, 기간={start_date}~{end_date}")
         return pd.DataFrame()
     
     try:
-        return pd.read_parquet(TRANSACTIONS_PARQUET_PATH)
+        df = read_partitions(partitions, columns)
     except Exception as e:
-        logger.error(f"파일 로드 실패: {TRANSACTIONS_PARQUET_PATH}, {e}")
+        logger.error(f"파일 로드 실패: {get_user_dataset_dir(user_id)}, {e}")
         raise
 
-def save_transactions(df: pd.DataFrame) -> None:
-    """거래내역 parquet 파일 저장"""
-    TRANSACTIONS_PARQUET_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # 파티션은 거래일시 내림차순으로 저장되고 최신 월부터 이어 붙이므로 전체가 정렬되어 있음
+    if "거래일시" in df.columns:
+        mark_sorted_desc(df, "거래일시")
+    return df
+
+def get_transactions_version(user_id: str | None = None) -> int:
+    """거래내역 데이터셋 버전 조회 (변경될 때마다 1씩 증가)"""
+    user_id = resolve_user_id(user_id)
+    _migrate_legacy_file(user_id)
+    return get_dataset_version(user_id)
+
+
+def transaction_write_lock(user_id: str | None = None) -> InterProcessLock:
+    """거래내역 읽기-수정-쓰기 구간 락 (여러 워커 간 직렬화, 중첩 가능)
+
+    사용법:
+        with transaction_write_lock(user_id):
+            df = load_transactions(user_id=user_id)
+            ...
+            save_transaction_partitions([df], months, user_id)
+    """
+    return get_dataset_lock(resolve_user_id(user_id))
+
+
+def save_transactions(df: pd.DataFrame, user_id: str | None = None) -> None:
+    """거래내역 전체 저장 (df에 없는 월의 기존 파티션은 삭제)"""
+    user_id = resolve_user_id(user_id)
     
     try:
-        df.to_parquet(TRANSACTIONS_PARQUET_PATH, index=False)
-        logger.info(f"거래내역 저장 완료: {TRANSACTIONS_PARQUET_PATH}")
+        with get_dataset_lock(user_id):
+            _write_with_changes(user_id, None, lambda: write_partitions(user_id, df, replace_all=True))
+        logger.info(f"거래내역 저장 완료: {get_user_dataset_dir(user_id)}")
     except Exception as e:
-        logger.error(f"파일 저장 실패: {TRANSACTIONS_PARQUET_PATH}, {e}")
+        logger.error(f"파일 저장 실패: {get_user_dataset_dir(user_id)}, {e}")
         raise
 
 
-def find_transaction_by_id(df: pd.DataFrame, transaction_id: int) -> tuple[int, pd.Series]:
-    """ID로 거래내역 찾기"""
-    mask = df['id'] == transaction_id
-    matching_count = mask.sum()
-    
-    # ID로 거래내역이 없으면 예외 발생
-    if matching_count == 0:
+def save_transaction_partitions(
+    frames: Iterable[pd.DataFrame],
+    months: list[MonthKey],
+    user_id: str | None = None,
+) -> None:
+    """frames에 포함된 월의 파티션만 교체 저장 (나머지 파티션은 유지)
+
+    여러 월을 저장해도 변경 로그와 데이터셋 버전은 한 번만 갱신합니다.
+
+    Args:
+        frames: 월별 거래내역 (한 월이 여러 frame에 나뉘면 안 됨)
+        months: frames가 바꿀 수 있는 월 (변경 비교 범위)
+    """
+    user_id = resolve_user_id(user_id)
+
+    def write() -> None:
+        for df in frames:
+            write_partitions(user_id, df, replace_all=False)
+
+    try:
+        with get_dataset_lock(user_id):
+            _write_with_changes(user_id, months, write)
+    except Exception as e:
+        logger.error(f"파일 저장 실패: {get_user_dataset_dir(user_id)}, {e}")
+        raise
+
+
+def replace_transaction_partitions(frames: Iterable[pd.DataFrame], user_id: str | None = None) -> None:
+    """데이터셋 전체를 frames(월별 거래내역)로 교체 (frames에 없는 월의 기존 파티션은 삭제)
+
+    새 파티션을 모두 staging 디렉토리에 쓴 뒤 데이터셋 락 안에서 기존 파티션과 바꾸고
+    데이터셋 버전은 한 번만 갱신합니다. 쓰거나 바꾸는 도중 실패하면 기존 데이터셋이 그대로 남습니다.
+    """
+    user_id = resolve_user_id(user_id)
+
+    try:
+        with get_dataset_lock(user_id):
+            _write_with_changes(user_id, None, lambda: replace_partitions(user_id, frames))
+    except Exception as e:
+        logger.error(f"데이터셋 교체 실패: {get_user_dataset_dir(user_id)}, {e}")
+        raise
+
+
+def update_transaction(
+    transaction_id: int,
+    fields: dict,
+    user_id: str | None = None,
+    expected_version: int | None = None,
+) -> tuple[pd.Series, int]:
+    """거래 한 건 수정 (수정 내역을 해당 월의 델타 로그에 추가)
+
+    파티션 파일은 다시 쓰지 않으며, 델타 로그가 임계 크기를 넘으면
+    백그라운드에서 파티션에 반영합니다.
+
+    Args:
+        expected_version: 클라이언트가 마지막으로 본 데이터셋 버전 (None이면 확인 안 함)
+
+    Returns:
+        (수정이 반영된 거래 행, 수정 후 데이터셋 버전)
+
+    Raises:
+        ValueError: 거래내역이 없거나 ID에 해당하는 거래가 없는 경우
+        VersionConflictError: expected_version이 현재 버전과 다른 경우
+    """
+    user_id = resolve_user_id(user_id)
+    _migrate_legacy_file(user_id)
+
+    with get_dataset_lock(user_id):
+        version = get_dataset_version(user_id)
+        check_version("거래내역", expected_version, version)
+
+        index = get_transaction_index(user_id)
+        if not index.partitions:
+            raise ValueError("거래내역 파일이 없습니다")
+
+        located = index.locate(transaction_id)
+        row = index.get(transaction_id)
+        if located is None or row is None:
+            raise ValueError(f"거래내역을 찾을 수 없습니다: ID {transaction_id}")
+
+        (_, path), _ = located
+        if fields:
+            log_size = append_partition_edit(path, transaction_id, fields)
+            version = _bump_version(user_id, updated=[transaction_id])
+            if log_size >= TRANSACTION_DELTA_COMPACTION_BYTES:
+                _schedule_compaction(path)
+
+    row = row.copy()
+    for key, value in fields.items():
+        row[key] = value
+    return row, version
+
+
+def update_transactions(
+    updates: dict[int, dict],
+    user_id: str | None = None,
+    expected_version: int | None = None,
+) -> tuple[pd.DataFrame, int]:
+    """거래 여러 건 수정 (파티션별 델타 로그에 한 번씩 추가, 데이터셋 버전은 한 번만 갱신)
+
+    일부 파티션에 추가한 뒤 실패하면, 이미 추가된 수정 내역을 변경 로그와 버전에 반영한 뒤 예외를 다시 발생시킵니다.
+
+    Args:
+        updates: 거래 ID → 수정할 필드
+        expected_version: 클라이언트가 마지막으로 본 데이터셋 버전 (None이면 확인 안 함)
+
+    Returns:
+        (수정이 반영된 거래 행 (없는 ID는 제외), 수정 후 데이터셋 버전)
+
+    Raises:
+        ValueError: 거래내역이 없는 경우
+        VersionConflictError: expected_version이 현재 버전과 다른 경우
+    """
+    user_id = resolve_user_id(user_id)
+    _migrate_legacy_file(user_id)
+    transaction_ids = list(updates)
+
+    with get_dataset_lock(user_id):
+        version = get_dataset_version(user_id)
+        check_version("거래내역", expected_version, version)
+
+        index = get_transaction_index(user_id)
+        if not index.partitions:
+            raise ValueError("거래내역 파일이 없습니다")
+
+        rows = index.get_many(transaction_ids)
+        if rows.empty:
+            return rows, version
+
+        # 찾은 거래만 파티션별로 묶어 추가 (수정할 필드가 없는 거래는 제외)
+        found = set(rows["id"].tolist())
+        part_nos = index.locate_many(transaction_ids)
+        edits_by_part: dict[int, list[tuple[int, dict]]] = {}
+        for transaction_id, part_no in zip(transaction_ids, part_nos):
+            if transaction_id in found and updates[transaction_id]:
+                edits_by_part.setdefault(int(part_no), []).append((transaction_id, updates[transaction_id]))
+
+        edited_ids: list[int] = []
+        try:
+            for part_no, edits in edits_by_part.items():
+                _, path = index.partitions[part_no]
+                log_size = append_partition_edits(path, edits)
+                edited_ids.extend(transaction_id for transaction_id, _ in edits)
+                if log_size >= TRANSACTION_DELTA_COMPACTION_BYTES:
+                    _schedule_compaction(path)
+        finally:
+            # 도중에 실패해도 이미 추가된 파티션의 수정 내역은 변경 로그와 버전에 반영
+            if edited_ids:
+                version = _bump_version(user_id, updated=edited_ids)
+
+    # 수정 값을 조회한 행에 한 번에 덮어씀 (거래 ID → 필드 값)
+    overlay = pd.DataFrame.from_records(
+        [{"id": transaction_id, **fields} for transaction_id, fields in updates.items()]
+    ).set_index("id")
+    return apply_delta(rows, overlay), version
+
+
+def shutdown_transaction_compaction() -> None:
+    """앱 종료 시 진행 중인 델타 로그 압축 완료 대기"""
+    global _compaction_executor
+    with _compaction_lock:
+        executor, _compaction_executor = _compaction_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+
+def find_transaction_by_id(transaction_id: int, user_id: str | None = None) -> pd.Series:
+    """ID로 거래내역 찾기 (ID 인덱스 사용)
+
+    Raises:
+        ValueError: ID에 해당하는 거래가 없는 경우
+    """
+    user_id = resolve_user_id(user_id)
+    _migrate_legacy_file(user_id)
+
+    row = get_transaction_index(user_id).get(transaction_id)
+    if row is None:
         raise ValueError(f"거래내역을 찾을 수 없습니다: ID {transaction_id}")
-    
-    # ID로 거래내역이 중복되면 경고 메시지 출력
-    if matching_count > 1:
-        logger.warning(f"중복된 ID 발견: {transaction_id} ({matching_count}개 행)")
-    
-    # ID로 거래내역 인덱스 찾기
-    row_index = df[mask].index[0]
-    # ID로 거래내역 데이터 반환
-    return row_index, df.loc[row_index]
+    return row
+
+
+def find_transactions_by_ids(transaction_ids: list[int], user_id: str | None = None) -> pd.DataFrame:
+    """여러 ID로 거래내역 찾기 (요청 순서 유지, 없는 ID는 제외)"""
+    user_id = resolve_user_id(user_id)
+    _migrate_legacy_file(user_id)
+    return get_transaction_index(user_id).get_many(transaction_ids)
+
+
+def load_transaction_changes(since: int, until: int, user_id: str | None = None) -> ChangeSet | None:
+    """since 이후 until까지 추가/수정/삭제된 거래 ID (변경 로그가 정리되어 알 수 없으면 None)"""
+    user_id = resolve_user_id(user_id)
+    _migrate_legacy_file(user_id)
+    return read_changes(user_id, since, until)
+
+
+def load_transaction_store(user_id: str | None = None) -> TransactionStore:
+    """거래내역 컬럼 저장소 로드 (데이터셋 버전별 캐시, 저장소 내부용 컬럼 제외)"""
+    user_id = resolve_user_id(user_id)
+    _migrate_legacy_file(user_id)
+    return get_transaction_store(user_id, exclude_columns=INTERNAL_COLUMNS)
+
+
+def load_filter_bitmaps(store: TransactionStore, user_id: str | None = None) -> FilterBitmaps:
+    """컬럼 저장소의 조건별 필터 비트맵 (저장소 버전별 캐시)"""
+    return get_filter_bitmaps(resolve_user_id(user_id), store)
+
+
+def find_store_positions_by_merchant(
+    store: TransactionStore,
+    merchant: str,
+    user_id: str | None = None,
+) -> np.ndarray:
+    """내용에 merchant가 (문자 그대로) 포함된 저장소 행 위치 (n-gram 색인 사용, 오름차순)"""
+    return get_merchant_index(resolve_user_id(user_id), store).search(merchant)
+
+
+def _migrate_legacy_file(user_id: str) -> None:
+    """단일 parquet 파일을 기본 사용자의 월별 파티션으로 이관 (최초 1회)"""
+    if user_id != DEFAULT_USER_ID or not LEGACY_TRANSACTIONS_PARQUET_PATH.exists():
+        return
+
+    # 데이터셋 락으로 여러 스레드/워커의 중복 이관 방지
+    with get_dataset_lock(user_id):
+        if has_partitions(user_id) or not LEGACY_TRANSACTIONS_PARQUET_PATH.exists():
+            return
+        # 병합 업로드의 중복 판별용 자연키 해시를 이관 시점 값으로 채움 (이후 수정해도 유지)
+        df = fill_missing_row_hash(pd.read_parquet(LEGACY_TRANSACTIONS_PARQUET_PATH))
+        _write_with_changes(user_id, None, lambda: write_partitions(user_id, df, replace_all=True))
+        LEGACY_TRANSACTIONS_PARQUET_PATH.rename(LEGACY_TRANSACTIONS_PARQUET_PATH.with_suffix(".parquet.migrated"))
+        logger.info(f"기존 거래내역 파일 이관 완료: {len(df)}행 → {get_user_dataset_dir(user_id)}")
+
+
+def _bump_version(
+    user_id: str,
+    inserted: Iterable[int] = (),
+    updated: Iterable[int] = (),
+    deleted: Iterable[int] = (),
+) -> int:
+    """변경 로그 기록 후 데이터셋 버전 1 증가 (get_dataset_lock 보유 상태에서 호출)"""
+    append_changes(user_id, get_dataset_version(user_id) + 1, inserted, updated, deleted)
+    return bump_dataset_version(user_id)
+
+
+def _write_with_changes(user_id: str, months: list[MonthKey] | None, write: Callable[[], object]) -> int:
+    """파티션 쓰기 전후의 행을 비교하여 변경 로그를 남기고 데이터셋 버전 갱신
+
+    쓰기로 바뀌는 월의 파티션만 비교합니다. (전체 교체는 기존 월과 새 월 전체)
+    바뀐 거래가 없으면 버전을 갱신하지 않습니다.
+    쓰기가 도중에 실패해도 이미 바뀐 파티션이 있으면 변경 로그와 버전을 갱신한 뒤 예외를 다시 발생시킵니다.
+
+    Args:
+        months: 쓰기로 바뀌는 월 (None이면 전체, 지정한 월 밖의 거래는 바뀌지 않아야 함)
+        write: 파티션 쓰기/삭제
+
+    Returns:
+        현재 데이터셋 버전
+    """
+    before = _hash_rows(user_id, months)
+    try:
+        write()
+    finally:
+        version = _record_changes(user_id, months, before)
+    return version
+
+
+def _record_changes(user_id: str, months: list[MonthKey] | None, before: pd.Series) -> int:
+    """쓰기 전 행 해시와 현재 파티션을 비교하여 변경 로그 기록 후 데이터셋 버전 갱신 (바뀐 거래가 없으면 그대로)"""
+    after = _hash_rows(user_id, months)
+
+    common = after.index.intersection(before.index)
+    changed = common[after[common].to_numpy() != before[common].to_numpy()]
+    inserted = after.index.difference(before.index)
+    deleted = before.index.difference(after.index)
+    if inserted.empty and changed.empty and deleted.empty:
+        return get_dataset_version(user_id)
+    return _bump_version(user_id, inserted.tolist(), changed.tolist(), deleted.tolist())
+
+
+def _hash_rows(user_id: str, months: list[MonthKey] | None) -> pd.Series:
+    """월 파티션들의 행 내용 해시 (index: id, 수정 내역 반영, 중복 ID는 최신 월 우선)"""
+    partitions = list_partitions(user_id)
+    if months is not None:
+        month_set = set(months)
+        partitions = [item for item in partitions if item[0] in month_set]
+
+    df = read_partitions(partitions)
+    if df.empty or "id" not in df.columns:
+        return pd.Series([], index=pd.Index([], dtype=np.int64), dtype=np.uint64)
+    hashes = pd.util.hash_pandas_object(df.drop(columns=INTERNAL_COLUMNS, errors="ignore"), index=False)
+    hashes.index = df["id"].to_numpy()
+    return hashes[~hashes.index.duplicated(keep="first")]
+
+
+def _schedule_compaction(path: Path) -> None:
+    """파티션 델타 로그 압축 예약 (이미 예약된 파티션은 건너뜀)"""
+    global _compaction_executor
+    with _compaction_lock:
+        if path in _pending_compactions:
+            return
+        if _compaction_executor is None:
+            _compaction_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="delta-compaction")
+        _pending_compactions.add(path)
+        _compaction_executor.submit(_run_compaction, path)
+
+
+def _run_compaction(path: Path) -> None:
+    """델타 로그 압축 실행 (백그라운드 스레드)"""
+    try:
+        if compact_partition(path):
+            logger.info(f"델타 로그 압축 완료: {path.parent}")
+    except Exception as e:
+        # 실패해도 델타 로그는 남아 있으므로 다음 수정 시 다시 시도
+        logger.error(f"델타 로그 압축 실패: {path.parent} - {e}", exc_info=True)
+    finally:
+        with _compaction_lock:
+            _pending_compactions.discard(path)
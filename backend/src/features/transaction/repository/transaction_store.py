@@ -0,0 +1,309 @@
+"""
+거래내역 컬럼 저장소 (TransactionStore)
+
+사용자 데이터셋을 컬럼별 numpy 배열로 압축해 둔 읽기 전용 저장소입니다.
+데이터셋 버전별로 한 번 만들고, 목록 조회/필터/통계 같은 자주 쓰는 경로에서
+object DataFrame 대신 사용합니다.
+
+    거래일시   → int64 (epoch ns)
+    id, 금액   → 값 범위에 맞는 가장 작은 정수형 (int32/int64)
+    문자열 컬럼 → 사전 코드 (int8/int16/int32, 빈 값은 -1) + 정렬된 어휘 배열
+                  (문자열과 숫자가 섞인 컬럼은 값을 문자열로 바꿔서 저장)
+
+어휘는 데이터셋 전체(모든 월 파티션)가 공유하므로 같은 문자열은 어느 행에서나 같은 코드이며,
+문자열 비교 필터는 코드 하나와의 정수 비교로 처리됩니다.
+행은 (거래일시, ID) 내림차순으로 정렬되어 있어 날짜 구간은 이진 탐색으로 찾습니다.
+"""
+import bisect
+import logging
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from src.features.transaction.repository.dataset_manifest import get_dataset_version
+from src.features.transaction.repository.partition_storage import list_partitions, read_partitions
+
+logger = logging.getLogger(__name__)
+
+# 보관하는 사용자 저장소 수 (초과 시 가장 오래 사용되지 않은 저장소 제거)
+MAX_STORE_ENTRIES = 16
+
+# 거래일시 없음(NaT)의 int64 값
+NAT_VALUE = np.iinfo(np.int64).min
+
+_NS_PER_HOUR = 3_600_000_000_000
+_NS_PER_DAY = 24 * _NS_PER_HOUR
+
+_lock = threading.Lock()
+_stores: "OrderedDict[str, TransactionStore]" = OrderedDict()
+
+
+class TransactionStore:
+    """거래내역 컬럼 저장소 (데이터셋 버전별로 한 번 생성)
+
+    사용법:
+        store = get_transaction_store(user_id)
+        window = store.date_window("2025-01-01", "2025-01-31")
+        mask = store.equals("대분류", "식비", window)
+        page = store.to_frame(window.start + np.flatnonzero(mask)[:50])
+    """
+
+    def __init__(self, df: pd.DataFrame, version: int):
+        self.version = version
+        self.columns: list[str] = list(df.columns)
+        self._values: dict[str, np.ndarray] = {}
+        self._vocabularies: dict[str, np.ndarray] = {}
+        self._datetime_columns: set[str] = set()
+
+        if not df.empty and not _is_sorted(df):
+            df = df.sort_values(["거래일시", "id"], ascending=False, kind="stable")
+
+        for col in self.columns:
+            series = df[col]
+            if pd.api.types.is_datetime64_any_dtype(series):
+                self._values[col] = series.astype("datetime64[ns]").to_numpy().view("i8")
+                self._datetime_columns.add(col)
+            elif pd.api.types.is_integer_dtype(series) or _is_integral_float(series):
+                self._values[col] = _downcast_int(series.to_numpy())
+            elif pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+                self._values[col] = series.to_numpy()
+            else:
+                codes, vocabulary = _factorize_text(series)
+                self._values[col] = _downcast_codes(codes, len(vocabulary))
+                # 마지막 칸은 코드 -1(빈 값)을 복원할 때 쓰는 None
+                self._vocabularies[col] = np.append(np.asarray(vocabulary, dtype=object), None)
+
+        # NaT 행은 정렬 시 맨 뒤에 모이므로 거래일시가 있는 행 수만 기억
+        self._dated_count = int(np.count_nonzero(self.timestamps != NAT_VALUE)) if len(self) else 0
+
+    def __len__(self) -> int:
+        return len(self._values["id"]) if "id" in self._values else 0
+
+    @property
+    def nbytes(self) -> int:
+        """배열 + 어휘 문자열 메모리 사용량 (bytes)"""
+        arrays = sum(values.nbytes for values in self._values.values())
+        words = sum(
+            vocabulary.nbytes + sum(sys.getsizeof(word) for word in vocabulary[:-1])
+            for vocabulary in self._vocabularies.values()
+        )
+        return arrays + words
+
+    # ---- typed accessors ----
+    @property
+    def ids(self) -> np.ndarray:
+        """거래 ID 배열"""
+        return self._values["id"]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """거래일시 배열 (int64 epoch ns, 내림차순, 없으면 NAT_VALUE)"""
+        return self._values["거래일시"]
+
+    @property
+    def amounts(self) -> np.ndarray:
+        """금액 배열 (수입 양수, 지출 음수)"""
+        return self._values["금액"]
+
+    def codes(self, column: str) -> np.ndarray:
+        """문자열 컬럼의 사전 코드 배열 (빈 값은 -1)"""
+        return self._values[column]
+
+    def vocabulary(self, column: str) -> np.ndarray:
+        """문자열 컬럼의 어휘 (코드 순서 = 문자열 정렬 순서)"""
+        return self._vocabularies[column][:-1]
+
+    def lookup(self, column: str, value: str) -> int | None:
+        """문자열 값의 사전 코드 (어휘에 없으면 None)"""
+        if column not in self._vocabularies:
+            return None
+        vocabulary = self.vocabulary(column)
+        pos = bisect.bisect_left(vocabulary, value)
+        if pos < len(vocabulary) and vocabulary[pos] == value:
+            return pos
+        return None
+
+    def equals(self, column: str, value: str, window: slice = slice(None)) -> np.ndarray:
+        """column == value 마스크 (window 구간)"""
+        codes = self._values[column][window]
+        code = self.lookup(column, value)
+        if code is None:
+            return np.zeros(len(codes), dtype=bool)
+        return codes == code
+
+    # ---- date helpers ----
+    def date_window(self, start_date: str | None = None, end_date: str | None = None) -> slice:
+        """start_date <= 거래일시 <= end_date 인 행 구간 (이진 탐색, O(log n))"""
+        timestamps = self.timestamps
+        descending_key = lambda value: -int(value)  # noqa: E731
+
+        # 날짜 조건이 있으면 거래일시 없는 행(맨 뒤)은 제외
+        stop = self._dated_count if (start_date or end_date) else len(timestamps)
+        if start_date:
+            start = pd.Timestamp(start_date).as_unit("ns").value
+            stop = bisect.bisect_right(timestamps, -start, lo=0, hi=stop, key=descending_key)
+        begin = 0
+        if end_date:
+            end = pd.Timestamp(end_date).as_unit("ns").value
+            begin = bisect.bisect_left(timestamps, -end, lo=0, hi=stop, key=descending_key)
+        return slice(begin, max(begin, stop))
+
+    def month_window(self, year: int, month: int) -> slice:
+        """해당 월(1일 00:00 이상 ~ 다음 달 1일 미만) 행 구간 (이진 탐색, O(log n))"""
+        month_start = pd.Timestamp(year=year, month=month, day=1)
+        next_month_start = month_start + pd.DateOffset(months=1)
+        descending_key = lambda value: -int(value)  # noqa: E731
+
+        timestamps = self.timestamps
+        stop = bisect.bisect_right(
+            timestamps, -month_start.as_unit("ns").value, lo=0, hi=self._dated_count, key=descending_key
+        )
+        begin = bisect.bisect_right(
+            timestamps, -next_month_start.as_unit("ns").value, lo=0, hi=stop, key=descending_key
+        )
+        return slice(begin, stop)
+
+    def hours(self, window: slice = slice(None)) -> np.ndarray:
+        """거래 시각(0~23) 배열"""
+        return (self.timestamps[window] // _NS_PER_HOUR) % 24
+
+    def weekdays(self, window: slice = slice(None)) -> np.ndarray:
+        """요일 배열 (0=월 ~ 6=일, 1970-01-01은 목요일)"""
+        return (self.timestamps[window] // _NS_PER_DAY + 3) % 7
+
+    def days(self, window: slice = slice(None)) -> np.ndarray:
+        """일(1~31) 배열"""
+        dates = self.timestamps[window].view("datetime64[ns]")
+        return (dates.astype("datetime64[D]") - dates.astype("datetime64[M]")).astype(np.int64) + 1
+
+    def valid_timestamps(self, window: slice = slice(None)) -> np.ndarray:
+        """거래일시가 있는 행 마스크"""
+        return self.timestamps[window] != NAT_VALUE
+
+    # ---- materialization ----
+    def column_values(self, column: str, positions: np.ndarray | slice | None = None) -> np.ndarray:
+        """선택한 행의 컬럼 값 (거래일시는 datetime64[ns], 문자열 컬럼은 빈 값 None인 object 배열)"""
+        values = self._values[column][slice(None) if positions is None else positions]
+        if column in self._datetime_columns:
+            return values.view("datetime64[ns]")
+        if column in self._vocabularies:
+            # 코드 -1은 마지막 칸(None)을 가리킴
+            return self._vocabularies[column][values]
+        return values
+
+    def to_frame(self, positions: np.ndarray | slice | None = None) -> pd.DataFrame:
+        """선택한 행만 DataFrame으로 복원 (문자열 컬럼은 빈 값 None)"""
+        data = {col: self.column_values(col, positions) for col in self.columns}
+        return pd.DataFrame(data, columns=self.columns)
+
+    def to_arrow(self, positions: np.ndarray | slice | None = None) -> pa.RecordBatch:
+        """선택한 행을 Arrow RecordBatch로 변환 (컬럼 배열에서 직접 생성)
+
+        문자열 컬럼은 선택한 행에 나오는 값만 담은 dictionary 배열이 됩니다.
+        """
+        selector = slice(None) if positions is None else positions
+        arrays = []
+        for col in self.columns:
+            values = self._values[col][selector]
+            if col in self._datetime_columns:
+                arrays.append(pa.array(values, type=pa.timestamp("ns"), mask=values == NAT_VALUE))
+            elif col in self._vocabularies:
+                used_codes, indices = np.unique(values, return_inverse=True)
+                has_null = len(used_codes) > 0 and used_codes[0] < 0
+                if has_null:
+                    # 코드 -1(빈 값)은 dictionary에서 빼고 null 인덱스로 표시
+                    used_codes, indices = used_codes[1:], indices - 1
+                dictionary = pa.array(self._vocabularies[col][used_codes], type=pa.string())
+                arrays.append(pa.DictionaryArray.from_arrays(
+                    pa.array(indices.astype(np.int32), mask=indices < 0), dictionary
+                ))
+            elif np.issubdtype(values.dtype, np.integer):
+                # 정수 폭은 데이터에 따라 달라지므로 응답 스키마는 int64로 고정
+                arrays.append(pa.array(values.astype(np.int64, copy=False)))
+            else:
+                arrays.append(pa.array(values))
+        return pa.RecordBatch.from_arrays(arrays, names=self.columns)
+
+
+# --------------------------------
+# public functions
+# --------------------------------
+def get_transaction_store(user_id: str, exclude_columns: list[str] | None = None) -> TransactionStore:
+    """사용자 데이터셋의 컬럼 저장소 조회 (데이터셋 버전이 바뀌었으면 다시 생성)
+
+    Args:
+        exclude_columns: 저장소에 넣지 않을 컬럼 (저장소 내부용 컬럼 등)
+    """
+    # 버전을 데이터보다 먼저 읽음 (그 사이 변경되면 다음 조회에서 다시 생성)
+    version = get_dataset_version(user_id)
+
+    with _lock:
+        store = _stores.get(user_id)
+        if store is not None and store.version == version:
+            _stores.move_to_end(user_id)
+            return store
+
+    df = read_partitions(list_partitions(user_id))
+    if exclude_columns:
+        df = df.drop(columns=exclude_columns, errors="ignore")
+    store = TransactionStore(df, version)
+    logger.debug(f"컬럼 저장소 생성: user={user_id} ({len(store)}건, {store.nbytes:,} bytes)")
+
+    with _lock:
+        _stores[user_id] = store
+        _stores.move_to_end(user_id)
+        while len(_stores) > MAX_STORE_ENTRIES:
+            _stores.popitem(last=False)
+    return store
+
+
+# --------------------------------
+# private functions
+# --------------------------------
+def _is_sorted(df: pd.DataFrame) -> bool:
+    """(거래일시, ID) 내림차순 정렬 여부"""
+    times = df["거래일시"].to_numpy()
+    ids = df["id"].to_numpy()
+    earlier = times[1:] < times[:-1]
+    same_time_lower_id = (times[1:] == times[:-1]) & (ids[1:] <= ids[:-1])
+    return bool(np.all(earlier | same_time_lower_id | pd.isna(times[1:])))
+
+
+def _is_integral_float(series: pd.Series) -> bool:
+    """빈 값 없이 정수 값만 가진 실수 컬럼 여부 (이전 버전 업로드의 금액 등)"""
+    if not pd.api.types.is_float_dtype(series) or series.isna().any():
+        return False
+    values = series.to_numpy()
+    return bool(np.all(values == np.round(values)))
+
+
+def _downcast_int(values: np.ndarray) -> np.ndarray:
+    """값 범위에 맞는 가장 작은 정수형 (int32 또는 int64)"""
+    values = values.astype(np.int64, copy=False)
+    int32 = np.iinfo(np.int32)
+    if len(values) == 0 or (values.min() >= int32.min and values.max() <= int32.max):
+        return values.astype(np.int32)
+    return values
+
+
+def _factorize_text(series: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """문자열 컬럼의 (사전 코드, 정렬된 어휘)
+
+    문자열이 아닌 값이 섞여 있으면 어휘를 정렬/이진 탐색할 수 없으므로 빈 값이 아닌 값을 문자열로 바꿉니다.
+    (업로드 변환에서 텍스트 컬럼을 문자열로 저장하는 것과 같은 규칙)
+    """
+    if pd.api.types.infer_dtype(series, skipna=True) not in ("string", "empty"):
+        series = series.astype(object).where(series.isna(), series.astype(str))
+    return pd.factorize(series, sort=True, use_na_sentinel=True)
+
+
+def _downcast_codes(codes: np.ndarray, vocabulary_size: int) -> np.ndarray:
+    """어휘 크기에 맞는 가장 작은 코드 정수형"""
+    for dtype in (np.int8, np.int16, np.int32):
+        if vocabulary_size < np.iinfo(dtype).max:
+            return codes.astype(dtype)
+    return codes
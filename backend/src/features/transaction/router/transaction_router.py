@@ -1,25 +1,136 @@
-from fastapi import APIRouter, Depends
+from typing import Optional
 
-from src.features.transaction.model.transaction import TransactionQuery, TransactionUpdate, TransactionListResponse
-from src.features.transaction.service.transaction_service import fetch_transactions_data, modify_transaction
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import JSONResponse
+
+from src.core.cache.conditional_get import conditional_get
+
+from src.features.transaction.model.transaction import (
+    TransactionBulkUpdate,
+    TransactionBulkUpdateResponse,
+    TransactionChangesResponse,
+    TransactionCountResponse,
+    TransactionListResponse,
+    TransactionQuery,
+    TransactionUpdate,
+)
+from src.features.transaction.service.transaction_service import (
+    count_transactions_data,
+    fetch_transaction_changes,
+    fetch_transaction_detail,
+    fetch_transactions_arrow,
+    fetch_transactions_by_ids,
+    fetch_transactions_columns,
+    fetch_transactions_data,
+    fetch_transactions_version,
+    modify_transaction,
+    modify_transactions,
+)
 
 
 transaction_router = APIRouter(prefix="/transaction", tags=["거래내역"])
 
+# 목록 조회 응답 형식 (Accept 헤더)
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+COLUMNAR_JSON_MEDIA_TYPE = "application/vnd.transactions.columnar+json"
+
+# 조회 응답 ETag (데이터셋 버전이 같으면 304)
+_dataset_etag = conditional_get(fetch_transactions_version)
+_list_etag = conditional_get(fetch_transactions_version, vary=("Accept",))
+
 
 @transaction_router.get("/")
-def get_transactions(query: TransactionQuery = Depends()) -> TransactionListResponse:
-    """거래내역 목록 조회"""
-    data_list, total_count = fetch_transactions_data(query)
+def get_transactions(
+    request: Request,
+    response: Response,
+    query: TransactionQuery = Depends(),
+    _etag: str = Depends(_list_etag),
+) -> TransactionListResponse:
+    """거래내역 목록 조회 (offset 또는 이전 응답의 next_cursor로 페이지 이동)
+
+    Accept 헤더로 응답 형식 선택:
+        application/vnd.apache.arrow.stream       → Arrow IPC 스트림 (개수/커서/버전은 X- 헤더)
+        application/vnd.transactions.columnar+json → 컬럼별 값 목록 JSON
+        그 외                                      → 행 목록 JSON (기본)
+    """
+    # 버전은 데이터보다 먼저 읽음 (그 사이 변경되면 수정 시 409로 감지)
+    version = fetch_transactions_version()
+    accept = request.headers.get("accept", "")
+
+    if ARROW_STREAM_MEDIA_TYPE in accept:
+        body, total_count, next_cursor = fetch_transactions_arrow(query)
+        headers = {
+            **response.headers,
+            "X-Total-Count": str(total_count),
+            "X-Has-More": str(next_cursor is not None).lower(),
+            "X-Dataset-Version": str(version),
+        }
+        if next_cursor:
+            headers["X-Next-Cursor"] = next_cursor
+        return Response(content=body, media_type=ARROW_STREAM_MEDIA_TYPE, headers=headers)
 
+    if COLUMNAR_JSON_MEDIA_TYPE in accept:
+        columns, total_count, next_cursor = fetch_transactions_columns(query)
+        return JSONResponse(
+            content={
+                "columns": columns,
+                "total_count": total_count,
+                "has_more": next_cursor is not None,
+                "version": version,
+                "next_cursor": next_cursor,
+            },
+            media_type=COLUMNAR_JSON_MEDIA_TYPE,
+            headers=dict(response.headers),
+        )
+
+    data_list, total_count, next_cursor = fetch_transactions_data(query)
     return TransactionListResponse(
         transactions=data_list,
         total_count=total_count,
-        has_more=query.offset + len(data_list) < total_count
+        has_more=next_cursor is not None,
+        version=version,
+        next_cursor=next_cursor,
     )
 
+@transaction_router.get("/count", dependencies=[Depends(_dataset_etag)])
+def get_transactions_count(query: TransactionQuery = Depends()) -> TransactionCountResponse:
+    """조건에 맞는 거래내역 수 조회 (limit/offset/cursor는 무시)"""
+    version = fetch_transactions_version()
+    return TransactionCountResponse(total_count=count_transactions_data(query), version=version)
+
+@transaction_router.get("/changes", dependencies=[Depends(_dataset_etag)])
+def get_transaction_changes(
+    since: int = Query(..., description="마지막으로 받은 데이터셋 버전"),
+) -> TransactionChangesResponse:
+    """since 버전 이후 추가/수정/삭제된 거래내역 조회 (full_resync면 목록 전체를 다시 조회)"""
+    return TransactionChangesResponse(**fetch_transaction_changes(since))
+
+@transaction_router.get("/by-ids", dependencies=[Depends(_dataset_etag)])
+def get_transactions_by_ids(ids: list[int] = Query(..., description="조회할 거래 ID 목록")):
+    """여러 ID의 거래내역 조회 (요청 순서 유지, 없는 ID는 제외)"""
+    return {"transactions": fetch_transactions_by_ids(ids)}
+
+@transaction_router.patch("/bulk")
+def update_transactions_bulk(
+    update_data: TransactionBulkUpdate,
+    expected_version: Optional[int] = Query(None, description="마지막으로 조회한 데이터셋 버전 (다르면 409)"),
+) -> TransactionBulkUpdateResponse:
+    """거래내역 일괄 수정 (한 번에 저장, 항목별 결과 반환)"""
+    results, version = modify_transactions(update_data.updates, expected_version)
+    updated_count = sum(result["success"] for result in results)
+    return TransactionBulkUpdateResponse(results=results, updated_count=updated_count, version=version)
+
+@transaction_router.get("/{transaction_id}", dependencies=[Depends(_dataset_etag)])
+def get_transaction(transaction_id: int):
+    """거래내역 단건 조회"""
+    return {"transaction": fetch_transaction_detail(transaction_id)}
+
 @transaction_router.put("/{transaction_id}")
-def update_transaction(transaction_id: int, update_data: TransactionUpdate):
+def update_transaction(
+    transaction_id: int,
+    update_data: TransactionUpdate,
+    expected_version: Optional[int] = Query(None, description="마지막으로 조회한 데이터셋 버전 (다르면 409)"),
+):
     """거래내역 수정"""
-    result = modify_transaction(transaction_id, update_data.to_repository_dict())
-    return {"message": "거래내역이 수정되었습니다", "transaction": result}
\ No newline at end of file
+    result, version = modify_transaction(transaction_id, update_data.to_repository_dict(), expected_version)
+    return {"message": "거래내역이 수정되었습니다", "transaction": result, "version": version}
\ No newline at end of file
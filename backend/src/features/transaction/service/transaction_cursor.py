@@ -0,0 +1,54 @@
+"""거래내역 커서(keyset) 페이지네이션
+
+커서는 마지막으로 받은 거래의 (거래일시, ID)를 인코딩한 불투명 문자열입니다.
+컬럼 저장소의 행은 (거래일시, ID) 내림차순으로 정렬되어 있으므로,
+다음 페이지 시작 위치를 이진 탐색으로 찾습니다. (O(log n))
+
+offset과 달리 스크롤 도중 새 거래가 추가되어도 페이지가 밀리지 않습니다.
+"""
+import base64
+import bisect
+import json
+
+import numpy as np
+import pandas as pd
+
+from src.features.transaction.repository.transaction_store import TransactionStore
+
+
+# --------------------------------
+# public functions
+# --------------------------------
+def encode_cursor(timestamp: int, transaction_id: int) -> str:
+    """거래의 (거래일시 epoch ns, ID)로 커서 생성"""
+    payload = {"t": pd.Timestamp(int(timestamp)).isoformat(), "id": int(transaction_id)}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[pd.Timestamp, int]:
+    """커서를 (거래일시, ID)로 변환 (잘못된 커서는 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        return pd.Timestamp(payload["t"]), int(payload["id"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+def seek_after_cursor(store: TransactionStore, positions: np.ndarray, cursor: str) -> int:
+    """필터링된 행 위치 목록에서 커서 다음 행의 순번 (O(log n))
+
+    Args:
+        positions: 저장소 행 위치 (오름차순 = (거래일시, ID) 내림차순)
+    """
+    cursor_time, cursor_id = decode_cursor(cursor)
+    cursor_time_ns = cursor_time.as_unit("ns").value
+    timestamps, ids = store.timestamps, store.ids
+
+    # 내림차순이므로 부호를 바꾼 키로 오름차순 탐색
+    return bisect.bisect_right(
+        positions,
+        (-cursor_time_ns, -cursor_id),
+        key=lambda pos: (-int(timestamps[pos]), -int(ids[pos])),
+    )
@@ -1,87 +1,148 @@
-"""거래내역 필터링 로직"""
+"""거래내역 필터링 로직
+
+조건마다 데이터셋 버전별로 만들어 둔 비트맵(FilterBitmaps)을 날짜 구간 바이트 범위만 잘라
+한 번에 AND로 합치며, 중간 DataFrame 없이 조건에 맞는 행 위치만 반환합니다.
+"""
+import re
+import numpy as np
 import pandas as pd
 from typing import Optional
 
 from src.features.transaction.model.transaction import TransactionQuery
+from src.features.transaction.repository.filter_bitmaps import FilterBitmaps
+from src.features.transaction.repository.transaction_repository import (
+    find_store_positions_by_merchant,
+    load_filter_bitmaps,
+)
+from src.features.transaction.repository.transaction_store import TransactionStore
 
 
 def filter_transactions(
-    df: pd.DataFrame,
+    store: TransactionStore,
     query: TransactionQuery
-) -> pd.DataFrame:
-    """거래내역 필터링"""
-    df = _filter_by_category(df, query.category)
-    df = _filter_by_date_range(df, query.start_date, query.end_date)
-    df = _filter_by_merchant(df, query.merchant)
-    df = _filter_by_payment_method(df, query.payment_method)
-    df = _filter_by_time_range(df, query.time_range)
-    df = _filter_by_weekend(df, query.is_weekend)
-    df = _filter_by_early_month(df, query.early_month)
-    return df
-
-
-def _filter_by_category(df: pd.DataFrame, category: Optional[str]) -> pd.DataFrame:
-    """카테고리 필터링"""
-    if category:
-        return df[df["대분류"] == category]
-    return df
+) -> np.ndarray:
+    """거래내역 필터링
 
+    날짜 범위는 정렬된 저장소에서 이진 탐색으로 구간을 찾고, 나머지 조건은 그 구간에만 적용합니다.
 
-def _filter_by_date_range(
-    df: pd.DataFrame, 
-    start_date: Optional[str], 
-    end_date: Optional[str]
-) -> pd.DataFrame:
-    """날짜 범위 필터링"""
-    if start_date:
-        df = df[df["거래일시"] >= pd.to_datetime(start_date)]
-    if end_date:
-        df = df[df["거래일시"] <= pd.to_datetime(end_date)]
-    return df
+    Returns:
+        조건에 맞는 저장소 행 위치 (오름차순 = 거래일시 내림차순)
+    """
+    window, combined = _combine_conditions(store, query)
+    if combined is None:
+        return np.arange(window.start, window.stop)
+    return FilterBitmaps.to_positions(combined, window)
 
 
-def _filter_by_merchant(df: pd.DataFrame, merchant: Optional[str]) -> pd.DataFrame:
-    """상호명 필터링"""
-    if merchant:
-        return df[df["내용"].str.contains(merchant, na=False)]
-    return df
+def count_transactions(
+    store: TransactionStore,
+    query: TransactionQuery
+) -> int:
+    """조건에 맞는 거래 수 (행 위치/DataFrame을 만들지 않고 비트 개수만 셈)"""
+    window, combined = _combine_conditions(store, query)
+    if combined is None:
+        return window.stop - window.start
+    return FilterBitmaps.count(combined, window)
 
 
-def _filter_by_payment_method(df: pd.DataFrame, payment_method: Optional[str]) -> pd.DataFrame:
+def _combine_conditions(
+    store: TransactionStore,
+    query: TransactionQuery
+) -> tuple[slice, np.ndarray | None]:
+    """날짜 구간 + 조건 비트맵 AND 결과 (조건이 없으면 비트맵 None)"""
+    window = store.date_window(query.start_date, query.end_date)
+    bitmaps = load_filter_bitmaps(store)
+    byte_window = bitmaps.byte_window(window)
+    conditions = [
+        _filter_by_category(bitmaps, query.category),
+        _filter_by_payment_method(bitmaps, query.payment_method),
+        _filter_by_time_range(bitmaps, query.time_range),
+        _filter_by_weekend(bitmaps, query.is_weekend),
+        _filter_by_early_month(bitmaps, query.early_month),
+    ]
+    conditions = [bitmap[byte_window] for bitmap in conditions if bitmap is not None]
+    merchant = _filter_by_merchant(store, window, query.merchant, query.merchant_regex)
+    if merchant is not None:
+        conditions.append(merchant)
+
+    if not conditions:
+        return window, None
+
+    # 조건 비트맵을 바이트 단위로 AND (8행씩 한 번에 처리)
+    combined = conditions[0].copy()
+    for bitmap in conditions[1:]:
+        np.bitwise_and(combined, bitmap, out=combined)
+    return window, combined
+
+
+def _filter_by_category(bitmaps: FilterBitmaps, category: Optional[str]) -> np.ndarray | None:
+    """카테고리 필터링"""
+    if category:
+        return bitmaps.equals("대분류", category)
+    return None
+
+
+def _filter_by_merchant(
+    store: TransactionStore,
+    window: slice,
+    merchant: Optional[str],
+    regex: bool = False,
+) -> np.ndarray | None:
+    """상호명 필터링 (기본: 내용 n-gram 색인으로 부분 문자열 검색, regex=True면 정규식 검색)
+
+    Returns:
+        날짜 구간 바이트 범위의 비트맵 (검색어마다 다르므로 보관하지 않음)
+    """
+    if not merchant:
+        return None
+    mask = np.zeros(window.stop - window.start, dtype=bool)
+    if "내용" not in store.columns:
+        return FilterBitmaps.from_mask(mask, window)
+
+    if regex:
+        # 정규식은 고유 내용(어휘)에만 적용한 뒤 코드로 펼침
+        try:
+            matched = pd.Series(store.vocabulary("내용")).str.contains(merchant, regex=True, na=False).to_numpy()
+        except re.error as e:
+            raise ValueError(f"잘못된 정규식입니다: {merchant} ({e})") from e
+        mask = np.append(matched, False)[store.codes("내용")[window]]
+    else:
+        positions = find_store_positions_by_merchant(store, merchant)
+        positions = positions[(positions >= window.start) & (positions < window.stop)]
+        mask[positions - window.start] = True
+    return FilterBitmaps.from_mask(mask, window)
+
+
+def _filter_by_payment_method(bitmaps: FilterBitmaps, payment_method: Optional[str]) -> np.ndarray | None:
     """결제수단 필터링"""
     if payment_method:
-        return df[df["결제수단"] == payment_method]
-    return df
+        return bitmaps.equals("결제수단", payment_method)
+    return None
 
 
-def _filter_by_time_range(df: pd.DataFrame, time_range: Optional[str]) -> pd.DataFrame:
-    """시간대 필터링"""
+def _filter_by_time_range(bitmaps: FilterBitmaps, time_range: Optional[str]) -> np.ndarray | None:
+    """시간대 필터링 (22:00-06:00처럼 시작이 끝보다 늦으면 야간 구간)"""
     if not time_range:
-        return df
+        return None
     
     parts = time_range.split("-")
     if len(parts) != 2:
-        return df
+        return None
     
     start_hour = int(parts[0].split(":")[0])
     end_hour = int(parts[1].split(":")[0])
-    hours = df["거래일시"].dt.hour
-    
-    if start_hour < end_hour:
-        return df[(hours >= start_hour) & (hours < end_hour)]
-    else:  # 야간 (22:00-06:00)
-        return df[(hours >= start_hour) | (hours < end_hour)]
+    return bitmaps.hours(start_hour, end_hour)
 
 
-def _filter_by_weekend(df: pd.DataFrame, is_weekend: Optional[bool]) -> pd.DataFrame:
-    """주말 필터링"""
+def _filter_by_weekend(bitmaps: FilterBitmaps, is_weekend: Optional[bool]) -> np.ndarray | None:
+    """주말 필터링 (토, 일)"""
     if is_weekend:
-        return df[df["거래일시"].dt.dayofweek >= 5]  # 5=토, 6=일
-    return df
+        return bitmaps.weekend()
+    return None
 
 
-def _filter_by_early_month(df: pd.DataFrame, early_month: Optional[bool]) -> pd.DataFrame:
+def _filter_by_early_month(bitmaps: FilterBitmaps, early_month: Optional[bool]) -> np.ndarray | None:
     """월 초 필터링 (1~5일)"""
     if early_month:
-        return df[df["거래일시"].dt.day <= 5]
-    return df
\ No newline at end of file
+        return bitmaps.early_month()
+    return None
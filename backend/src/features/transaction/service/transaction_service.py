@@ -1,77 +1,307 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import logging
+import threading
+from collections import OrderedDict
 
-from src.features.transaction.model.transaction import TransactionQuery
-from src.features.transaction.repository.transaction_repository import load_transactions, find_transaction_by_id, save_transactions
-from src.features.transaction.service.transaction_filters import filter_transactions
+from src.core.context.user_context import resolve_user_id
+from src.features.transaction.model.transaction import TransactionBulkUpdateItem, TransactionQuery
+from src.features.transaction.repository.transaction_repository import (
+    INTERNAL_COLUMNS,
+    find_transaction_by_id,
+    find_transactions_by_ids,
+    get_transactions_version,
+    load_transaction_changes,
+    load_transaction_store,
+    update_transaction,
+    update_transactions,
+)
+from src.features.transaction.repository.transaction_store import TransactionStore
+from src.features.transaction.service.transaction_cursor import encode_cursor, seek_after_cursor
+from src.features.transaction.service.transaction_filters import count_transactions, filter_transactions
 
 logger = logging.getLogger(__name__)
 
+# 개수 캐시 크기 ((사용자, 데이터셋 버전, 조건)별 거래 수)
+MAX_COUNT_CACHE_ENTRIES = 256
+
+# 일괄 수정 한 번에 받는 최대 항목 수
+MAX_BULK_UPDATE_ITEMS = 1000
+
+# 변경분 조회로 돌려주는 최대 거래 수 (초과 시 전체 재동기화가 더 저렴)
+MAX_CHANGED_TRANSACTIONS = 5000
+
+# 개수와 무관한 페이지 관련 필드
+_PAGE_FIELDS = {"limit", "offset", "cursor"}
+
+_count_cache_lock = threading.Lock()
+_count_cache: "OrderedDict[tuple, int]" = OrderedDict()
+
 
 # ============================================================
 # Public Functions
 # ============================================================
-def fetch_transactions_data(query: TransactionQuery) -> tuple[list[dict], int]:
-    """거래내역 조회"""
-    logger.info(f"거래내역 조회 요청 - {query.model_dump_json()}")
-    
-    # 거래내역 조회
-    df = load_transactions()
-    # 거래내역이 없으면 빈 리스트 반환
-    if df.empty:
-        return [], 0
-    
-    # 거래내역 필터링
-    df = filter_transactions(df, query)
-    # 거래내역 전체 개수
-    total_count = len(df)
-    # 거래내역 페이지 조회
-    df_page = paginate_transactions(df, query)
-    # 거래내역 포맷팅
-    result = _to_transaction_list(df_page)
+def fetch_transactions_data(query: TransactionQuery) -> tuple[list[dict], int, str | None]:
+    """거래내역 조회
+
+    Returns:
+        (거래내역 목록, 필터링된 전체 개수, 다음 페이지 커서)
+    """
+    store, page_positions, total_count, next_cursor = _query_transaction_page(query)
+    if store is None:
+        return [], 0, None
+
+    # 거래내역 포맷팅 (페이지 행만 DataFrame으로 복원)
+    result = _to_transaction_list(store.to_frame(page_positions))
     logger.info(f"거래내역 조회 완료 - 전체: {total_count}건, 반환: {len(result)}건")
-    return result, total_count
+    return result, total_count, next_cursor
+
+
+def fetch_transactions_columns(query: TransactionQuery) -> tuple[dict[str, list], int, str | None]:
+    """거래내역 컬럼 형식 조회 (컬럼명 → 값 목록, 행 단위 dict 변환 없음)
+
+    Returns:
+        (컬럼별 값 목록, 필터링된 전체 개수, 다음 페이지 커서)
+    """
+    store, page_positions, total_count, next_cursor = _query_transaction_page(query)
+    if store is None:
+        return {}, 0, None
+
+    columns = {}
+    for col in store.columns:
+        values = store.column_values(col, page_positions)
+        if np.issubdtype(values.dtype, np.datetime64):
+            values = _format_datetimes(values)
+        columns[col] = values.tolist()
+    logger.info(f"거래내역 컬럼 조회 완료 - 전체: {total_count}건, 반환: {len(page_positions)}건")
+    return columns, total_count, next_cursor
+
 
+def fetch_transactions_arrow(query: TransactionQuery) -> tuple[bytes, int, str | None]:
+    """거래내역 Arrow IPC 스트림 조회 (컬럼 배열에서 직접 RecordBatch 생성)
 
-def modify_transaction(transaction_id: int, update_data: dict) -> dict:
-    """거래내역 수정""" 
-    # 거래내역 조회
-    df = load_transactions()
-    # 거래내역이 없으면 예외 발생
+    Returns:
+        (Arrow IPC 스트림 bytes, 필터링된 전체 개수, 다음 페이지 커서)
+    """
+    store, page_positions, total_count, next_cursor = _query_transaction_page(query)
+    batch = store.to_arrow(page_positions) if store is not None else pa.record_batch([], names=[])
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    logger.info(f"거래내역 Arrow 조회 완료 - 전체: {total_count}건, 반환: {batch.num_rows}건")
+    return sink.getvalue().to_pybytes(), total_count, next_cursor
+
+
+def count_transactions_data(query: TransactionQuery) -> int:
+    """조건에 맞는 거래내역 수 (목록을 만들지 않음, (사용자, 데이터셋 버전, 조건)별 캐시)"""
+    store = load_transaction_store()
+    if len(store) == 0:
+        return 0
+
+    key = _count_cache_key(store, query)
+    with _count_cache_lock:
+        if key in _count_cache:
+            _count_cache.move_to_end(key)
+            return _count_cache[key]
+
+    total_count = count_transactions(store, query)
+    _remember_count(key, total_count)
+    return total_count
+
+
+def fetch_transaction_changes(since: int) -> dict:
+    """since 버전 이후 추가/수정/삭제된 거래내역 조회
+
+    변경 로그가 정리되어 since 이후를 알 수 없거나 바뀐 거래가 너무 많으면
+    full_resync=True만 반환합니다. (클라이언트는 목록 전체를 다시 조회)
+    """
+    if since < 0:
+        raise ValueError("since는 0 이상이어야 합니다")
+
+    # 버전을 먼저 읽음 (그 사이 바뀐 거래는 다음 변경분 조회에 다시 포함됨)
+    version = get_transactions_version()
+    changes = load_transaction_changes(since, version)
+    if changes is None or len(changes) > MAX_CHANGED_TRANSACTIONS:
+        logger.info(f"거래내역 변경분 조회 - 전체 재동기화 필요 (버전 {since} → {version})")
+        return {"version": version, "full_resync": True}
+
+    deleted = sorted(transaction_id for transaction_id, kind in changes.items() if kind == "deleted")
+    upserted = [transaction_id for transaction_id, kind in changes.items() if kind != "deleted"]
+    inserted, updated = [], []
+    for transaction in fetch_transactions_by_ids(upserted):
+        (inserted if changes[transaction["id"]] == "inserted" else updated).append(transaction)
+
+    logger.info(
+        f"거래내역 변경분 조회 완료 (버전 {since} → {version}) - "
+        f"추가: {len(inserted)}건, 수정: {len(updated)}건, 삭제: {len(deleted)}건"
+    )
+    return {"version": version, "full_resync": False, "inserted": inserted, "updated": updated, "deleted": deleted}
+
+
+def fetch_transaction_detail(transaction_id: int) -> dict:
+    """거래내역 단건 조회"""
+    return _to_transaction_dict(find_transaction_by_id(transaction_id))
+
+
+def fetch_transactions_by_ids(transaction_ids: list[int]) -> list[dict]:
+    """여러 ID의 거래내역 조회 (요청 순서 유지, 없는 ID는 제외)"""
+    df = find_transactions_by_ids(transaction_ids)
     if df.empty:
-        raise ValueError("거래내역 파일이 없습니다")
-    
-    # 거래내역 조회
-    row_index, _ = find_transaction_by_id(df, transaction_id)
+        return []
+    return _to_transaction_list(df)
+
 
-     # 필드 업데이트
-    for key, value in update_data.items():
-        if value is not None:
-            df.loc[row_index, key] = value
+def fetch_transactions_version() -> int:
+    """거래내역 데이터셋 버전 조회"""
+    return get_transactions_version()
 
-    # 거래내역 저장
-    save_transactions(df)
-    logger.info(f"거래내역 수정 완료: ID {transaction_id}")
+
+def modify_transaction(
+    transaction_id: int,
+    update_data: dict,
+    expected_version: int | None = None,
+) -> tuple[dict, int]:
+    """거래내역 수정 (expected_version이 현재 버전과 다르면 VersionConflictError)
+
+    Returns:
+        (수정된 거래내역, 수정 후 데이터셋 버전)
+    """ 
+    # 변경할 필드만 추림
+    fields = {key: value for key, value in update_data.items() if value is not None}
+
+    # 수정 내역 저장 (해당 월의 델타 로그에 추가)
+    row, version = update_transaction(transaction_id, fields, expected_version=expected_version)
+    logger.info(f"거래내역 수정 완료: ID {transaction_id} (버전 {version})")
 
     # 거래내역 포맷팅
-    row_dict = df.loc[row_index].to_dict()
-    if '거래일시' in row_dict:
-        row_dict['거래일시'] = pd.to_datetime(row_dict['거래일시']).strftime("%Y-%m-%d %H:%M:%S")
-    return row_dict
+    return _to_transaction_dict(row), version
+
+
+def modify_transactions(
+    items: list[TransactionBulkUpdateItem],
+    expected_version: int | None = None,
+) -> tuple[list[dict], int]:
+    """거래내역 일괄 수정 (모두 확인 후 한 번에 저장, 없는 ID는 항목별 실패로 반환)
+
+    같은 ID가 여러 번 있으면 뒤의 항목 값이 우선합니다.
 
+    Returns:
+        (요청 순서의 항목별 결과, 수정 후 데이터셋 버전)
+    """
+    if not items:
+        raise ValueError("수정할 거래내역이 없습니다")
+    if len(items) > MAX_BULK_UPDATE_ITEMS:
+        raise ValueError(f"한 번에 수정할 수 있는 거래내역은 최대 {MAX_BULK_UPDATE_ITEMS}건입니다")
 
-def paginate_transactions(df: pd.DataFrame, query: TransactionQuery) -> pd.DataFrame:
-    """거래내역 정렬 및 페이지네이션"""
-    df_sorted = df.sort_values("거래일시", ascending=False)
-    return df_sorted.iloc[query.offset:query.offset + query.limit].copy()
+    # 거래 ID별 수정 필드 (같은 ID는 필드 단위로 합침)
+    updates: dict[int, dict] = {}
+    for item in items:
+        updates.setdefault(item.id, {}).update(item.to_repository_dict())
+
+    rows, version = update_transactions(updates, expected_version=expected_version)
+    transactions = {}
+    if not rows.empty:
+        transactions = dict(zip(rows["id"].tolist(), _to_transaction_list(rows)))
+
+    results = []
+    for item in items:
+        transaction = transactions.get(item.id)
+        if transaction is None:
+            results.append({"id": item.id, "success": False, "error": f"거래내역을 찾을 수 없습니다: ID {item.id}"})
+        else:
+            results.append({"id": item.id, "success": True, "transaction": transaction})
+    logger.info(f"거래내역 일괄 수정 완료: {len(transactions)}/{len(updates)}건 (버전 {version})")
+    return results, version
+
+
+def paginate_transactions(
+    store: TransactionStore,
+    positions: np.ndarray,
+    query: TransactionQuery,
+) -> tuple[np.ndarray, str | None]:
+    """거래내역 페이지네이션 (저장소 행은 이미 거래일시 내림차순이므로 정렬 없음)
+
+    cursor가 있으면 커서 다음 행부터, 없으면 offset부터 limit건을 반환합니다.
+
+    Returns:
+        (페이지 행 위치, 다음 페이지 커서 (마지막 페이지면 None))
+    """
+    start = seek_after_cursor(store, positions, query.cursor) if query.cursor else query.offset
+    end = start + query.limit
+
+    page_positions = positions[start:end]
+    next_cursor = None
+    if end < len(positions) and len(page_positions) > 0:
+        last = page_positions[-1]
+        next_cursor = encode_cursor(store.timestamps[last], store.ids[last])
+    return page_positions, next_cursor
 
 
 # ============================================================
 # Private Functions
 # ============================================================
+def _query_transaction_page(
+    query: TransactionQuery,
+) -> tuple[TransactionStore | None, np.ndarray, int, str | None]:
+    """필터링 + 페이지네이션 (저장소, 페이지 행 위치, 전체 개수, 다음 페이지 커서)
+
+    거래내역이 없으면 저장소 대신 None을 반환합니다.
+    """
+    logger.info(f"거래내역 조회 요청 - {query.model_dump_json()}")
+    
+    # 거래내역 조회 (데이터셋 버전별로 캐시된 컬럼 저장소)
+    store = load_transaction_store()
+    # 거래내역이 없으면 빈 결과 반환
+    if len(store) == 0:
+        return None, np.array([], dtype=np.int64), 0, None
+    
+    # 거래내역 필터링 (조건에 맞는 행 위치)
+    positions = filter_transactions(store, query)
+    _remember_count(_count_cache_key(store, query), len(positions))
+    # 거래내역 페이지 조회
+    page_positions, next_cursor = paginate_transactions(store, positions, query)
+    return store, page_positions, len(positions), next_cursor
+
+
+def _count_cache_key(store: TransactionStore, query: TransactionQuery) -> tuple:
+    """개수 캐시 키 (사용자, 데이터셋 버전, 페이지 관련 필드를 뺀 조건)"""
+    conditions = query.model_dump(exclude=_PAGE_FIELDS)
+    # 빈 문자열 조건은 조건 없음과 같음
+    normalized = tuple(sorted((name, value if value != "" else None) for name, value in conditions.items()))
+    return resolve_user_id(None), store.version, normalized
+
+
+def _remember_count(key: tuple, total_count: int) -> None:
+    """개수 캐시 저장 (초과 시 가장 오래 사용되지 않은 항목 제거)"""
+    with _count_cache_lock:
+        _count_cache[key] = total_count
+        _count_cache.move_to_end(key)
+        while len(_count_cache) > MAX_COUNT_CACHE_ENTRIES:
+            _count_cache.popitem(last=False)
+
+
+def _format_datetimes(values: np.ndarray) -> np.ndarray:
+    """datetime64 배열을 "YYYY-MM-DD HH:MM:SS" 문자열 배열로 변환 (행별 strftime 없음, NaT는 None)"""
+    if len(values) == 0:
+        return np.array([], dtype=object)
+    formatted = np.char.replace(np.datetime_as_string(values, unit="s"), "T", " ").astype(object)
+    formatted[np.isnat(values)] = None
+    return formatted
+
+
+def _to_transaction_dict(row: pd.Series) -> dict:
+    """거래 행을 딕셔너리로 변환 (날짜 포맷팅 포함)"""
+    row_dict = row.drop(INTERNAL_COLUMNS, errors="ignore").to_dict()
+    if '거래일시' in row_dict:
+        row_dict['거래일시'] = pd.to_datetime(row_dict['거래일시']).strftime("%Y-%m-%d %H:%M:%S")
+    return row_dict
+
+
 def _to_transaction_list(df: pd.DataFrame) -> list[dict]:
     """DataFrame을 딕셔너리 리스트로 변환 (날짜 포맷팅 포함)"""
-    df_formatted = df.copy()
+    df_formatted = df.drop(columns=INTERNAL_COLUMNS, errors="ignore")
     if '거래일시' in df_formatted.columns:
         df_formatted['거래일시'] = df_formatted['거래일시'].dt.strftime("%Y-%m-%d %H:%M:%S")
     return df_formatted.to_dict('records')
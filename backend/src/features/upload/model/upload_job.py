@@ -0,0 +1,35 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+
+# ============================================================
+# 도메인 모델
+# ============================================================
+UploadJobState = Literal["queued", "running", "succeeded", "failed"]
+
+
+class UploadJobStatus(BaseModel):
+    """업로드 변환 작업 상태"""
+    job_id: str
+    user_id: str = Field(exclude=True)
+    filename: str
+    file_path: Path = Field(exclude=True)       # 저장된 업로드 파일
+    file_size: int                              # 업로드 파일 크기 (bytes)
+    sha256: str                                 # 업로드 파일 내용 해시
+    mode: str
+    state: UploadJobState = "queued"
+    progress: float = 0.0                       # 0.0 ~ 1.0
+    rows_processed: int = 0
+    row_count: Optional[int] = None
+    inserted_count: Optional[int] = None
+    skipped_count: Optional[int] = None
+    rows_per_second: Optional[int] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    queue_seconds: Optional[float] = None       # 대기 시간
+    elapsed_seconds: Optional[float] = None     # 변환 시간
+    error: Optional[str] = None
@@ -1,29 +1,292 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from operator import itemgetter
 from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from openpyxl import load_workbook
 
 from src.core.config.paths import RAW_DATA_DIR
+from src.core.utils.file_utils import atomic_write_text
+from src.features.upload.util.file_validation import MAX_FILE_SIZE, validate_file_size
+
+# 스트리밍 변환 시 한 번에 처리하는 행 수 (parquet row group 크기)
+EXCEL_CHUNK_SIZE = 10_000
+
+# 업로드 파일을 디스크로 복사할 때 한 번에 읽는 바이트 수
+UPLOAD_COPY_CHUNK_SIZE = 1024 * 1024
+
+# 업로드 작업 상태 파일 디렉토리 (사용자 업로드 디렉토리 안, 작업 ID별 JSON)
+UPLOAD_JOB_DIR_NAME = "_jobs"
+_JOB_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+
+def save_uploaded_file(
+    user_id: str,
+    filename: str,
+    stream: BinaryIO,
+    max_size: int = MAX_FILE_SIZE,
+) -> tuple[Path, str, int]:
+    """업로드 스트림을 사용자별 디렉토리에 저장 (I/O 담당)
 
+    청크 단위로 임시 파일에 복사하면서 SHA-256 해시와 크기를 누적하고,
+    크기 제한을 넘으면 즉시 중단합니다. 복사가 끝나면 os.replace로 최종 경로에
+    옮기므로 변환 작업이 쓰다 만 파일을 읽는 일이 없습니다.
+    파일명 앞에 내용 해시를 붙여 같은 이름의 다른 파일이 동시에 올라와도 덮어쓰지 않습니다.
 
-def save_uploaded_file(filename: str, content: bytes) -> Path:
-    """업로드된 파일 저장"""
+    Returns:
+        (저장 경로, SHA-256 hex, 바이트 수)
+    """
+    user_dir = RAW_DATA_DIR / user_id
+    user_dir.mkdir(parents=True, exist_ok=True)
 
-    # 파일 저장
-    file_path = RAW_DATA_DIR / filename
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp_name = tempfile.mkstemp(prefix=".upload-", suffix=".part", dir=user_dir)
+    tmp_path = Path(tmp_name)
     try:
-        with open(file_path, "wb") as f:
-            f.write(content)
-        return file_path
+        with os.fdopen(fd, "wb") as f:
+            while chunk := stream.read(UPLOAD_COPY_CHUNK_SIZE):
+                size += len(chunk)
+                validate_file_size(size, max_size)
+                digest.update(chunk)
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+
+        sha256 = digest.hexdigest()
+        file_path = user_dir / f"{sha256[:16]}_{Path(filename).name}"
+        os.replace(tmp_path, file_path)
+        return file_path, sha256, size
+    except ValueError:
+        tmp_path.unlink(missing_ok=True)
+        raise
     except Exception as e:
+        tmp_path.unlink(missing_ok=True)
         raise ValueError(f"파일 저장 실패: {e}")
 
 
+def remove_uploaded_file(file_path: Path) -> None:
+    """저장된 업로드 파일 삭제 (변환하지 않을 파일 정리, 없으면 무시)"""
+    file_path.unlink(missing_ok=True)
+
+
+def save_upload_job_state(user_id: str, job_id: str, state: dict) -> None:
+    """업로드 작업 상태 저장 (작업 ID별 JSON 파일, 다른 워커에서도 조회 가능)"""
+    atomic_write_text(_get_job_path(user_id, job_id), json.dumps(state, ensure_ascii=False, default=str))
+
+
+def load_upload_job_state(user_id: str, job_id: str) -> dict | None:
+    """업로드 작업 상태 조회 (없거나 손상되었거나 형식이 아닌 작업 ID면 None)"""
+    if not _JOB_ID_PATTERN.match(job_id):
+        return None
+    try:
+        return json.loads(_get_job_path(user_id, job_id).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def prune_upload_job_states(user_id: str, keep: int) -> int:
+    """최근 keep개를 남기고 오래된 작업 상태 파일 삭제
+
+    Returns:
+        삭제된 파일 수
+    """
+    job_dir = RAW_DATA_DIR / user_id / UPLOAD_JOB_DIR_NAME
+    if not job_dir.exists():
+        return 0
+    # 실행 중인 작업은 진행률을 갱신할 때마다 다시 쓰므로 수정 시각이 최근
+    paths = []
+    for path in job_dir.glob("*.json"):
+        try:
+            paths.append((path.stat().st_mtime_ns, path))
+        except FileNotFoundError:  # 다른 워커가 먼저 삭제
+            continue
+    paths.sort()
+    removed = [path for _, path in paths[:max(0, len(paths) - keep)]]
+    for path in removed:
+        path.unlink(missing_ok=True)
+    return len(removed)
+
+
 def read_excel_to_dataframe(path: Path, sheet_name: int = 1) -> pd.DataFrame:
     """엑셀 → DataFrame (I/O 담당)"""
     return pd.read_excel(path, sheet_name)
 
-def save_dataframe_to_parquet(df: pd.DataFrame, path: Path) -> None:
-    """DataFrame → Parquet (I/O 담당)"""
-    df.to_parquet(path, index=False)
+
+def estimate_excel_row_count(path: Path, sheet_name: int = 1) -> int | None:
+    """엑셀 시트의 데이터 행 수 추정 (진행률 계산용, 헤더 제외)
+
+    시트에 기록된 크기 정보만 읽으므로 실제 행 수와 다를 수 있고,
+    크기 정보가 없으면 None을 반환합니다.
+    """
+    if path.suffix.lower() != ".xlsx":
+        return None
+    workbook = load_workbook(path, read_only=True)
+    try:
+        max_row = workbook.worksheets[sheet_name].max_row
+    finally:
+        workbook.close()
+    return max(max_row - 1, 0) if max_row else None
+
+
+def iter_excel_chunks(
+    path: Path,
+    sheet_name: int = 1,
+    chunk_size: int = EXCEL_CHUNK_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """엑셀 시트를 한 행씩 읽어 chunk_size 행 단위 DataFrame으로 반환 (I/O 담당)
+
+    openpyxl read-only 모드로 읽으므로 파일 크기와 관계없이
+    메모리에는 한 청크 분량의 행만 유지됩니다.
+    """
+    # openpyxl은 .xls를 지원하지 않으므로 전체 로드 후 분할
+    if path.suffix.lower() != ".xlsx":
+        df = read_excel_to_dataframe(path, sheet_name)
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size].reset_index(drop=True)
+        return
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[sheet_name].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+
+        # 이름 없는 열(빈 헤더)은 제외
+        keep = [i for i, name in enumerate(header) if name is not None]
+        columns = [str(header[i]) for i in keep]
+        pick = itemgetter(*keep)
+
+        buffer = []
+        for row in rows:
+            values = pick(row) if len(keep) > 1 else (pick(row),)
+            if all(value is None for value in values):
+                continue
+            buffer.append(values)
+            if len(buffer) >= chunk_size:
+                yield pd.DataFrame.from_records(buffer, columns=columns)
+                buffer = []
+        if buffer:
+            yield pd.DataFrame.from_records(buffer, columns=columns)
+    finally:
+        workbook.close()
+
+
+class MonthlyStagingWriter:
+    """청크를 월별 staging parquet 파일에 row group 단위로 이어서 기록
+
+    엑셀 행이 날짜순이 아니어도 월별로 모아 둘 수 있도록,
+    월마다 ParquetWriter를 열어 두고 청크가 들어올 때마다 row group을 추가합니다.
+
+    사용법:
+        with MonthlyStagingWriter(staging_dir) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+        staged = writer.staged_files
+    """
+
+    def __init__(self, staging_dir: Path):
+        self.staging_dir = staging_dir
+        self._schema: pa.Schema | None = None
+        self._writers: dict[tuple[int, int], pq.ParquetWriter] = {}
+        self._paths: dict[tuple[int, int], Path] = {}
+
+    def __enter__(self) -> "MonthlyStagingWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def staged_files(self) -> list[tuple[tuple[int, int], Path]]:
+        """(연도, 월) 오름차순 staging 파일 목록"""
+        return sorted(self._paths.items())
+
+    def write(self, df: pd.DataFrame) -> None:
+        """청크를 거래일시 기준 월별 파일에 추가 (거래일시 컬럼 필수)"""
+        if df.empty:
+            return
+        if self._schema is None:
+            self._schema = _infer_schema(df)
+
+        df = _conform_to_schema(df, self._schema)
+
+        dates = df["거래일시"]
+        for (year, month), part in df.groupby([dates.dt.year, dates.dt.month], sort=False):
+            key = (int(year), int(month))
+            table = pa.Table.from_pandas(part, schema=self._schema, preserve_index=False)
+            self._get_writer(key).write_table(table)
+
+    def close(self) -> None:
+        """열린 writer 모두 닫기"""
+        for writer in self._writers.values():
+            writer.close()
+        self._writers.clear()
+
+    def _get_writer(self, key: tuple[int, int]) -> pq.ParquetWriter:
+        """월별 writer 조회 (없으면 생성)"""
+        writer = self._writers.get(key)
+        if writer is None:
+            path = self.staging_dir / f"{key[0]:04d}-{key[1]:02d}.parquet"
+            writer = pq.ParquetWriter(path, self._schema)
+            self._writers[key] = writer
+            self._paths[key] = path
+        return writer
+
+
+def _get_job_path(user_id: str, job_id: str) -> Path:
+    """업로드 작업 상태 파일 경로"""
+    return RAW_DATA_DIR / user_id / UPLOAD_JOB_DIR_NAME / f"{job_id}.json"
+
+
+def _conform_to_schema(df: pd.DataFrame, schema: pa.Schema) -> pd.DataFrame:
+    """청크 컬럼을 staging 스키마에 맞춤
+
+    문자열 컬럼만 값을 문자열로 바꾸고 (숫자/문자가 섞인 메모 등, 빈 값은 None),
+    숫자/날짜 컬럼은 dtype을 유지합니다.
+
+    Raises:
+        ValueError: 숫자 컬럼에 숫자로 바꿀 수 없는 값, 정수 컬럼에 소수점이 있는 값이 있는 경우
+    """
+    converted = {}
+    for field in schema:
+        column = df[field.name]
+        if pa.types.is_string(field.type):
+            converted[field.name] = column.astype(str).where(column.notna(), None)
+        elif pa.types.is_integer(field.type) or pa.types.is_floating(field.type):
+            numbers = column if pd.api.types.is_numeric_dtype(column) else pd.to_numeric(column, errors="coerce")
+            if (numbers.isna() & column.notna()).any():
+                raise ValueError(f"'{field.name}' 컬럼에 숫자가 아닌 값이 있습니다. 엑셀 파일을 확인해주세요.")
+            if pa.types.is_integer(field.type) and (numbers.dropna() % 1 != 0).any():
+                raise ValueError(f"'{field.name}' 컬럼에 정수가 아닌 값이 있습니다. 엑셀 파일을 확인해주세요.")
+            converted[field.name] = numbers
+    return df.assign(**converted) if converted else df
 
 
+def _infer_schema(df: pd.DataFrame) -> pa.Schema:
+    """첫 청크의 dtype으로 staging 스키마 결정 (object 컬럼은 문자열)
 
+    pandas 메타데이터를 넣지 않아 다시 읽을 때 문자열 컬럼이 object dtype으로 복원됩니다.
+    """
+    fields = []
+    for name, dtype in df.dtypes.items():
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            arrow_type = pa.timestamp("ns")
+        elif pd.api.types.is_bool_dtype(dtype):
+            arrow_type = pa.bool_()
+        elif pd.api.types.is_integer_dtype(dtype):
+            arrow_type = pa.int64()
+        elif pd.api.types.is_float_dtype(dtype):
+            arrow_type = pa.float64()
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(str(name), arrow_type))
+    return pa.schema(fields)
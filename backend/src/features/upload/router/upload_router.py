@@ -1,28 +1,58 @@
-from fastapi import APIRouter, UploadFile, File
+from fastapi import APIRouter, UploadFile, File, Query, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 
-from src.features.upload.service.upload_service import process_excel_upload
-from src.features.upload.util.file_validation import validate_file_extension
+from src.features.upload.model.upload_job import UploadJobStatus
+from src.features.upload.service.upload_service import UploadMode, discard_excel_upload, save_excel_upload
+from src.features.upload.service.upload_job_service import (
+    UploadQueueFullError,
+    get_upload_job,
+    submit_upload_job,
+)
+from src.features.upload.util.file_validation import (
+    FileTooLargeError,
+    validate_file_extension,
+    validate_file_size,
+)
 
 upload_router = APIRouter(prefix="/upload", tags=["업로드"])
 
-@upload_router.post("/excel")
-async def upload_excel(file: UploadFile = File(...)):
-    """엑셀 파일 업로드 및 변환"""
+@upload_router.post("/excel", status_code=status.HTTP_202_ACCEPTED)
+async def upload_excel(
+    file: UploadFile = File(...),
+    mode: UploadMode = Query("replace", description="replace: 전체 교체, merge: 신규 거래만 추가"),
+):
+    """엑셀 파일 업로드 (변환은 백그라운드 작업으로 실행, /upload/jobs/{job_id}로 상태 조회)"""
 
-    # 1. 파일 확장자 검증
+    # 1. 파일 확장자/크기 검증
     if not file.filename:
         raise ValueError("파일명이 없습니다.")
     validate_file_extension(file.filename)
     
-    # 2. 파일 내용 읽기
-    content = await file.read()
-    
-    # 3. 파일 업로드 및 변환
-    result = process_excel_upload(file.filename, content)
+    try:
+        validate_file_size(file.size)
+
+        # 2. 파일 저장 (메모리에 올리지 않고 청크 단위로 디스크에 복사)
+        file_path, sha256, file_size = await run_in_threadpool(save_excel_upload, file.filename, file.file)
+    except FileTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+
+    # 3. 변환 작업 등록 (등록하지 못하면 저장한 파일 삭제)
+    try:
+        job = submit_upload_job(file.filename, file_path, file_size, sha256, mode=mode)
+    except UploadQueueFullError as e:
+        discard_excel_upload(file_path)
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
 
     # 4. 결과 반환
     return {
-        "status": "success",
-        "message": "엑셀 파일 업로드 및 변환 완료",
-        "row_count": result["row_count"],
-    }
\ No newline at end of file
+        "status": "accepted",
+        "message": "엑셀 파일 변환 작업이 등록되었습니다",
+        "job_id": job.job_id,
+        "job": job,
+    }
+
+
+@upload_router.get("/jobs/{job_id}", response_model=UploadJobStatus)
+def get_upload_job_status(job_id: str):
+    """업로드 변환 작업 상태 조회"""
+    return get_upload_job(job_id)
@@ -0,0 +1,217 @@
+"""
+업로드 변환 백그라운드 작업
+
+엑셀 변환은 CPU/디스크 작업이라 이벤트 루프에서 실행하면 다른 요청이 모두 멈추므로,
+크기가 제한된 스레드 풀에서 실행하고 작업 ID로 진행 상태를 조회합니다.
+
+작업은 등록한 워커의 스레드 풀에서 실행되고, 상태는 바뀔 때마다 사용자 업로드 디렉토리의
+작업별 JSON 파일에도 저장하므로 여러 uvicorn 워커 중 어느 워커로 조회해도 같은 상태를 받습니다.
+(대기 작업 수 제한은 워커별, 실행 중 워커가 종료된 작업은 조회 시 실패로 표시)
+"""
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from src.core.config.settings import UPLOAD_JOB_HISTORY_SIZE, UPLOAD_MAX_PENDING_JOBS, UPLOAD_MAX_WORKERS
+from src.core.context.user_context import resolve_user_id
+from src.features.upload.model.upload_job import UploadJobStatus
+from src.features.upload.repository.upload_repository import (
+    load_upload_job_state,
+    prune_upload_job_states,
+    save_upload_job_state,
+)
+from src.features.upload.service.upload_service import UploadMode, process_excel_upload
+
+logger = logging.getLogger(__name__)
+
+_executor: ThreadPoolExecutor | None = None
+_lock = threading.Lock()
+_jobs: "OrderedDict[str, UploadJobStatus]" = OrderedDict()
+
+# 실행하던 워커가 종료된 작업의 실패 사유
+WORKER_EXITED_MESSAGE = "작업을 실행하던 서버 프로세스가 종료되었습니다. 다시 업로드해주세요."
+
+
+class UploadQueueFullError(Exception):
+    """대기 중인 업로드 작업이 너무 많음"""
+
+
+# --------------------------------
+# public functions
+# --------------------------------
+def submit_upload_job(
+    filename: str,
+    file_path: Path,
+    file_size: int,
+    sha256: str,
+    user_id: str | None = None,
+    mode: UploadMode = "replace",
+) -> UploadJobStatus:
+    """저장된 업로드 파일의 변환 작업 등록 (즉시 반환)
+
+    Raises:
+        UploadQueueFullError: 대기 중인 작업 수가 한도를 넘은 경우
+    """
+    user_id = resolve_user_id(user_id)
+    job = UploadJobStatus(
+        job_id=uuid.uuid4().hex,
+        user_id=user_id,
+        filename=filename,
+        file_path=file_path,
+        file_size=file_size,
+        sha256=sha256,
+        mode=mode,
+        created_at=datetime.now(),
+    )
+
+    with _lock:
+        pending = sum(1 for j in _jobs.values() if j.state in ("queued", "running"))
+        if pending >= UPLOAD_MAX_PENDING_JOBS:
+            raise UploadQueueFullError(f"처리 중인 업로드가 너무 많습니다 ({pending}건). 잠시 후 다시 시도해주세요.")
+        _jobs[job.job_id] = job
+        _prune_finished_jobs()
+
+    _save_job(job)
+    prune_upload_job_states(user_id, keep=UPLOAD_JOB_HISTORY_SIZE)
+    _get_executor().submit(_run_upload_job, job.job_id)
+    logger.info(f"업로드 작업 등록: {job.job_id} ({filename}, user={user_id})")
+    return job.model_copy()
+
+
+def get_upload_job(job_id: str, user_id: str | None = None) -> UploadJobStatus:
+    """업로드 작업 상태 조회
+
+    Raises:
+        FileNotFoundError: 작업이 없거나 다른 사용자의 작업인 경우
+    """
+    user_id = resolve_user_id(user_id)
+    with _lock:
+        job = _jobs.get(job_id)
+        if job is not None and job.user_id == user_id:
+            return job.model_copy()
+
+    # 다른 워커가 등록한 작업 (또는 이 워커에서 정리된 완료 작업)
+    state = load_upload_job_state(user_id, job_id)
+    if state is None:
+        raise FileNotFoundError(f"업로드 작업을 찾을 수 없습니다: {job_id}")
+    job = UploadJobStatus.model_validate(state)
+    if job.state in ("queued", "running") and not _is_worker_alive(state.get("worker_pid")):
+        job.state, job.error = "failed", WORKER_EXITED_MESSAGE
+    return job
+
+
+def shutdown_upload_jobs() -> None:
+    """앱 종료 시 대기 중인 작업 취소 및 실행 중인 작업 완료 대기"""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+# --------------------------------
+# private functions
+# --------------------------------
+def _get_executor() -> ThreadPoolExecutor:
+    """작업 스레드 풀 조회 (없으면 생성)"""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS, thread_name_prefix="upload-job")
+        return _executor
+
+
+def _run_upload_job(job_id: str) -> None:
+    """작업 실행 (스레드 풀)"""
+    job = _update_job(job_id, state="running", started_at=datetime.now())
+    job_started = time.perf_counter()
+
+    def on_progress(progress: float, rows_processed: int) -> None:
+        _update_job(job_id, progress=round(progress, 4), rows_processed=rows_processed)
+
+    try:
+        result = process_excel_upload(
+            job.file_path,
+            user_id=job.user_id,
+            mode=job.mode,
+            on_progress=on_progress,
+        )
+        _update_job(
+            job_id,
+            state="succeeded",
+            progress=1.0,
+            rows_processed=result["row_count"],
+            row_count=result["row_count"],
+            inserted_count=result["inserted_count"],
+            skipped_count=result["skipped_count"],
+            rows_per_second=result["rows_per_second"],
+        )
+    except Exception as e:
+        # process_excel_upload에서 상세 로그를 남기므로 상태만 기록
+        _update_job(job_id, state="failed", error=str(e))
+    finally:
+        _update_job(
+            job_id,
+            finished_at=datetime.now(),
+            elapsed_seconds=round(time.perf_counter() - job_started, 3),
+        )
+
+
+def _update_job(job_id: str, **fields) -> UploadJobStatus:
+    """작업 상태 갱신 후 복사본 반환 (상태 파일도 갱신)"""
+    with _lock:
+        job = _jobs[job_id]
+        for key, value in fields.items():
+            setattr(job, key, value)
+        if "started_at" in fields:
+            job.queue_seconds = round((job.started_at - job.created_at).total_seconds(), 3)
+        job = job.model_copy()
+
+    # 한 작업의 상태는 그 작업을 실행하는 스레드만 갱신하므로 락 밖에서 저장
+    _save_job(job)
+    return job
+
+
+def _save_job(job: UploadJobStatus) -> None:
+    """작업 상태 파일 저장 (응답에서 제외되는 필드와 실행 중인 워커 포함)"""
+    state = {
+        **job.model_dump(mode="json"),
+        "user_id": job.user_id,
+        "file_path": str(job.file_path),
+        "worker_pid": os.getpid(),
+    }
+    try:
+        save_upload_job_state(job.user_id, job.job_id, state)
+    except OSError as e:
+        # 상태 파일을 쓰지 못해도 변환은 계속 (이 워커에서는 메모리 상태로 조회 가능)
+        logger.warning(f"업로드 작업 상태 저장 실패: {job.job_id} ({e})")
+
+
+def _is_worker_alive(pid: int | None) -> bool:
+    """작업을 실행하던 워커 프로세스가 살아 있는지 확인
+
+    이 프로세스의 작업이면 메모리에서 먼저 찾으므로, 여기까지 왔다면
+    같은 PID를 이어받은 새 프로세스이거나 정리된 작업으로 보고 종료된 것으로 판단합니다.
+    """
+    if pid is None or pid == os.getpid():
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:  # 다른 사용자의 프로세스 (살아 있음)
+        return True
+    return True
+
+
+def _prune_finished_jobs() -> None:
+    """오래된 완료 작업 삭제 (_lock 보유 상태에서 호출)"""
+    finished = [job_id for job_id, job in _jobs.items() if job.state in ("succeeded", "failed")]
+    for job_id in finished[:max(0, len(finished) - UPLOAD_JOB_HISTORY_SIZE)]:
+        del _jobs[job_id]
@@ -1,79 +1,276 @@
+import numpy as np
 import pandas as pd
+import tempfile
+import time
 from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, Literal
 import logging
 
 from src.core.config.paths import PROCESSED_DATA_DIR
-from src.features.upload.repository.upload_repository import read_excel_to_dataframe, save_dataframe_to_parquet, save_uploaded_file
+from src.core.context.user_context import resolve_user_id
+from src.core.utils.date_utils import get_month_date_range
+from src.features.transaction.repository.transaction_repository import (
+    load_transactions,
+    replace_transaction_partitions,
+    save_transaction_partitions,
+    transaction_write_lock,
+)
+from src.features.upload.repository.upload_repository import (
+    MonthlyStagingWriter,
+    estimate_excel_row_count,
+    iter_excel_chunks,
+    remove_uploaded_file,
+    save_uploaded_file,
+)
+from src.features.upload.util.file_validation import validate_file_extension
+from src.features.upload.util.row_hash import compute_row_hash, fill_missing_row_hash
 
 
 logger = logging.getLogger(__name__)
 
+# replace: 기존 데이터셋을 업로드 파일로 전체 교체 (기본값)
+# merge: 기존 데이터셋에 없는 거래만 추가 (기존 ID/수정 내역 유지)
+UploadMode = Literal["replace", "merge"]
+
+# 진행률 콜백 (진행률 0.0 ~ 1.0, 처리한 행 수)
+ProgressCallback = Callable[[float, int], None]
+
+# 엑셀 읽기 단계가 전체 진행률에서 차지하는 비율 (나머지는 파티션 저장 단계)
+_READ_PHASE_WEIGHT = 0.8
+
 
 # ----------------------------------------------------------------
 # public functions
 # ----------------------------------------------------------------
-def process_excel_upload(filename: str, content: bytes) -> dict:
-    """엑셀 파일 업로드 처리 (검증 → 저장 → 변환)"""
+def save_excel_upload(
+    filename: str,
+    stream: BinaryIO,
+    user_id: str | None = None,
+) -> tuple[Path, str, int]:
+    """업로드 파일을 디스크에 스트리밍 저장 (검증 → 저장)
+
+    Returns:
+        (저장 경로, SHA-256 hex, 바이트 수)
+    """
+    user_id = resolve_user_id(user_id)
+    validate_file_extension(filename)
+
+    file_path, sha256, size = save_uploaded_file(user_id, filename, stream)
+    logger.info(f"업로드 파일 저장: {file_path.name} ({size:,} bytes, user={user_id})")
+    return file_path, sha256, size
+
+
+def discard_excel_upload(file_path: Path) -> None:
+    """변환 작업을 등록하지 못한 업로드 파일 삭제"""
+    remove_uploaded_file(file_path)
+    logger.info(f"업로드 파일 삭제: {file_path.name}")
+
+
+def process_excel_upload(
+    excel_file_path: Path,
+    user_id: str | None = None,
+    mode: UploadMode = "replace",
+    on_progress: ProgressCallback | None = None,
+) -> dict:
+    """저장된 엑셀 파일 변환 처리"""
     try:
-        logger.info(f"엑셀 파일 업로드 시작: {filename}")
+        user_id = resolve_user_id(user_id)
+        logger.info(f"엑셀 파일 변환 시작: {excel_file_path.name} (user={user_id}, mode={mode})")
         
-        # 1. 파일 저장
-        excel_file_path = save_uploaded_file(filename, content)
-        
-        # 2. Parquet 변환
-        result = _process_excel_to_parquet(excel_file_path)
-
-        # 3. 결과 반환
-        return result
+        # Parquet 변환
+        return _process_excel_to_parquet(excel_file_path, user_id, mode, on_progress)
  
     except Exception as e:
-        logger.error(f"엑셀 업로드 실패: {filename} - {e}", exc_info=True)
+        logger.error(f"엑셀 업로드 실패: {excel_file_path.name} - {e}", exc_info=True)
         raise
 
 
 # ----------------------------------------------------------------
 # private functions (비즈니스 로직)
 # ----------------------------------------------------------------
-def _process_excel_to_parquet(excel_file_path: Path, sheet_name: int = 1) -> dict:
-    """엑셀 파일을 Parquet로 변환"""
+def _process_excel_to_parquet(
+    excel_file_path: Path,
+    user_id: str,
+    mode: UploadMode,
+    on_progress: ProgressCallback | None = None,
+    sheet_name: int = 1,
+) -> dict:
+    """엑셀 파일을 사용자별 월 파티션 Parquet로 변환 (스트리밍)
+
+    1. 엑셀을 청크 단위로 읽어 가공한 뒤 월별 staging parquet에 row group으로 추가
+    2. staging 파일을 한 달씩 읽어 정렬/ID/해시 부여 후 파티션에 저장
+
+    메모리 사용량은 파일 전체가 아니라 (청크 크기 + 가장 큰 월의 거래 수)에 비례합니다.
+    """
     try:
         logger.info(f"엑셀 파일 '{excel_file_path.name}' 변환 시작")
-    
-        # 엑셀 파일 읽기 (Repository)
-        df = read_excel_to_dataframe(excel_file_path, sheet_name)
-        
-        # 데이터 가공 (비즈니스 로직)
-        df = _process_transaction_data(df)
-        
-        # DataFrame → Parquet (Repository)
-        output_path = PROCESSED_DATA_DIR / "transactions.parquet"
-        save_dataframe_to_parquet(df, output_path)
-        
-        logger.info(f"변환 완료: {len(df)}행 → {output_path}")
+        started_at = time.perf_counter()
+        row_count = 0
+        estimated_rows = estimate_excel_row_count(excel_file_path, sheet_name)
+        report = on_progress or (lambda progress, rows: None)
+
+        with tempfile.TemporaryDirectory(prefix="staging-", dir=PROCESSED_DATA_DIR) as staging_dir:
+            # 엑셀 → 월별 staging parquet (Repository)
+            with MonthlyStagingWriter(Path(staging_dir)) as writer:
+                for chunk in iter_excel_chunks(excel_file_path, sheet_name):
+                    # 데이터 가공 (비즈니스 로직)
+                    writer.write(_process_transaction_chunk(chunk, first_row=row_count + 1))
+                    row_count += len(chunk)
+                    if estimated_rows:
+                        report(min(row_count / estimated_rows, 1.0) * _READ_PHASE_WEIGHT, row_count)
+            report(_READ_PHASE_WEIGHT, row_count)
+
+            # staging → 월별 파티션 Parquet (Repository)
+            def on_month_stored(done: int, total: int) -> None:
+                report(_READ_PHASE_WEIGHT + (1 - _READ_PHASE_WEIGHT) * done / total, row_count)
+
+            # 다른 수정/업로드와 겹치지 않도록 저장 단계 전체를 데이터셋 락 안에서 수행
+            with transaction_write_lock(user_id):
+                inserted_count = _store_staged_months(writer.staged_files, user_id, mode, on_month_stored)
+
+        elapsed = time.perf_counter() - started_at
+        rows_per_second = int(row_count / elapsed) if elapsed > 0 else row_count
+        logger.info(
+            f"변환 완료: {row_count}행 중 {inserted_count}행 저장 → user={user_id} ({mode}), "
+            f"{elapsed:.2f}초, {rows_per_second:,}행/초"
+        )
 
         # 결과 반환
         return {
-            "row_count": len(df),
+            "row_count": row_count,
+            "inserted_count": inserted_count,
+            "skipped_count": row_count - inserted_count,
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": rows_per_second,
         }
     except Exception as e:
         logger.error(f"엑셀 변환 실패: {excel_file_path.name} - {e}", exc_info=True)
         raise
 
-def _process_transaction_data(df: pd.DataFrame) -> pd.DataFrame:
-    """거래 데이터 가공"""
-    # 거래일시 생성
-    df['거래일시'] = pd.to_datetime(df['날짜'], unit='ms') + pd.to_timedelta(df['시간'].astype(str))
+def _process_transaction_chunk(df: pd.DataFrame, first_row: int = 1) -> pd.DataFrame:
+    """거래 데이터 청크 가공 (first_row: 청크 첫 거래의 순번, 오류 메시지용)
+
+    문자열 컬럼의 타입 통일은 staging writer가 스키마에 맞춰 수행합니다.
+    """
+    # 거래일시 생성 (날짜가 epoch ms 숫자인 경우도 지원)
+    dates = df['날짜']
+    if pd.api.types.is_numeric_dtype(dates):
+        dates = pd.to_datetime(dates, unit='ms')
+    else:
+        dates = pd.to_datetime(dates)
+    df['거래일시'] = dates + pd.to_timedelta(df['시간'].astype(str))
+    
+    # 금액은 정수로 통일 (소수점이 있는 금액은 잘라내지 않고 거부)
+    df['금액'] = _parse_amounts(df['금액'], first_row)
     
     # 컬럼 재정렬
     other_cols = [col for col in df.columns if col not in ['거래일시', '날짜', '시간']]
-    df = df[['거래일시'] + other_cols]
-    
-    # ID 컬럼 추가
+    return df[['거래일시'] + other_cols]
+
+
+def _parse_amounts(values: pd.Series, first_row: int) -> pd.Series:
+    """금액 컬럼을 정수로 변환
+
+    Raises:
+        ValueError: 비어 있거나, 숫자가 아니거나, 소수점이 있는 금액이 있는 경우 (몇 번째 거래인지 포함)
+    """
+    amounts = pd.to_numeric(values, errors='coerce')
+    invalid = ~np.isfinite(amounts) | (amounts % 1 != 0)
+    if invalid.any():
+        position = int(np.flatnonzero(invalid.to_numpy())[0])
+        value = values.iloc[position]
+        if pd.isna(value):
+            raise ValueError(f"금액이 비어 있는 거래가 있습니다 ({first_row + position}번째 거래). 엑셀 파일을 확인해주세요.")
+        raise ValueError(f"{first_row + position}번째 거래의 금액이 정수가 아닙니다: {value!r}. 엑셀 파일을 확인해주세요.")
+    return amounts.astype('int64')
+
+
+def _prepare_month_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """한 달치 거래 정렬 및 자연키 해시 추가"""
     df = df.sort_values("거래일시", ascending=False).reset_index(drop=True)
-    df['id'] = (len(df) - 1) - df.index
-    
-    # ID 컬럼을 첫 번째 위치로 이동
-    cols = ['id'] + [col for col in df.columns if col != 'id']
-    df = df[cols]
     
-    return df
\ No newline at end of file
+    # 자연키 해시 추가 (병합 시 중복 판별용, 수정해도 바뀌지 않음)
+    df['row_hash'] = compute_row_hash(df)
+    return df
+
+
+def _store_staged_months(
+    staged_files: list[tuple[tuple[int, int], Path]],
+    user_id: str,
+    mode: UploadMode,
+    on_month_stored: Callable[[int, int], None] | None = None,
+) -> int:
+    """월별 staging 파일을 오래된 월부터 한 달씩 파티션에 저장
+
+    merge 모드에서는 같은 월의 기존 파티션과 자연키 해시를 비교하여
+    신규 거래만 추가하고, 신규 거래가 있는 월의 파티션만 다시 저장합니다.
+    기존 거래의 ID와 수정 내역은 그대로 유지되고, 데이터셋 버전은 업로드당 한 번만 갱신됩니다.
+
+    replace 모드에서는 모든 월을 새 데이터셋으로 쓴 뒤 기존 데이터셋과 연도 디렉토리별로 교체합니다.
+    (저장/교체 도중 실패하면 기존 데이터셋이 그대로 남음)
+
+    Returns:
+        저장된 거래 건수
+    """
+    inserted_counts: list[int] = []
+    months = _iter_month_rows(staged_files, user_id, mode, inserted_counts, on_month_stored)
+    if mode == "replace":
+        replace_transaction_partitions(months, user_id)
+    else:
+        save_transaction_partitions(months, [key for key, _ in staged_files], user_id)
+    return sum(inserted_counts)
+
+
+def _iter_month_rows(
+    staged_files: list[tuple[tuple[int, int], Path]],
+    user_id: str,
+    mode: UploadMode,
+    inserted_counts: list[int],
+    on_month_stored: Callable[[int, int], None] | None = None,
+) -> Iterator[pd.DataFrame]:
+    """월별로 저장할 거래 생성 (신규 거래가 없는 월은 건너뜀)
+
+    신규 거래에는 오래된 거래부터 증가하도록 ID를 부여합니다.
+    (replace: 0부터, merge: 기존 최대 ID 다음부터)
+
+    Args:
+        inserted_counts: 월별 신규 거래 수를 추가할 목록
+    """
+    next_id = 0
+    if mode == "merge":
+        existing_all = load_transactions(user_id=user_id, columns=['id'])
+        if not existing_all.empty:
+            next_id = int(existing_all['id'].max()) + 1
+        del existing_all
+
+    for stored_months, ((year, month), path) in enumerate(staged_files):
+        if on_month_stored:
+            on_month_stored(stored_months, len(staged_files))
+        month_df = _prepare_month_rows(pd.read_parquet(path))
+        
+        # 같은 월의 기존 거래 로드 (replace 모드는 기존 데이터 무시)
+        existing = pd.DataFrame()
+        if mode == "merge":
+            existing = load_transactions(*get_month_date_range(year, month), user_id=user_id)
+        
+        # 신규 거래 판별
+        if not existing.empty:
+            # 해시가 없는 기존 거래는 현재 값으로 계산하여 이번 저장에 함께 기록
+            # (기존 단일 파일 데이터는 이관 시 채워 두므로 여기까지 오는 거래는 드묾)
+            existing = fill_missing_row_hash(existing)
+            new_rows = month_df[~month_df['row_hash'].isin(existing['row_hash'])]
+        else:
+            new_rows = month_df
+        if new_rows.empty:
+            continue
+
+        # 신규 거래 ID 부여 (오래된 거래부터 증가, ID 컬럼은 첫 번째 위치)
+        new_rows = new_rows.assign(id=next_id + len(new_rows) - 1 - pd.RangeIndex(len(new_rows)))
+        new_rows = new_rows[['id'] + [col for col in new_rows.columns if col != 'id']]
+        next_id += len(new_rows)
+        inserted_counts.append(len(new_rows))
+
+        # 해당 월 파티션 (기존 거래 + 신규 거래)
+        if not existing.empty:
+            new_rows = pd.concat([existing, new_rows], ignore_index=True)
+        yield new_rows
@@ -1,5 +1,10 @@
 ALLOWED_EXCEL_EXTENSIONS = {".xlsx", ".xls"}
-# MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
+MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
+
+
+class FileTooLargeError(ValueError):
+    """업로드 파일 크기 초과"""
+
 
 def validate_file_extension(filename: str) -> None:
     """파일 확장자 검증"""
@@ -12,4 +17,10 @@ def validate_file_extension(filename: str) -> None:
     if ext not in ALLOWED_EXCEL_EXTENSIONS:
         raise ValueError(f"허용되지 않는 파일 형식입니다. 허용: {', '.join(ALLOWED_EXCEL_EXTENSIONS)}")
 
-# TODO: 파일 크기 검증, 경로 순회 공격 방지
\ No newline at end of file
+
+def validate_file_size(size: int | None, max_size: int = MAX_FILE_SIZE) -> None:
+    """파일 크기 검증 (스트리밍 중 누적 크기로도 호출)"""
+    if size is not None and size > max_size:
+        raise FileTooLargeError(f"파일 크기가 너무 큽니다. 최대 {max_size // (1024 * 1024)}MB까지 업로드할 수 있습니다.")
+
+# TODO: 경로 순회 공격 방지
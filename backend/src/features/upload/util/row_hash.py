@@ -0,0 +1,43 @@
+"""거래내역 행 식별 해시 (자연키 기반)"""
+import pandas as pd
+
+# 거래를 식별하는 자연키 컬럼
+NATURAL_KEY_COLUMNS = ["거래일시", "금액", "내용", "결제수단"]
+
+
+def compute_row_hash(df: pd.DataFrame) -> pd.Series:
+    """자연키(거래일시, 금액, 내용, 결제수단)로 행 해시 계산
+
+    자연키가 완전히 같은 거래가 여러 건이면 등장 순서(0, 1, ...)를 함께 해싱하여
+    서로 다른 해시를 부여합니다. 같은 엑셀을 다시 올려도 같은 해시가 나옵니다.
+    """
+    keys = pd.DataFrame({
+        "거래일시": df["거래일시"],
+        # 결측치 유무에 따라 int/float 타입이 달라져도 같은 해시가 나오도록 통일
+        "금액": df["금액"].astype("float64"),
+        "내용": df["내용"].astype("string"),
+        "결제수단": df["결제수단"].astype("string"),
+    })
+    keys["occurrence"] = keys.groupby(NATURAL_KEY_COLUMNS, dropna=False, sort=False).cumcount()
+    return pd.util.hash_pandas_object(keys, index=False)
+
+
+def fill_missing_row_hash(df: pd.DataFrame) -> pd.DataFrame:
+    """row_hash가 없는 행(해시 도입 이전 데이터)에 현재 값의 자연키 해시를 채움
+
+    해시는 원래 값으로 계산해야 수정 후에도 같은 거래로 판별되므로,
+    수정 내역이 쌓이기 전(기존 파일 이관 시점)에 채워서 저장해야 합니다.
+    자연키 컬럼이 없으면 그대로 반환합니다.
+    """
+    if df.empty or not set(NATURAL_KEY_COLUMNS).issubset(df.columns):
+        return df
+    if "row_hash" not in df.columns:
+        return df.assign(row_hash=compute_row_hash(df))
+    missing = df["row_hash"].isna()
+    if not missing.any():
+        return df
+    # 같은 자연키의 등장 순서가 유지되도록 전체 행으로 계산한 뒤 빈 행만 채움
+    # (빈 값이 섞인 컬럼은 float이므로 uint64 배열에 채워 해시 정밀도 유지)
+    hashes = compute_row_hash(df).to_numpy(copy=True)
+    hashes[~missing.to_numpy()] = df["row_hash"][~missing].astype("uint64").to_numpy()
+    return df.assign(row_hash=hashes)
@@ -2,18 +2,17 @@ import pandas as pd
 import logging
 
 
-from src.core.utils.dataframe_utils import (
-    filter_by_date_range,
-    filter_expense_only,
-)
-from src.core.utils.date_utils import parse_date_params
-from src.features.transaction.repository.transaction_repository import load_transactions
+from src.features.analysis.common.analysis_frame import load_analysis_frame
 from src.features.user.model.personality import Personality
 from src.features.user.data.personality_types import PERSONALITY_DATA
 
 
 logger = logging.getLogger(__name__)
 
+# 이 분석에서 사용하는 컬럼 (load_analysis_frame에서 이 컬럼만 디코딩)
+REQUIRED_COLUMNS = ["거래일시", "타입", "금액", "거래처"]
+
+
 # ======================= personality type repository =======================
 def get_personality(code: str) -> Personality:
     """코드로 성향 정보 조회"""
@@ -30,14 +29,5 @@ def load_expense_transactions(
     year: int | None = None,
     month: int | None = None
 ) -> pd.DataFrame:
-    """지출 거래 데이터 로드 및 필터링"""
-    # 날짜 파라미터 파싱
-    start_date, end_date = parse_date_params(year, month, None, None)
-    
-    # 데이터 로드
-    df = load_transactions()
-    
-    df = filter_by_date_range(df, start_date, end_date)
-    df = filter_expense_only(df)
-    
-    return df
+    """지출 거래 데이터 로드 및 필터링 (공통 분석 프레임, 시간 데이터 포함)"""
+    return load_analysis_frame(year, month, columns=REQUIRED_COLUMNS).with_columns("hour")
@@ -1,13 +1,18 @@
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException
 import logging
 
+from src.core.cache.conditional_get import conditional_get
+from src.features.transaction.service.transaction_service import fetch_transactions_version
 from src.features.user.service.personality_service import analyze_spending_personality
 
 logger = logging.getLogger(__name__)
 
 personality_router = APIRouter(prefix="/user/personality", tags=["소비 성향"])
 
-@personality_router.get("")
+# 조회 응답 ETag (데이터셋 버전이 같으면 304)
+_dataset_etag = conditional_get(fetch_transactions_version)
+
+@personality_router.get("", dependencies=[Depends(_dataset_etag)])
 def get_spending_personality(
     year: int | None = Query(None, description="조회할 연도"),
     month: int | None = Query(None, ge=1, le=12, description="조회할 월"),
@@ -81,10 +81,7 @@ def _calc_planning_score(df: pd.DataFrame) -> float:
     if df.empty:
         return 0.5
     
-    df = df.copy()
-    
     # 1. 시간 규칙성 (표준편차 낮을수록 규칙적)
-    df["hour"] = df["거래일시"].dt.hour
     hour_std = df["hour"].std()
     
     if pd.isna(hour_std) or hour_std == 0:
@@ -1,6 +1,8 @@
 import logging
 from contextlib import asynccontextmanager
 
+import pandas as pd
+
 # FastAPI
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -10,14 +12,20 @@ from fastapi.responses import HTMLResponse
 from src.core.config.paths import LOG_DIR
 from src.core.config.settings import ALLOWED_ORIGINS
 from src.core.log.logger import configure_logging
+from src.core.cache.dataset_cache import get_cache_stats
+from src.core.context.user_context import UserContextMiddleware
 from src.core.exceptions.http_exceptions import setup_http_exception_handlers
 
 # 로컬 - features (라우터)
 from src.features.upload.router.upload_router import upload_router
+from src.features.upload.service.upload_job_service import shutdown_upload_jobs
+from src.features.transaction.repository.transaction_repository import shutdown_transaction_compaction
 from src.features.analysis.overspending.router.analysis_router import analysis_router
 from src.features.analysis.overspending.router.rule_router import rule_router
 from src.features.transaction.router.transaction_router import transaction_router
 from src.features.analysis.statistic.router.statistic_router import statistic_router
+from src.features.analysis.dashboard.router.dashboard_router import dashboard_router
+from src.features.analysis.dashboard.service.dashboard_service import shutdown_dashboard_executor
 from src.features.saving.router.saving_router import saving_router
 from src.features.user.router.personality_router import personality_router
 from src.features.inquiry.router.inquiry_router import inquiry_router
@@ -29,10 +37,15 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
+    # 데이터셋 캐시가 깊은 복사 없이 스냅샷을 반환하도록 pandas Copy-on-Write 활성화
+    pd.set_option("mode.copy_on_write", True)
     logger.info("앱 시작")
     logger.info(f"로그파일 경로: {LOG_DIR}")
     yield
-    # Shutdown (필요시)
+    # Shutdown
+    shutdown_upload_jobs()
+    shutdown_transaction_compaction()
+    shutdown_dashboard_executor()
 
 # 앱 설정
 app = FastAPI(
@@ -45,6 +58,9 @@ app = FastAPI(
 # 예외 핸들러 등록
 setup_http_exception_handlers(app)
 
+# 요청 헤더(X-User-Id)로 사용자별 데이터셋 선택
+app.add_middleware(UserContextMiddleware)
+
 # Flutter 앱에서 호출할 수 있도록 CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -61,6 +77,7 @@ app.include_router(analysis_router)
 app.include_router(rule_router)
 app.include_router(transaction_router)
 app.include_router(statistic_router)
+app.include_router(dashboard_router)
 app.include_router(saving_router)
 app.include_router(personality_router)
 app.include_router(inquiry_router)
@@ -78,4 +95,4 @@ def root():
 
 @app.get("/health")
 def health_check():
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy", "dataset_cache": get_cache_stats()}
\ No newline at end of file
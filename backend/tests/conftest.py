@@ -0,0 +1,34 @@
+"""공통 테스트 fixture"""
+import uuid
+
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core.context.user_context import USER_ID_HEADER
+from src.features.transaction.repository import partition_storage, transaction_repository
+from src.features.upload.repository import upload_repository
+from src.features.upload.service import upload_service
+from src.main import app
+
+# 앱 시작(lifespan)과 같은 pandas 설정 (TestClient는 lifespan 없이 요청을 보냄)
+pd.set_option("mode.copy_on_write", True)
+
+
+@pytest.fixture
+def user_id(tmp_path, monkeypatch) -> str:
+    """임시 디렉토리에 데이터셋을 두는 테스트 사용자
+
+    데이터셋 버전별 캐시(컬럼 저장소, 분석 프레임)가 테스트 사이에 섞이지 않도록 매번 새 ID를 사용합니다.
+    """
+    monkeypatch.setattr(partition_storage, "TRANSACTIONS_DIR", tmp_path / "transactions")
+    monkeypatch.setattr(transaction_repository, "LEGACY_TRANSACTIONS_PARQUET_PATH", tmp_path / "transactions.parquet")
+    monkeypatch.setattr(upload_service, "PROCESSED_DATA_DIR", tmp_path)
+    monkeypatch.setattr(upload_repository, "RAW_DATA_DIR", tmp_path / "raw")
+    return f"test-{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture
+def client(user_id) -> TestClient:
+    """테스트 사용자로 요청하는 API 클라이언트"""
+    return TestClient(app, headers={USER_ID_HEADER: user_id})
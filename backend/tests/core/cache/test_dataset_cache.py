@@ -0,0 +1,86 @@
+"""데이터셋 캐시 (dataset_cache) 테스트"""
+import subprocess
+import sys
+import threading
+
+import pandas as pd
+import pytest
+
+from src.core.cache import dataset_cache
+from src.core.cache.dataset_cache import get_cached_frame, invalidate_cached_frame
+from src.core.config.paths import BASE_DIR
+
+
+@pytest.fixture
+def parquet_path(tmp_path):
+    path = tmp_path / "part-0.parquet"
+    pd.DataFrame({"id": [1, 2, 3], "금액": [-1000, -2000, -3000]}).to_parquet(path, index=False)
+    yield path
+    invalidate_cached_frame(path)
+
+
+def test_snapshot_changes_do_not_reach_cached_frame(parquet_path):
+    snapshot = get_cached_frame(parquet_path, lambda: pd.read_parquet(parquet_path))
+    snapshot.loc[0, "금액"] = 0
+    snapshot["추가"] = 1
+
+    cached = get_cached_frame(parquet_path, lambda: pytest.fail("다시 로드하면 안 됨"))
+    assert cached["금액"].tolist() == [-1000, -2000, -3000]
+    assert "추가" not in cached.columns
+
+
+def test_importing_cache_keeps_pandas_options():
+    # 캐시를 불러오는 것만으로 프로세스 전역 pandas 옵션을 바꾸지 않음 (새 프로세스에서 확인)
+    code = "import pandas as pd; import src.core.cache.dataset_cache; print(pd.get_option('mode.copy_on_write'))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=BASE_DIR, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+
+def test_snapshot_is_isolated_without_copy_on_write(parquet_path):
+    with pd.option_context("mode.copy_on_write", False):
+        snapshot = get_cached_frame(parquet_path, lambda: pd.read_parquet(parquet_path))
+        snapshot.loc[0, "금액"] = 0
+
+        cached = get_cached_frame(parquet_path, lambda: pytest.fail("다시 로드하면 안 됨"))
+    assert cached["금액"].tolist() == [-1000, -2000, -3000]
+
+
+def test_load_locks_are_released_after_loading(tmp_path):
+    paths = []
+    for i in range(5):
+        path = tmp_path / f"{i}.parquet"
+        pd.DataFrame({"id": [i]}).to_parquet(path, index=False)
+        paths.append(path)
+        get_cached_frame(path, lambda path=path: pd.read_parquet(path))
+
+    def failing_loader():
+        raise ValueError("손상된 파일")
+
+    with pytest.raises(ValueError):
+        get_cached_frame(paths[0], failing_loader, variant=("실패",))
+
+    assert not any(key[0] in paths for key in dataset_cache._load_locks)
+    for path in paths:
+        invalidate_cached_frame(path)
+
+
+def test_concurrent_misses_load_once(parquet_path):
+    loads = []
+    started = threading.Barrier(4)
+
+    def loader():
+        loads.append(1)
+        return pd.read_parquet(parquet_path)
+
+    def worker():
+        started.wait()
+        get_cached_frame(parquet_path, loader, variant=("동시",))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loads) == 1
+    assert not any(key[0] == parquet_path for key in dataset_cache._load_locks)
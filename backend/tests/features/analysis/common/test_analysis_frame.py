@@ -0,0 +1,89 @@
+"""분석 프레임 (analysis_frame) 컬럼 프로젝션 테스트"""
+import pandas as pd
+import pytest
+
+from src.features.analysis.common import analysis_frame
+from src.features.analysis.common.analysis_frame import load_analysis_frame
+from src.features.analysis.dashboard.service.dashboard_service import SHARED_FRAME_COLUMNS
+from src.features.analysis.overspending.service import overspending_service, recurring_service, time_analysis_service
+from src.features.saving.service import saving_service
+from src.features.transaction.repository.transaction_repository import replace_transaction_partitions
+from src.features.user.repository import personality_repository
+
+
+@pytest.fixture
+def dataset(user_id) -> str:
+    """1~2월 지출/수입 거래 (분석에서 사용하지 않는 메모/소분류 포함)"""
+    dates = pd.to_datetime(["2024-01-05 09:00", "2024-01-06 22:00", "2024-01-20 12:00", "2024-02-03 09:00"])
+    df = pd.DataFrame({
+        "id": range(4),
+        "거래일시": dates,
+        "타입": ["지출", "지출", "수입", "지출"],
+        "대분류": ["식사", "교통", "급여", "식사"],
+        "소분류": "기타",
+        "내용": ["김밥천국", "카카오택시", "회사", "김밥천국"],
+        "금액": [-8000, -15000, 3000000, -9000],
+        "결제수단": "카드",
+        "메모": "긴 메모",
+    })
+    replace_transaction_partitions([df], user_id)
+    return user_id
+
+
+@pytest.fixture
+def loads(monkeypatch) -> list[tuple]:
+    """분석 프레임이 load_transactions로 읽은 (시작일, 종료일, 컬럼) 기록"""
+    calls = []
+    original = analysis_frame.load_transactions
+
+    def spy(start_date=None, end_date=None, *, user_id=None, columns=None):
+        calls.append((start_date, end_date, tuple(sorted(columns)) if columns is not None else None))
+        return original(start_date, end_date, user_id=user_id, columns=columns)
+
+    monkeypatch.setattr(analysis_frame, "load_transactions", spy)
+    return calls
+
+
+@pytest.mark.parametrize("columns", [
+    overspending_service.REQUIRED_COLUMNS,
+    recurring_service.REQUIRED_COLUMNS,
+    time_analysis_service.REQUIRED_COLUMNS,
+    saving_service.REQUIRED_COLUMNS,
+])
+def test_service_frame_decodes_only_required_columns(dataset, columns):
+    frame = load_analysis_frame(2024, 1, user_id=dataset, columns=columns)
+
+    assert set(frame.transactions.columns) == {"id", *columns}
+    assert len(frame.transactions) == 3
+    assert frame.expenses["금액"].tolist() == [15000, 8000]
+
+
+def test_missing_optional_column_is_ignored(dataset):
+    # 거래처는 파일에 없는 선택 컬럼
+    frame = load_analysis_frame(2024, 1, user_id=dataset, columns=personality_repository.REQUIRED_COLUMNS)
+
+    assert set(frame.transactions.columns) == {"id", "거래일시", "타입", "금액"}
+
+
+def test_narrower_request_reuses_wider_frame(dataset, loads):
+    wide = load_analysis_frame(2024, 1, user_id=dataset, columns=recurring_service.REQUIRED_COLUMNS)
+
+    assert load_analysis_frame(2024, 1, user_id=dataset, columns=time_analysis_service.REQUIRED_COLUMNS) is wide
+    assert len(loads) == 1
+
+    # 캐시된 프레임에 없는 컬럼을 요청하면 새로 로드
+    full = load_analysis_frame(2024, 1, user_id=dataset)
+    assert full is not wide
+    assert "메모" in full.transactions.columns
+    assert load_analysis_frame(2024, 1, user_id=dataset, columns=["거래일시", "메모"]) is full
+    assert [columns for _, _, columns in loads] == [tuple(sorted(recurring_service.REQUIRED_COLUMNS)), None]
+
+
+def test_dashboard_sections_share_one_month_frame(client, dataset, loads):
+    response = client.get("/analysis/dashboard", params={"year": 2024, "month": 1})
+
+    assert response.status_code == 200
+    assert all(section["error"] is None for section in response.json()["sections"].values())
+    month_loads = [columns for start_date, end_date, columns in loads if (start_date, end_date) != (None, None)]
+    assert month_loads == [tuple(SHARED_FRAME_COLUMNS)]
+    assert "메모" not in SHARED_FRAME_COLUMNS
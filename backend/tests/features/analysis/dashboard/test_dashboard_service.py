@@ -0,0 +1,112 @@
+"""대시보드 분석 (dashboard_service) 테스트
+
+항목별 결과가 개별 분석 API와 같은지, 항목 하나가 실패해도 나머지 결과와 실행 시간이 반환되는지 확인합니다.
+"""
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.analysis.dashboard.service import dashboard_service
+from src.features.analysis.dashboard.service.dashboard_service import SECTION_NAMES, UNEXPECTED_ERROR_MESSAGE
+from src.features.transaction.repository.transaction_repository import replace_transaction_partitions
+
+PARAMS = {"year": 2024, "month": 2}
+
+# 항목 → 같은 결과를 주는 개별 분석 API
+SECTION_ENDPOINTS = {
+    "monthly_stats": "/analysis/statistic/monthly",
+    "overspending": "/analysis/overspending",
+    "recurring": "/analysis/recurring",
+    "time_based": "/analysis/time-based",
+    "personality": "/user/personality",
+    "savings": "/saving/opportunities",
+}
+
+
+@pytest.fixture
+def dataset(user_id) -> str:
+    """1~2월 매일 점심/야식/택시 지출과 월급 수입"""
+    rng = np.random.default_rng(0)
+    days = pd.date_range("2024-01-01", "2024-02-29", freq="D")
+    rows = []
+    for day in days:
+        rows.append((day + pd.Timedelta(hours=12), "지출", "식사", "김밥천국", -int(rng.integers(5, 12)) * 1000))
+        rows.append((day + pd.Timedelta(hours=23), "지출", "식사", "배달의민족", -int(rng.integers(15, 30)) * 1000))
+        if day.dayofweek >= 5:
+            rows.append((day + pd.Timedelta(hours=1), "지출", "교통", "카카오택시", -25000))
+    rows += [(pd.Timestamp(f"2024-{month:02d}-25 09:00"), "수입", "급여", "회사", 3_000_000) for month in (1, 2)]
+    df = pd.DataFrame(rows, columns=["거래일시", "타입", "대분류", "내용", "금액"]).assign(
+        id=lambda frame: np.arange(len(frame)), 결제수단="카드",
+    )
+    replace_transaction_partitions([df], user_id)
+    return user_id
+
+
+def test_sections_match_individual_analysis_apis(client, dataset):
+    body = client.get("/analysis/dashboard", params=PARAMS).json()
+
+    assert body["month"] == "2024-02"
+    assert list(body["sections"]) == SECTION_NAMES
+    for name, endpoint in SECTION_ENDPOINTS.items():
+        section = body["sections"][name]
+        assert section["error"] is None, name
+        assert section["data"] == client.get(endpoint, params=PARAMS).json(), name
+        assert 0 <= section["elapsed_ms"] <= body["elapsed_ms"]
+    assert body["sections"]["recurring"]["data"]["count"] > 0
+
+
+def test_failed_section_does_not_affect_others(client, dataset, monkeypatch):
+    def invalid(**kwargs):
+        raise ValueError("잘못된 조회 조건")
+
+    def broken(**kwargs):
+        raise RuntimeError("내부 상태 오류")
+
+    monkeypatch.setattr(dashboard_service, "analyze_time_based_spending", invalid)
+    monkeypatch.setattr(dashboard_service, "analyze_recurring", broken)
+
+    response = client.get("/analysis/dashboard", params=PARAMS)
+
+    assert response.status_code == 200
+    sections = response.json()["sections"]
+    # 서비스 오류(ValueError)는 사유를, 예상하지 못한 오류는 일반 메시지를 담음 (상세 내용은 로그에만)
+    assert sections["time_based"] == {"data": None, "elapsed_ms": sections["time_based"]["elapsed_ms"], "error": "잘못된 조회 조건"}
+    assert sections["recurring"]["data"] is None
+    assert sections["recurring"]["error"] == UNEXPECTED_ERROR_MESSAGE
+    # 반복 소비 결과가 없으면 절약 기회가 직접 다시 분석
+    assert sections["savings"]["error"] is None
+    assert sections["savings"]["data"] == client.get(SECTION_ENDPOINTS["savings"], params=PARAMS).json()
+    for name in ("monthly_stats", "overspending", "personality"):
+        assert sections[name]["error"] is None
+        assert sections[name]["data"] is not None
+
+
+def test_sections_run_concurrently_with_their_own_timings(client, dataset, monkeypatch):
+    def slow(result):
+        def analyze(*args, **kwargs):
+            time.sleep(0.3)
+            return result
+        return analyze
+
+    monkeypatch.setattr(dashboard_service, "analyze_time_based_spending", slow([]))
+    monkeypatch.setattr(dashboard_service, "analyze_spending_personality", slow(None))
+
+    body = client.get("/analysis/dashboard", params=PARAMS).json()
+
+    sections = body["sections"]
+    assert sections["time_based"]["elapsed_ms"] >= 300
+    assert sections["personality"]["elapsed_ms"] >= 300
+    assert sections["monthly_stats"]["elapsed_ms"] < 300
+    # 두 항목이 동시에 실행되어 전체 시간은 합계보다 짧음
+    assert 300 <= body["elapsed_ms"] < 600
+
+
+def test_shutdown_cancels_executor_and_next_request_recreates_it(client, dataset):
+    client.get("/analysis/dashboard", params=PARAMS)
+    dashboard_service.shutdown_dashboard_executor()
+
+    assert dashboard_service._executor is None
+    body = client.get("/analysis/dashboard", params=PARAMS).json()
+    assert all(section["error"] is None for section in body["sections"].values())
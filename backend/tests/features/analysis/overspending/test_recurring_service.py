@@ -0,0 +1,129 @@
+"""반복 소비 패턴 탐지 (recurring_service) 테스트
+
+벡터화한 _detect_recurring_patterns가 그룹별로 순회하던 기존 구현과 같은 결과를 내는지 확인합니다.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.analysis.common.analysis_frame import AnalysisFrame
+from src.features.analysis.overspending.service.recurring_service import _detect_recurring_patterns
+
+
+# --------------------------------
+# 기존 구현 (그룹별 순회)
+# --------------------------------
+def _reference_time_range(hour) -> str:
+    if 0 <= hour < 6:
+        return "00:00-06:00"
+    elif 6 <= hour < 12:
+        return "06:00-12:00"
+    elif 12 <= hour < 18:
+        return "12:00-18:00"
+    else:
+        return "18:00-24:00"
+
+
+def _reference_patterns(df: pd.DataFrame, min_count: int) -> list[dict]:
+    df = df.assign(time_range=df["hour"].apply(_reference_time_range))
+    patterns = []
+    for (merchant, time_range, category, payment_method), group in df.groupby(["내용", "time_range", "대분류", "결제수단"]):
+        count = len(group)
+        if count < min_count:
+            continue
+        amounts = group["금액"].tolist()
+        dates = sorted(group["거래일시"].dt.date.tolist())
+        days = group["day_name"].unique()
+        patterns.append({
+            "key": f"{merchant}_{time_range}_{category}_{payment_method}",
+            "merchant": merchant,
+            "time_range": time_range,
+            "day_of_week": days[0] if len(days) == 1 else None,
+            "category": category,
+            "payment_method": payment_method,
+            "count": count,
+            "total_amount": int(sum(amounts)),
+            "average_amount": int(sum(amounts) / len(amounts)),
+            "first_date": dates[0].isoformat(),
+            "last_date": dates[-1].isoformat(),
+            "period_days": (dates[-1] - dates[0]).days // (count - 1) if count > 1 else 0,
+            "amounts": amounts,
+        })
+    patterns.sort(key=lambda x: x["total_amount"], reverse=True)
+    return patterns
+
+
+# --------------------------------
+# helpers
+# --------------------------------
+def _make_transactions(n: int, merchants: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    minutes = rng.integers(0, 365 * 24 * 60, n)
+    df = pd.DataFrame({
+        "id": np.arange(n),
+        "거래일시": pd.Timestamp("2024-01-01") + pd.to_timedelta(minutes, unit="min"),
+        "타입": "지출",
+        "내용": [f"가게{i}" for i in rng.integers(0, merchants, n)],
+        "대분류": rng.choice(["식사", "카페/간식", "교통"], n),
+        "결제수단": rng.choice(["카드A", "카드B"], n),
+        "금액": rng.integers(1000, 50000, n),
+    })
+    return df.sort_values("거래일시", ascending=False, ignore_index=True)
+
+
+def _with_null_keys(df: pd.DataFrame) -> pd.DataFrame:
+    """그룹 키(내용/대분류/결제수단)가 빈 행 추가 (엑셀의 빈 칸)"""
+    df = df.copy()
+    df["결제수단"] = df["결제수단"].astype(object)
+    df.loc[df.index[::7], "결제수단"] = None
+    df.loc[df.index[::11], "내용"] = np.nan
+    df.loc[df.index[::13], "대분류"] = None
+    return df
+
+
+def _both(df: pd.DataFrame, min_count: int) -> tuple[list[dict], list[dict]]:
+    frame = AnalysisFrame(df, version=0)
+    expected = _reference_patterns(frame.with_columns("hour", "day_name"), min_count)
+    actual = _detect_recurring_patterns(frame.with_columns("hour", "weekday"), min_count)
+    return expected, actual
+
+
+# --------------------------------
+# tests
+# --------------------------------
+@pytest.mark.parametrize("min_count", [1, 2, 3, 5, 50])
+@pytest.mark.parametrize("n, merchants, seed", [(300, 10, 1), (5000, 800, 2)])
+def test_matches_reference(n, merchants, seed, min_count):
+    expected, actual = _both(_make_transactions(n, merchants, seed), min_count)
+    assert actual == expected
+
+
+@pytest.mark.parametrize("min_count", [1, 3])
+def test_null_grouping_keys_are_excluded(min_count):
+    df = _with_null_keys(_make_transactions(3000, 200, 3))
+    expected, actual = _both(df, min_count)
+    assert actual == expected
+    assert all(pattern["payment_method"] is not None for pattern in actual)
+
+
+def test_all_keys_null_returns_empty():
+    df = _make_transactions(200, 5, 4)
+    df["결제수단"] = None
+    assert _both(df, 1) == ([], [])
+
+
+def test_amounts_keep_row_order_and_single_weekday():
+    df = pd.DataFrame({
+        "id": [1, 2, 3],
+        "거래일시": pd.to_datetime(["2024-03-18 08:00", "2024-03-11 08:30", "2024-03-04 09:00"]),
+        "타입": "지출",
+        "내용": "스타벅스",
+        "대분류": "카페/간식",
+        "결제수단": "카드A",
+        "금액": [4500, 5000, 4000],
+    })
+    expected, actual = _both(df, 3)
+    assert actual == expected
+    assert actual[0]["amounts"] == [4500, 5000, 4000]
+    assert actual[0]["day_of_week"] == "Monday"
+    assert actual[0]["period_days"] == 7
@@ -0,0 +1,120 @@
+"""과소비 규칙 평가 계획 (RulePlan) 테스트
+
+모든 규칙을 한 번에 집계한 결과가 규칙마다 지출을 필터링해서 집계하던 기존 방식과 같은지 확인합니다.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.analysis.common.analysis_frame import AnalysisFrame
+from src.features.analysis.overspending.util.rule_plan import RulePlan
+
+CATEGORIES = ["식사", "카페/간식", "술/유흥", "교통"]
+
+
+# --------------------------------
+# 기존 구현 (규칙별 필터링 후 집계)
+# --------------------------------
+def _reference_filter(df: pd.DataFrame, rule: dict) -> pd.DataFrame:
+    filtered = df[df["대분류"] == rule["category_filter"]]
+    if "time_filter" in rule:
+        start_hour, end_hour = rule["time_filter"]
+        if start_hour > end_hour:
+            mask = (filtered["hour"] >= start_hour) | (filtered["hour"] < end_hour)
+        else:
+            mask = (filtered["hour"] >= start_hour) & (filtered["hour"] < end_hour)
+        filtered = filtered[mask.fillna(False).astype(bool)]
+    return filtered
+
+
+def _reference_stats(df: pd.DataFrame, rule: dict) -> dict | None:
+    filtered = _reference_filter(df, rule)
+    if filtered.empty:
+        return None
+    weekly = filtered.groupby("week").size()
+    monthly = filtered.groupby("month").size()
+    monthly_total = filtered.groupby("month")["금액"].sum()
+    return {
+        "row_count": len(filtered),
+        "total_amount": int(filtered["금액"].sum()),
+        "high_amount_count": int((filtered["금액"] >= rule["per_transaction"]).sum()) if "per_transaction" in rule else 0,
+        "weekly_count": int(weekly.sum()),
+        "high_weeks": int((weekly >= rule["weekly_count"]).sum()) if "weekly_count" in rule else 0,
+        "monthly_count": int(monthly.sum()),
+        "high_count_months": int((monthly >= rule["monthly_count"]).sum()) if "monthly_count" in rule else 0,
+        "high_total_months": int((monthly_total >= rule["monthly_total"]).sum()) if "monthly_total" in rule else 0,
+    }
+
+
+# --------------------------------
+# helpers
+# --------------------------------
+def _make_expenses(n: int, seed: int, missing_dates: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    minutes = rng.integers(0, 365 * 24 * 60, n)
+    df = pd.DataFrame({
+        "id": np.arange(n),
+        "거래일시": pd.Timestamp("2024-01-01") + pd.to_timedelta(minutes, unit="min"),
+        "타입": "지출",
+        "내용": "가게",
+        "대분류": rng.choice(CATEGORIES, n),
+        "결제수단": "카드",
+        "금액": rng.integers(1000, 80000, n),
+    })
+    df = df.sort_values("거래일시", ascending=False, ignore_index=True)
+    df.loc[df.index[:missing_dates], "거래일시"] = pd.NaT
+    return AnalysisFrame(df, version=0).with_columns("hour", "week", "month")
+
+
+def _make_rules(n: int, seed: int) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    rules = []
+    for index in range(n):
+        # 같은 카테고리에 여러 규칙, 규칙에 없는 카테고리 포함
+        rule = {"id": index, "name": f"규칙{index}", "category_filter": str(rng.choice(CATEGORIES + ["없는 카테고리"]))}
+        if rng.random() < 0.5:
+            rule["time_filter"] = [int(rng.integers(0, 25)), int(rng.integers(0, 25))]
+        for key, low, high in [
+            ("per_transaction", 1000, 80000),
+            ("weekly_count", 1, 30),
+            ("monthly_count", 1, 150),
+            ("monthly_total", 10000, 3_000_000),
+        ]:
+            if rng.random() < 0.5:
+                rule[key] = int(rng.integers(low, high))
+        rules.append(rule)
+    return rules
+
+
+def _evaluate(df: pd.DataFrame, rules: list[dict]) -> list[dict | None]:
+    return [None if stats is None else vars(stats) for stats in RulePlan(rules).evaluate(df)]
+
+
+# --------------------------------
+# tests
+# --------------------------------
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("n_rows, missing_dates", [(2000, 0), (500, 40)])
+def test_matches_reference(seed, n_rows, missing_dates):
+    df = _make_expenses(n_rows, seed, missing_dates)
+    rules = _make_rules(25, seed)
+    assert _evaluate(df, rules) == [_reference_stats(df, rule) for rule in rules]
+
+
+def test_overnight_time_filter_and_missing_hour():
+    df = _make_expenses(300, 7, missing_dates=10)
+    rules = [
+        {"id": 1, "name": "야간", "category_filter": "식사", "time_filter": [22, 6], "per_transaction": 30000},
+        {"id": 2, "name": "전체", "category_filter": "식사", "weekly_count": 2},
+    ]
+    expected = [_reference_stats(df, rule) for rule in rules]
+    assert _evaluate(df, rules) == expected
+    # 시간대 필터가 없는 규칙만 거래일시가 없는 행을 포함
+    assert expected[1]["row_count"] == int((df["대분류"] == "식사").sum())
+
+
+def test_no_rules_or_no_rows():
+    df = _make_expenses(100, 8)
+    assert RulePlan([]).evaluate(df) == []
+    rules = _make_rules(3, 8)
+    assert RulePlan(rules).evaluate(df.iloc[:0]) == [None, None, None]
@@ -0,0 +1,125 @@
+"""과소비 규칙 저장소 (rule_repository) 테스트"""
+import json
+import multiprocessing
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.features.analysis.overspending.repository import rule_repository
+from src.main import app
+
+
+def _rule(rule_id: int, category: str) -> dict:
+    return {"id": rule_id, "name": f"규칙{rule_id}", "category_filter": category, "weekly_count": 3}
+
+
+def _write_rules(path, rules: list[dict], version: int, mtime_ns: int | None = None) -> None:
+    path.write_text(json.dumps({"version": version, "rules": rules}, ensure_ascii=False), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def rules_path(tmp_path, monkeypatch):
+    """임시 규칙 파일 (보관 중인 규칙 집합 초기화)"""
+    path = tmp_path / "overspending_rules.json"
+    monkeypatch.setattr(rule_repository, "OVERSPENDING_RULES_PATH", path)
+    monkeypatch.setattr(rule_repository, "OVERSPENDING_RULES_LOCK_PATH", tmp_path / ".overspending_rules.lock")
+    monkeypatch.setattr(rule_repository, "_cached", None)
+    _write_rules(path, [_rule(1, "식사")], version=3, mtime_ns=1_000_000_000)
+    return path
+
+
+def test_hand_edit_without_version_change_reloads_rules(rules_path):
+    state = rule_repository.get_rules_state()
+    assert [rule["category_filter"] for rule in rule_repository.load_rule_set().enabled_rules] == ["식사"]
+
+    # 같은 버전, 같은 크기로 파일만 직접 수정
+    _write_rules(rules_path, [_rule(1, "카페")], version=3, mtime_ns=2_000_000_000)
+
+    rule_set = rule_repository.load_rule_set()
+    assert rule_set.version == 3
+    assert [rule["category_filter"] for rule in rule_set.enabled_rules] == ["카페"]
+    assert rule_repository.get_rules_state() != state
+
+
+def test_unchanged_file_keeps_rule_set_and_state(rules_path):
+    assert rule_repository.load_rule_set() is rule_repository.load_rule_set()
+    assert rule_repository.get_rules_state() == rule_repository.get_rules_state()
+
+
+def test_rules_etag_changes_when_file_is_edited_by_hand(rules_path):
+    client = TestClient(app)
+    first = client.get("/rule/")
+    etag = first.headers["ETag"]
+    assert client.get("/rule/", headers={"If-None-Match": etag}).status_code == 304
+
+    _write_rules(rules_path, [_rule(1, "카페")], version=3, mtime_ns=2_000_000_000)
+
+    second = client.get("/rule/", headers={"If-None-Match": etag})
+    assert second.status_code == 200
+    assert second.json()["rules"][0]["category_filter"] == "카페"
+    assert second.headers["ETag"] != etag
+
+
+def test_invalid_and_disabled_rules_are_excluded_from_analysis(rules_path):
+    rules = [
+        _rule(1, "식사"),
+        {**_rule(2, "카페"), "time_filter": [22]},          # [시작 시, 종료 시]가 아님
+        {**_rule(3, "교통"), "weekly_count": "3"},          # 문자열 횟수
+        {"id": 4, "category_filter": "술/유흥"},             # name 없음
+        {**_rule(5, "쇼핑"), "enabled": False},
+        {**_rule(6, "술/유흥"), "time_filter": [22, 4]},
+    ]
+    _write_rules(rules_path, rules, version=4, mtime_ns=2_000_000_000)
+
+    rule_set = rule_repository.load_rule_set()
+
+    assert rule_set.rules == rules
+    assert [rule["id"] for rule in rule_set.enabled_rules] == [1, 6]
+    assert rule_repository.load_rules_from_file(include_disabled=True) == rules
+
+
+def test_malformed_file_is_rejected(rules_path):
+    rules_path.write_text("{", encoding="utf-8")
+    with pytest.raises(ValueError, match="JSON"):
+        rule_repository.load_rule_set()
+
+    rules_path.write_text(json.dumps({"version": 1, "rules": {}}), encoding="utf-8")
+    with pytest.raises(ValueError, match="형식"):
+        rule_repository.load_rule_set()
+
+
+def test_save_installs_rule_set_without_rereading(rules_path, monkeypatch):
+    rules = [_rule(1, "카페")]
+
+    version = rule_repository.save_rules_to_file(rules)
+
+    assert version == 4
+    assert json.loads(rules_path.read_text(encoding="utf-8")) == {"version": 4, "rules": rules}
+    assert [path.name for path in rules_path.parent.iterdir() if path.name.endswith(".json")] == [rules_path.name]
+
+    # 저장한 내용으로 교체되어 파일을 다시 읽지 않고, 호출한 쪽의 이후 수정과 분리됨
+    monkeypatch.setattr(rule_repository, "_load_json_file", lambda path: pytest.fail("규칙 파일을 다시 읽음"))
+    rules[0]["category_filter"] = "식사"
+    rule_set = rule_repository.load_rule_set()
+    assert rule_set.version == 4
+    assert [rule["category_filter"] for rule in rule_set.enabled_rules] == ["카페"]
+
+
+def _save_repeatedly(count: int) -> None:
+    for _ in range(count):
+        rule_repository.save_rules_to_file([_rule(1, "식사")])
+
+
+def test_concurrent_saves_from_processes_keep_every_version(rules_path):
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_save_repeatedly, args=(5,)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(timeout=30)
+
+    assert [worker.exitcode for worker in workers] == [0, 0, 0, 0]
+    assert rule_repository.load_rule_set().version == 3 + 4 * 5
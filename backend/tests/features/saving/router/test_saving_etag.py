@@ -0,0 +1,19 @@
+"""절약 기회 조회 ETag / 304 테스트"""
+import json
+
+from src.features.analysis.overspending.repository import rule_repository
+
+
+def test_etag_changes_when_rules_change(client, tmp_path, monkeypatch):
+    rules_path = tmp_path / "overspending_rules.json"
+    rules_path.write_text(json.dumps({"version": 1, "rules": []}), encoding="utf-8")
+    monkeypatch.setattr(rule_repository, "OVERSPENDING_RULES_PATH", rules_path)
+    monkeypatch.setattr(rule_repository, "_cached", None)
+
+    etag = client.get("/saving/opportunities").headers["ETag"]
+    assert client.get("/saving/opportunities", headers={"If-None-Match": etag}).status_code == 304
+
+    rules_path.write_text(json.dumps({"version": 2, "rules": []}), encoding="utf-8")
+    changed = client.get("/saving/opportunities", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
@@ -0,0 +1,49 @@
+"""데이터셋 변경 로그 테스트"""
+import pytest
+
+from src.features.transaction.repository import change_log
+from src.features.transaction.repository.change_log import append_changes, read_changes
+from src.features.transaction.repository.partition_storage import get_user_dataset_dir
+
+
+@pytest.fixture
+def log_user(user_id) -> str:
+    get_user_dataset_dir(user_id).mkdir(parents=True)
+    return user_id
+
+
+def test_changes_are_merged_per_transaction(log_user):
+    append_changes(log_user, 1, inserted=[1, 2, 3], deleted=[9])
+    append_changes(log_user, 2, updated=[1, 4])
+    append_changes(log_user, 3, deleted=[2, 4], inserted=[9])
+
+    assert read_changes(log_user, 0, 3) == {1: "inserted", 3: "inserted", 4: "deleted", 9: "updated"}
+    assert read_changes(log_user, 1, 3) == {1: "updated", 2: "deleted", 4: "deleted", 9: "inserted"}
+    assert read_changes(log_user, 3, 3) == {}
+
+
+def test_missing_versions_require_full_sync(log_user):
+    append_changes(log_user, 1, inserted=[1])
+    append_changes(log_user, 3, inserted=[2])
+
+    assert read_changes(log_user, 0, 3) is None
+    assert read_changes(log_user, 2, 3) == {2: "inserted"}
+    assert read_changes(log_user, 3, 2) is None
+
+
+def test_corrupted_line_is_skipped(log_user):
+    append_changes(log_user, 1, inserted=[1])
+    with open(get_user_dataset_dir(log_user) / change_log.CHANGE_LOG_FILE_NAME, "a", encoding="utf-8") as f:
+        f.write('{"version": 2, "inser')
+
+    assert read_changes(log_user, 0, 1) == {1: "inserted"}
+    assert read_changes(log_user, 0, 2) is None
+
+
+def test_truncated_log_keeps_recent_versions(log_user, monkeypatch):
+    monkeypatch.setattr(change_log, "CHANGE_LOG_MAX_BYTES", 400)
+    for version in range(1, 21):
+        append_changes(log_user, version, updated=[version])
+
+    assert read_changes(log_user, 0, 20) is None
+    assert read_changes(log_user, 18, 20) == {19: "updated", 20: "updated"}
@@ -0,0 +1,108 @@
+"""거래 수정 델타 로그 (delta_log) 및 압축 테스트"""
+import pandas as pd
+import pytest
+
+from src.features.transaction.repository import transaction_repository
+from src.features.transaction.repository.delta_log import (
+    append_deltas,
+    apply_delta,
+    get_delta_path,
+    read_delta,
+)
+from src.features.transaction.repository.partition_storage import (
+    append_partition_edits,
+    compact_partition,
+    get_partition_path,
+    list_partitions,
+    read_partitions,
+    write_partitions,
+)
+from src.features.transaction.repository.transaction_repository import (
+    load_transactions,
+    shutdown_transaction_compaction,
+    update_transaction,
+)
+
+
+def _partition(n: int = 4) -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": range(n),
+        "거래일시": pd.date_range("2024-01-01", periods=n, freq="D"),
+        "내용": [f"가게{i}" for i in range(n)],
+        "금액": [-1000 * (i + 1) for i in range(n)],
+    })
+
+
+@pytest.fixture
+def partition_path(user_id):
+    write_partitions(user_id, _partition(), replace_all=True)
+    return get_partition_path(user_id, 2024, 1)
+
+
+def test_read_delta_keeps_last_value_per_field(tmp_path):
+    path = tmp_path / "part-0.parquet"
+    append_deltas(path, [(1, {"내용": "A"}), (2, {"금액": -5})])
+    append_deltas(path, [(1, {"금액": -7}), (1, {"내용": "B"})])
+
+    delta = read_delta(path)
+
+    assert delta.loc[1, "내용"] == "B"
+    assert delta.loc[1, "금액"] == -7
+    assert delta.loc[2, "금액"] == -5
+    assert pd.isna(delta.loc[2, "내용"])
+
+
+def test_read_delta_skips_truncated_line(tmp_path):
+    path = tmp_path / "part-0.parquet"
+    append_deltas(path, [(1, {"내용": "A"})])
+    with open(get_delta_path(path), "a", encoding="utf-8") as f:
+        f.write('{"id": 2, "fields": {"내용"')  # 추가 도중 중단
+
+    assert read_delta(path).index.tolist() == [1]
+
+
+def test_apply_delta_keeps_dtypes_and_skips_unselected_columns():
+    frame = _partition()
+    overlay = pd.DataFrame({"금액": [-9.0, None], "메모": ["x", "y"]}, index=pd.Index([1, 3], name="id"))
+
+    result = apply_delta(frame, overlay)
+
+    assert result["금액"].tolist() == [-1000, -9, -3000, -4000]
+    assert result["금액"].dtype == frame["금액"].dtype
+    assert "메모" not in result.columns
+    assert frame["금액"].tolist() == [-1000, -2000, -3000, -4000]  # 원본은 그대로
+
+
+def test_edits_survive_compaction(user_id, partition_path):
+    append_partition_edits(partition_path, [(0, {"내용": "수정0"}), (2, {"금액": -1})])
+    append_partition_edits(partition_path, [(0, {"금액": -2})])
+    edited = read_partitions(list_partitions(user_id))
+
+    assert compact_partition(partition_path)
+    compacted = read_partitions(list_partitions(user_id))
+
+    assert not get_delta_path(partition_path).exists()
+    pd.testing.assert_frame_equal(compacted, edited)
+    assert dict(zip(compacted["id"], compacted["내용"]))[0] == "수정0"
+    assert dict(zip(compacted["id"], compacted["금액"])) == {0: -2, 1: -2000, 2: -1, 3: -4000}
+    assert not compact_partition(partition_path)  # 델타 로그가 없으면 압축하지 않음
+
+
+def test_column_projection_sees_edits(user_id, partition_path):
+    append_partition_edits(partition_path, [(1, {"내용": "수정1", "금액": -3})])
+
+    projected = read_partitions(list_partitions(user_id), columns=["금액"])
+
+    assert list(projected.columns) == ["id", "금액"]
+    assert dict(zip(projected["id"], projected["금액"]))[1] == -3
+
+
+def test_update_schedules_background_compaction(user_id, partition_path, monkeypatch):
+    monkeypatch.setattr(transaction_repository, "TRANSACTION_DELTA_COMPACTION_BYTES", 1)
+
+    update_transaction(3, {"내용": "수정3"}, user_id)
+    shutdown_transaction_compaction()  # 예약된 압축 완료 대기
+
+    assert not get_delta_path(partition_path).exists()
+    assert pd.read_parquet(partition_path).set_index("id").loc[3, "내용"] == "수정3"
+    assert load_transactions(user_id=user_id).set_index("id").loc[3, "내용"] == "수정3"
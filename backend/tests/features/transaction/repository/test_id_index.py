@@ -0,0 +1,88 @@
+"""거래 ID 인덱스 (id_index) 테스트"""
+import pandas as pd
+
+from src.features.transaction.repository import id_index
+from src.features.transaction.repository.id_index import get_transaction_index
+from src.features.transaction.repository.partition_storage import (
+    append_partition_edits,
+    get_partition_path,
+    write_partitions,
+)
+
+
+def _transactions(ids: list[int], dates: list[str]) -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": ids,
+        "거래일시": pd.to_datetime(dates),
+        "내용": [f"가게{i}" for i in ids],
+    })
+
+
+def _write_sample(user_id: str) -> None:
+    write_partitions(
+        user_id,
+        _transactions([0, 1, 2, 3], ["2024-01-05", "2024-01-20", "2024-02-03", "2024-03-01"]),
+        replace_all=True,
+    )
+
+
+def test_lookup_by_id(user_id):
+    _write_sample(user_id)
+    index = get_transaction_index(user_id)
+
+    assert len(index) == 4
+    assert index.get(2)["내용"] == "가게2"
+    assert index.get(99) is None
+    (month, _), position = index.locate(1)
+    assert (month, position) == ((2024, 1), 0)  # 파티션 안은 최신 거래부터
+
+
+def test_get_many_keeps_request_order_and_skips_missing(user_id):
+    _write_sample(user_id)
+    index = get_transaction_index(user_id)
+
+    rows = index.get_many([3, 99, 0, 2])
+
+    assert rows["id"].tolist() == [3, 0, 2]
+    assert index.get_many([]).empty
+    assert index.locate_many([3, 99, 0]).tolist()[1] == -1
+
+
+def test_index_is_reused_until_partitions_change(user_id):
+    _write_sample(user_id)
+    index = get_transaction_index(user_id)
+
+    # 델타 로그 수정은 행 위치를 바꾸지 않으므로 같은 인덱스 (조회 결과에는 수정 반영)
+    append_partition_edits(get_partition_path(user_id, 2024, 1), [(0, {"내용": "수정0"})])
+    assert get_transaction_index(user_id) is index
+    assert index.get(0)["내용"] == "수정0"
+
+    write_partitions(user_id, _transactions([4], ["2024-01-25"]), replace_all=False)
+    rebuilt = get_transaction_index(user_id)
+    assert rebuilt is not index
+    assert rebuilt.get(4)["내용"] == "가게4"
+    assert rebuilt.get(0) is None  # 1월 파티션이 교체됨
+
+
+def test_duplicate_ids_resolve_to_newest_month(user_id):
+    write_partitions(user_id, _transactions([7, 7], ["2024-01-05", "2024-02-05"]), replace_all=True)
+
+    index = get_transaction_index(user_id)
+
+    assert index.duplicate_ids == [7]
+    assert index.get(7)["거래일시"] == pd.Timestamp("2024-02-05")
+
+
+def test_index_build_reads_only_id_column(user_id, monkeypatch):
+    _write_sample(user_id)
+    read_columns = []
+    read_partitions = id_index.read_partitions
+
+    def spy(partitions, columns=None):
+        read_columns.append(columns)
+        return read_partitions(partitions, columns)
+
+    monkeypatch.setattr(id_index, "read_partitions", spy)
+    get_transaction_index(user_id)
+
+    assert read_columns == [["id"]] * 3
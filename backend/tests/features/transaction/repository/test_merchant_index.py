@@ -0,0 +1,34 @@
+"""거래처(내용) n-gram 색인 (merchant_index) 테스트"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.transaction.repository.merchant_index import MerchantIndex
+from src.features.transaction.repository.transaction_store import TransactionStore
+
+MERCHANTS = ["스타벅스 강남점", "스타벅스", "벅스뮤직", "스타필드", "abcXbcd", "abcd", "카카오택시", None]
+
+
+@pytest.fixture
+def store() -> TransactionStore:
+    n = 40
+    return TransactionStore(pd.DataFrame({
+        "id": np.arange(n),
+        "거래일시": pd.date_range("2024-01-01", periods=n, freq="h")[::-1],
+        "내용": [MERCHANTS[i % len(MERCHANTS)] for i in range(n)],
+    }), version=1)
+
+
+@pytest.mark.parametrize("query", ["스", "벅스", "스타벅", "스타벅스", "스타벅스 강남", "abcd", "bcd", "abcXb", "택시", "없는가게"])
+def test_search_matches_substring_scan(store, query):
+    texts = store.column_values("내용")
+    expected = [i for i, text in enumerate(texts) if text is not None and query in text]
+
+    assert MerchantIndex(store).search(query).tolist() == expected
+
+
+def test_trigram_candidates_are_checked_against_text(store):
+    # "abcXbcd"는 "abcd"의 트라이그램(abc, bcd)을 모두 갖지만 포함하지 않음
+    positions = MerchantIndex(store).search("abcd")
+
+    assert set(store.column_values("내용", positions)) == {"abcd"}
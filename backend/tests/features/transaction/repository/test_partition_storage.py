@@ -0,0 +1,107 @@
+"""사용자별 월 파티션 저장소 (partition_storage) 테스트"""
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.features.transaction.repository.partition_storage import (
+    get_partition_path,
+    get_user_dataset_dir,
+    has_partitions,
+    list_partitions,
+    read_partitions,
+    replace_partitions,
+    write_partitions,
+)
+from src.features.transaction.repository.transaction_repository import load_transactions
+
+
+def _transactions(dates: list[str]) -> pd.DataFrame:
+    return pd.DataFrame({
+        "id": range(len(dates)),
+        "거래일시": pd.to_datetime(dates),
+        "금액": [-1000] * len(dates),
+    })
+
+
+DATES = ["2023-12-31 23:00", "2024-01-05 09:00", "2024-01-20 12:00", "2024-03-01 08:00"]
+
+
+def test_months_are_written_to_hive_partitions_newest_first(user_id):
+    written = write_partitions(user_id, _transactions(DATES), replace_all=True)
+
+    assert sorted(written) == [(2023, 12), (2024, 1), (2024, 3)]
+    assert [key for key, _ in list_partitions(user_id)] == [(2024, 3), (2024, 1), (2023, 12)]
+    path = get_partition_path(user_id, 2024, 1)
+    assert path.parts[-4:] == (f"user_id={user_id}", "year=2024", "month=01", "part-0.parquet")
+    # 파티션 안은 거래일시 내림차순
+    assert pd.read_parquet(path)["거래일시"].is_monotonic_decreasing
+
+
+def test_date_range_reads_only_overlapping_months(user_id):
+    write_partitions(user_id, _transactions(DATES), replace_all=True)
+
+    assert [key for key, _ in list_partitions(user_id, "2024-01-15", "2024-02-10")] == [(2024, 1)]
+    assert [key for key, _ in list_partitions(user_id, start_date="2024-01-01")] == [(2024, 3), (2024, 1)]
+    assert [key for key, _ in list_partitions(user_id, end_date="2023-12-31")] == [(2023, 12)]
+    assert list_partitions(user_id, "2024-02-01", "2024-02-29") == []
+
+
+def test_load_transactions_is_sorted_across_partitions(user_id):
+    write_partitions(user_id, _transactions(DATES), replace_all=True)
+
+    df = load_transactions(user_id=user_id)
+
+    assert df["거래일시"].tolist() == sorted(pd.to_datetime(DATES), reverse=True)
+    assert load_transactions("2024-01-01", "2024-01-31", user_id=user_id)["id"].tolist() == [2, 1]
+
+
+def test_users_are_isolated(user_id):
+    other = f"{user_id}-other"
+    write_partitions(user_id, _transactions(DATES), replace_all=True)
+    write_partitions(other, _transactions(DATES[:1]), replace_all=True)
+
+    assert len(read_partitions(list_partitions(user_id))) == 4
+    assert len(read_partitions(list_partitions(other))) == 1
+    assert not has_partitions(f"{user_id}-empty")
+    assert load_transactions(user_id=f"{user_id}-empty").empty
+
+
+def test_partial_write_keeps_other_months(user_id):
+    write_partitions(user_id, _transactions(DATES), replace_all=True)
+
+    write_partitions(user_id, _transactions(["2024-03-02 10:00"]), replace_all=False)
+    assert [key for key, _ in list_partitions(user_id)] == [(2024, 3), (2024, 1), (2023, 12)]
+
+    write_partitions(user_id, _transactions(["2024-03-02 10:00"]), replace_all=True)
+    assert [key for key, _ in list_partitions(user_id)] == [(2024, 3)]
+
+
+def test_replace_swaps_all_years(user_id):
+    write_partitions(user_id, _transactions(DATES), replace_all=True)
+
+    replace_partitions(user_id, [_transactions(["2022-06-01 10:00", "2024-01-07 10:00"])])
+
+    assert [key for key, _ in list_partitions(user_id)] == [(2024, 1), (2022, 6)]
+    assert sorted(path.name for path in get_user_dataset_dir(user_id).iterdir()) == [".lock", "year=2022", "year=2024"]
+
+
+def test_failed_swap_restores_previous_years(user_id, monkeypatch):
+    write_partitions(user_id, _transactions(DATES), replace_all=True)
+    user_dir = get_user_dataset_dir(user_id)
+
+    # 2023년은 교체된 뒤 2024년 디렉토리를 넣는 중 실패
+    rename = Path.rename
+
+    def failing_rename(self, target):
+        if Path(target) == user_dir / "year=2024" and self.parent.name.startswith(".staging-"):
+            raise OSError("rename 실패")
+        return rename(self, target)
+
+    with monkeypatch.context() as patch, pytest.raises(OSError):
+        patch.setattr(Path, "rename", failing_rename)
+        replace_partitions(user_id, [_transactions(["2023-11-01 10:00", "2024-02-01 10:00"])])
+
+    assert [key for key, _ in list_partitions(user_id)] == [(2024, 3), (2024, 1), (2023, 12)]
+    assert load_transactions(user_id=user_id)["거래일시"].tolist() == sorted(pd.to_datetime(DATES), reverse=True)
+    assert sorted(path.name for path in user_dir.iterdir()) == [".lock", "year=2023", "year=2024"]
@@ -0,0 +1,98 @@
+"""거래내역 저장소 (transaction_repository) 테스트"""
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from src.features.transaction.repository import transaction_repository
+from src.features.transaction.repository.change_log import read_changes
+from src.features.transaction.repository.transaction_repository import (
+    find_transactions_by_ids,
+    get_transactions_version,
+    load_transactions,
+    replace_transaction_partitions,
+    update_transactions,
+)
+
+
+@pytest.fixture
+def dataset(user_id) -> str:
+    """1~3월에 두 건씩 있는 데이터셋 (ID 0~5, 오래된 거래부터)"""
+    dates = pd.to_datetime([
+        "2024-01-05 09:00", "2024-01-20 12:00",
+        "2024-02-03 09:00", "2024-02-17 12:00",
+        "2024-03-01 09:00", "2024-03-15 12:00",
+    ])
+    df = pd.DataFrame({
+        "id": range(6),
+        "거래일시": dates,
+        "내용": [f"가게{i}" for i in range(6)],
+        "금액": [-1000 * (i + 1) for i in range(6)],
+    })
+    replace_transaction_partitions([df], user_id)
+    return user_id
+
+
+def test_bulk_update_bumps_version_once(dataset):
+    before = get_transactions_version(dataset)
+
+    rows, version = update_transactions({0: {"내용": "수정0"}, 3: {"내용": "수정3"}, 99: {"내용": "없음"}}, dataset)
+
+    assert rows["id"].tolist() == [0, 3]
+    assert rows["내용"].tolist() == ["수정0", "수정3"]
+    assert version == before + 1 == get_transactions_version(dataset)
+    assert read_changes(dataset, before, version) == {0: "updated", 3: "updated"}
+    assert find_transactions_by_ids([0, 3], dataset)["내용"].tolist() == ["수정0", "수정3"]
+
+
+def test_bulk_update_failure_records_partitions_already_written(dataset, monkeypatch):
+    before = get_transactions_version(dataset)
+
+    # 두 번째 파티션의 델타 로그 추가에서 실패
+    append = transaction_repository.append_partition_edits
+    calls = []
+
+    def failing_append(path, edits):
+        calls.append(path)
+        if len(calls) == 2:
+            raise OSError("disk full")
+        return append(path, edits)
+
+    monkeypatch.setattr(transaction_repository, "append_partition_edits", failing_append)
+    with pytest.raises(OSError):
+        update_transactions({0: {"내용": "수정0"}, 1: {"내용": "수정1"}, 5: {"내용": "수정5"}}, dataset)
+
+    # 먼저 추가된 1월 파티션의 수정은 남고 변경 로그/버전에 반영됨
+    assert get_transactions_version(dataset) == before + 1
+    assert read_changes(dataset, before, before + 1) == {0: "updated", 1: "updated"}
+    assert find_transactions_by_ids([0, 1, 5], dataset)["내용"].tolist() == ["수정0", "수정1", "가게5"]
+
+
+def test_projection_decodes_only_requested_columns(dataset, monkeypatch):
+    decoded = []
+    read = pq.ParquetFile.read
+
+    def spy(self, columns=None, **kwargs):
+        decoded.append(columns)
+        return read(self, columns=columns, **kwargs)
+
+    monkeypatch.setattr(pq.ParquetFile, "read", spy)
+    df = load_transactions("2024-01-01", "2024-02-29", user_id=dataset, columns=["금액", "없는컬럼"])
+
+    # id는 항상 포함, 파일에 없는 컬럼은 무시, 조회 기간의 월만 읽음
+    assert list(df.columns) == ["id", "금액"]
+    assert df["id"].tolist() == [3, 2, 1, 0]
+    assert decoded == [["id", "금액"], ["id", "금액"]]
+
+
+def test_projection_applies_delta_edits(dataset):
+    # 전체 컬럼 프레임을 먼저 캐시해 두어도 컬럼 조합별로 따로 합침
+    load_transactions(user_id=dataset)
+    update_transactions({0: {"내용": "수정0", "금액": -500}, 4: {"내용": "수정4"}}, dataset)
+
+    amounts = load_transactions(user_id=dataset, columns=["거래일시", "금액"])
+    contents = load_transactions(user_id=dataset, columns=["내용"])
+
+    assert list(amounts.columns) == ["id", "거래일시", "금액"]
+    assert amounts.set_index("id")["금액"].to_dict() == {5: -6000, 4: -5000, 3: -4000, 2: -3000, 1: -2000, 0: -500}
+    assert contents.set_index("id")["내용"].loc[[0, 4, 5]].tolist() == ["수정0", "수정4", "가게5"]
+    assert load_transactions(user_id=dataset).set_index("id").loc[0, "금액"] == -500
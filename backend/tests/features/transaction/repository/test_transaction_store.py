@@ -0,0 +1,100 @@
+"""거래내역 컬럼 저장소 (TransactionStore) 테스트"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.transaction.repository.transaction_store import TransactionStore
+
+
+def _transactions(n: int, seed: int) -> pd.DataFrame:
+    """같은 시각의 거래와 거래일시 없는 행을 포함한 거래 (정렬되지 않은 순서)"""
+    rng = np.random.default_rng(seed)
+    dates = pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 90 * 24, n), unit="h")
+    dates = pd.Series(dates).mask(rng.random(n) < 0.05)
+    return pd.DataFrame({
+        "id": rng.permutation(n),
+        "거래일시": dates,
+        "대분류": rng.choice(["식사", "교통", "카페"], n),
+        "금액": -rng.integers(1, 100, n) * 100,
+    })
+
+
+def _expected_ids(df: pd.DataFrame, mask: pd.Series) -> list[int]:
+    return df[mask].sort_values(["거래일시", "id"], ascending=False)["id"].tolist()
+
+
+@pytest.mark.parametrize("start_date, end_date", [
+    ("2024-01-15", "2024-02-10"),
+    ("2024-01-15 13:00", None),
+    (None, "2024-02-10 23:59:59"),
+    ("2024-02-01", "2024-02-01"),
+    ("2023-01-01", "2023-12-31"),
+    ("2024-03-10", "2024-01-01"),
+    ("2024-01-05 07:00", "2024-01-05 07:00"),
+])
+def test_date_window_matches_boolean_filter(start_date, end_date):
+    df = _transactions(500, seed=1)
+    store = TransactionStore(df, version=1)
+    dates = df["거래일시"]
+    mask = dates.notna()
+    if start_date:
+        mask &= dates >= pd.Timestamp(start_date)
+    if end_date:
+        mask &= dates <= pd.Timestamp(end_date)
+
+    window = store.date_window(start_date, end_date)
+
+    assert store.ids[window].tolist() == _expected_ids(df, mask)
+
+
+def test_date_window_without_dates_includes_undated_rows():
+    df = _transactions(200, seed=2)
+    store = TransactionStore(df, version=1)
+
+    window = store.date_window()
+
+    assert store.ids[window].tolist() == _expected_ids(df, pd.Series(True, index=df.index))
+    assert not store.valid_timestamps(window)[-int(df["거래일시"].isna().sum()):].any()
+
+
+@pytest.mark.parametrize("year, month", [(2024, 1), (2024, 2), (2024, 3), (2024, 4), (2023, 12)])
+def test_month_window_matches_boolean_filter(year, month):
+    df = _transactions(500, seed=3)
+    store = TransactionStore(df, version=1)
+    dates = df["거래일시"]
+
+    window = store.month_window(year, month)
+
+    assert store.ids[window].tolist() == _expected_ids(df, (dates.dt.year == year) & (dates.dt.month == month))
+
+
+def test_codes_and_vocabulary_round_trip():
+    df = _transactions(300, seed=4).assign(
+        메모=lambda frame: np.where(frame.index % 7 == 0, None, "메모" + (frame.index % 5).astype(str)),
+    )
+    store = TransactionStore(df, version=1)
+    restored = store.to_frame()
+    expected = df.sort_values(["거래일시", "id"], ascending=False).reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(restored, expected, check_dtype=False)
+    assert store.vocabulary("대분류").tolist() == ["교통", "식사", "카페"]
+    assert store.codes("대분류").dtype == np.int8
+    assert store.codes("메모")[restored["메모"].isna().to_numpy()].tolist() == [-1] * int(restored["메모"].isna().sum())
+    assert store.equals("대분류", "카페").sum() == (df["대분류"] == "카페").sum()
+    assert store.lookup("대분류", "없음") is None
+
+
+def test_mixed_type_text_column_is_stored_as_strings():
+    df = pd.DataFrame({
+        "id": [0, 1, 2, 3, 4],
+        "거래일시": pd.to_datetime(["2024-01-05", "2024-01-04", "2024-01-03", "2024-01-02", "2024-01-01"]),
+        "금액": [-1000] * 5,
+        "메모": ["점심", 123, None, 4.5, "123"],
+    })
+
+    store = TransactionStore(df, version=1)
+
+    assert store.vocabulary("메모").tolist() == ["123", "4.5", "점심"]
+    assert store.to_frame()["메모"].tolist() == ["점심", "123", None, "4.5", "123"]
+    assert store.equals("메모", "123").tolist() == [False, True, False, False, True]
+    assert store.to_arrow().column("메모").to_pylist() == ["점심", "123", None, "4.5", "123"]
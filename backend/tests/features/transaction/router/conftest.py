@@ -0,0 +1,30 @@
+"""거래내역 API 테스트 fixture"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.features.transaction.repository.transaction_repository import replace_transaction_partitions
+
+N_TRANSACTIONS = 40
+
+
+@pytest.fixture
+def dataset(user_id) -> pd.DataFrame:
+    """2개월에 걸친 거래 40건 (같은 시각의 거래 포함, ID는 오래된 거래부터)"""
+    rng = np.random.default_rng(0)
+    dates = pd.Timestamp("2024-01-01") + pd.to_timedelta(np.sort(rng.integers(0, 59 * 24, N_TRANSACTIONS)), unit="h")
+    df = pd.DataFrame({
+        "id": np.arange(N_TRANSACTIONS),
+        "거래일시": dates,
+        "타입": "지출",
+        "대분류": rng.choice(["식사", "교통"], N_TRANSACTIONS),
+        "소분류": "기타",
+        "내용": rng.choice(["김밥천국", "스타벅스", "카카오택시"], N_TRANSACTIONS),
+        "금액": -rng.integers(1, 50, N_TRANSACTIONS) * 1000,
+        "화폐": "KRW",
+        "결제수단": "카드",
+        "메모": None,
+    })
+    df.loc[5, "거래일시"] = df.loc[4, "거래일시"]  # 같은 시각 (커서는 ID로 구분)
+    replace_transaction_partitions([df], user_id)
+    return df
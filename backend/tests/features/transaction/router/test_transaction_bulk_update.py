@@ -0,0 +1,19 @@
+"""거래내역 일괄 수정 API 테스트"""
+
+
+def test_bulk_patch_saves_once_and_reports_each_item(client, dataset):
+    version = client.get("/transaction/count").json()["version"]
+
+    response = client.patch(
+        "/transaction/bulk",
+        params={"expected_version": version},
+        json={"updates": [{"id": 3, "category": "카페"}, {"id": 999, "amount": -1}, {"id": 30, "description": "수정"}]},
+    ).json()
+
+    assert [(result["id"], result["success"]) for result in response["results"]] == [(3, True), (999, False), (30, True)]
+    assert response["updated_count"] == 2
+    assert response["version"] == version + 1
+    assert response["results"][0]["transaction"]["대분류"] == "카페"
+
+    stale = client.patch("/transaction/bulk", params={"expected_version": version}, json={"updates": [{"id": 3, "amount": -5}]})
+    assert stale.status_code == 409
@@ -0,0 +1,15 @@
+"""거래내역 변경분 조회 API 테스트"""
+
+
+def test_changes_since_version(client, dataset):
+    version = client.get("/transaction/count").json()["version"]
+    client.patch("/transaction/bulk", json={"updates": [{"id": 1, "description": "수정1"}, {"id": 2, "amount": -7}]})
+
+    changes = client.get("/transaction/changes", params={"since": version}).json()
+
+    assert changes["version"] == version + 1
+    assert not changes["full_resync"]
+    assert sorted(t["id"] for t in changes["updated"]) == [1, 2]
+    assert changes["inserted"] == changes["deleted"] == []
+    assert client.get("/transaction/changes", params={"since": version + 1}).json()["updated"] == []
+    assert client.get("/transaction/changes", params={"since": version + 5}).json()["full_resync"]
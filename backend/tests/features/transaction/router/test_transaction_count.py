@@ -0,0 +1,12 @@
+"""거래내역 개수 조회 API 테스트"""
+
+
+def test_count_matches_listing(client, dataset):
+    params = {"category": "식사", "merchant": "김밥"}
+    expected = int(((dataset["대분류"] == "식사") & (dataset["내용"] == "김밥천국")).sum())
+
+    count = client.get("/transaction/count", params=params).json()
+    listing = client.get("/transaction/", params={**params, "limit": 1}).json()
+
+    assert count["total_count"] == listing["total_count"] == expected
+    assert count["version"] == listing["version"]
@@ -0,0 +1,23 @@
+"""거래내역 조회 ETag / 304 테스트"""
+
+
+def test_etag_revalidation(client, dataset):
+    first = client.get("/transaction/count", params={"category": "식사"})
+    etag = first.headers["ETag"]
+
+    assert client.get("/transaction/count", params={"category": "식사"}, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/transaction/count", params={"category": "교통"}).headers["ETag"] != etag
+
+    client.put("/transaction/0", json={"description": "수정"})
+    changed = client.get("/transaction/count", params={"category": "식사"}, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_etag_depends_on_user_and_accept(client, dataset, user_id):
+    etag = client.get("/transaction/").headers["ETag"]
+
+    other_user = client.get("/transaction/", headers={"X-User-Id": f"{user_id}-other", "If-None-Match": etag})
+    assert other_user.status_code == 200
+    columnar = client.get("/transaction/", headers={"Accept": "application/vnd.transactions.columnar+json"})
+    assert columnar.headers["ETag"] != etag
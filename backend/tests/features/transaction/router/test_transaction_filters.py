@@ -0,0 +1,54 @@
+"""거래내역 조건 필터(비트맵) 테스트"""
+import pandas as pd
+import pytest
+
+
+def _ids(client, **params) -> list[int]:
+    body = client.get("/transaction/", params={**params, "limit": 1000}).json()
+    return [transaction["id"] for transaction in body["transactions"]]
+
+
+def _expected(dataset: pd.DataFrame, params: dict) -> list[int]:
+    """같은 조건을 DataFrame에 직접 적용한 결과 (거래일시 내림차순, 같은 시각은 ID 내림차순)"""
+    df = dataset
+    dates = df["거래일시"]
+    mask = pd.Series(True, index=df.index)
+    if "start_date" in params:
+        mask &= dates >= pd.Timestamp(params["start_date"])
+    if "end_date" in params:
+        mask &= dates <= pd.Timestamp(params["end_date"])
+    if "category" in params:
+        mask &= df["대분류"] == params["category"]
+    if "payment_method" in params:
+        mask &= df["결제수단"] == params["payment_method"]
+    if "time_range" in params:
+        start_hour, end_hour = (int(part.split(":")[0]) for part in params["time_range"].split("-"))
+        hours = dates.dt.hour
+        mask &= (hours >= start_hour) & (hours < end_hour) if start_hour < end_hour else (hours >= start_hour) | (hours < end_hour)
+    if params.get("is_weekend"):
+        mask &= dates.dt.dayofweek >= 5
+    if params.get("early_month"):
+        mask &= dates.dt.day <= 5
+    return df[mask].sort_values(["거래일시", "id"], ascending=False)["id"].tolist()
+
+
+@pytest.mark.parametrize("params", [
+    {"category": "식사"},
+    {"payment_method": "카드"},
+    {"payment_method": "현금"},
+    {"time_range": "09:00-18:00"},
+    {"time_range": "22:00-06:00"},
+    {"time_range": "20:00-30:00"},
+    {"time_range": "25:00-26:00"},
+    {"time_range": "30:00-06:00"},
+    {"is_weekend": True},
+    {"early_month": True},
+    {"category": "교통", "time_range": "22:00-06:00", "start_date": "2024-01-09 13:00", "end_date": "2024-02-20"},
+    {"category": "식사", "is_weekend": True, "start_date": "2024-01-17"},
+    {"early_month": True, "time_range": "06:00-22:00", "end_date": "2024-02-03 05:00"},
+])
+def test_filters_match_dataframe_filtering(client, dataset, params):
+    expected = _expected(dataset, params)
+
+    assert _ids(client, **params) == expected
+    assert client.get("/transaction/count", params=params).json()["total_count"] == len(expected)
@@ -0,0 +1,66 @@
+"""거래내역 목록 응답 형식 (Accept 헤더) 테스트
+
+컬럼 JSON과 Arrow IPC 응답이 기본 행 목록 JSON과 같은 행/페이지 정보를 담는지 확인합니다.
+"""
+import pyarrow as pa
+import pytest
+
+from src.features.transaction.router.transaction_router import ARROW_STREAM_MEDIA_TYPE, COLUMNAR_JSON_MEDIA_TYPE
+
+PARAMS = [
+    {"limit": 1000},
+    {"limit": 7},
+    {"limit": 5, "category": "식사", "start_date": "2024-02-01"},
+    {"limit": 10, "merchant": "스타"},
+    {"limit": 10, "category": "없는분류"},
+]
+
+
+def _rows_from_columns(columns: dict[str, list]) -> list[dict]:
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+@pytest.mark.parametrize("params", PARAMS)
+def test_columnar_json_matches_row_listing(client, dataset, params):
+    expected = client.get("/transaction/", params=params).json()
+
+    response = client.get("/transaction/", params=params, headers={"Accept": COLUMNAR_JSON_MEDIA_TYPE})
+
+    assert response.headers["content-type"] == COLUMNAR_JSON_MEDIA_TYPE
+    body = response.json()
+    assert _rows_from_columns(body.pop("columns")) == expected.pop("transactions")
+    assert body == expected
+
+
+@pytest.mark.parametrize("params", PARAMS)
+def test_arrow_stream_matches_row_listing(client, dataset, params):
+    expected = client.get("/transaction/", params=params).json()
+
+    response = client.get("/transaction/", params=params, headers={"Accept": ARROW_STREAM_MEDIA_TYPE})
+
+    assert response.headers["content-type"] == ARROW_STREAM_MEDIA_TYPE
+    table = pa.ipc.open_stream(response.content).read_all()
+    rows = [
+        {**row, "거래일시": row["거래일시"].strftime("%Y-%m-%d %H:%M:%S")}
+        for row in table.to_pylist()
+    ]
+    assert rows == expected["transactions"]
+    assert table.schema.field("id").type == pa.int64()
+    assert table.schema.field("금액").type == pa.int64()
+    assert response.headers["X-Total-Count"] == str(expected["total_count"])
+    assert response.headers["X-Has-More"] == str(expected["has_more"]).lower()
+    assert response.headers["X-Dataset-Version"] == str(expected["version"])
+    assert response.headers.get("X-Next-Cursor") == expected["next_cursor"]
+
+
+def test_formats_have_separate_etags(client, dataset):
+    etags = {
+        accept: client.get("/transaction/", headers={"Accept": accept}).headers["ETag"]
+        for accept in ("application/json", COLUMNAR_JSON_MEDIA_TYPE, ARROW_STREAM_MEDIA_TYPE)
+    }
+
+    assert len(set(etags.values())) == 3
+    for accept, etag in etags.items():
+        response = client.get("/transaction/", headers={"Accept": accept, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert "Accept" in response.headers["Vary"]
@@ -0,0 +1,40 @@
+"""거래내역 목록 커서 페이지네이션 테스트"""
+import pandas as pd
+import pytest
+
+from src.features.transaction.repository.transaction_repository import replace_transaction_partitions
+
+
+def _all_ids(client, **params) -> list[int]:
+    body = client.get("/transaction/", params={**params, "limit": 1000}).json()
+    return [transaction["id"] for transaction in body["transactions"]]
+
+
+@pytest.mark.parametrize("params", [{}, {"category": "식사"}, {"start_date": "2024-02-01", "end_date": "2024-02-29"}])
+def test_cursor_pages_cover_listing_once(client, dataset, params):
+    expected = _all_ids(client, **params)
+    collected, cursor = [], None
+    while True:
+        page = client.get("/transaction/", params={**params, "limit": 7, **({"cursor": cursor} if cursor else {})}).json()
+        collected += [transaction["id"] for transaction in page["transactions"]]
+        cursor = page["next_cursor"]
+        assert page["has_more"] == (cursor is not None)
+        if cursor is None:
+            break
+
+    assert collected == expected
+    assert page["total_count"] == len(expected)
+
+
+def test_cursor_stays_stable_when_newer_rows_are_added(client, dataset, user_id):
+    first = client.get("/transaction/", params={"limit": 10}).json()
+    newer = dataset.iloc[:1].assign(id=len(dataset), 거래일시=pd.Timestamp("2024-03-01"))
+    replace_transaction_partitions([pd.concat([dataset, newer])], user_id)
+
+    second = client.get("/transaction/", params={"limit": 10, "cursor": first["next_cursor"]}).json()
+
+    assert [t["id"] for t in second["transactions"]] == _all_ids(client)[11:21]
+
+
+def test_invalid_cursor_is_rejected(client, dataset):
+    assert client.get("/transaction/", params={"cursor": "garbage!"}).status_code == 400
@@ -0,0 +1,36 @@
+"""거래처(내용) 부분 문자열 검색 테스트"""
+import unicodedata
+
+import pytest
+
+
+def _ids(client, **params) -> set[int]:
+    body = client.get("/transaction/", params={**params, "limit": 1000}).json()
+    return {transaction["id"] for transaction in body["transactions"]}
+
+
+@pytest.mark.parametrize("merchant", ["스타벅스", "벅", "카카오택시", "택시", "천국", "김밥천국x", "없는가게"])
+def test_search_matches_substring_filter(client, dataset, merchant):
+    expected = set(dataset.loc[dataset["내용"].str.contains(merchant, regex=False), "id"])
+
+    assert _ids(client, merchant=merchant) == expected
+
+
+def test_search_normalizes_decomposed_hangul(client, dataset):
+    expected = set(dataset.loc[dataset["내용"] == "스타벅스", "id"])
+
+    assert _ids(client, merchant=unicodedata.normalize("NFD", "스타벅스")) == expected
+
+
+def test_search_within_date_range(client, dataset):
+    in_range = dataset["거래일시"].between("2024-01-15", "2024-02-10")
+    expected = set(dataset.loc[in_range & (dataset["내용"] == "카카오택시"), "id"])
+
+    assert _ids(client, merchant="택시", start_date="2024-01-15", end_date="2024-02-10") == expected
+
+
+def test_regex_search(client, dataset):
+    expected = set(dataset.loc[dataset["내용"].isin(["김밥천국", "스타벅스"]), "id"])
+
+    assert _ids(client, merchant="^(?:김밥|스타)", merchant_regex=True) == expected
+    assert client.get("/transaction/", params={"merchant": "(", "merchant_regex": True}).status_code == 400
@@ -0,0 +1,88 @@
+"""업로드 파일 저장 / 월별 staging writer (upload_repository) 테스트"""
+import hashlib
+import io
+
+import pandas as pd
+import pytest
+
+from src.features.upload.repository import upload_repository
+from src.features.upload.repository.upload_repository import MonthlyStagingWriter, save_uploaded_file
+from src.features.upload.util.file_validation import FileTooLargeError
+
+
+class _CountingStream(io.BytesIO):
+    """read 호출 횟수를 세는 업로드 스트림"""
+
+    def __init__(self, content: bytes):
+        super().__init__(content)
+        self.reads = 0
+
+    def read(self, size: int = -1) -> bytes:
+        self.reads += 1
+        return super().read(size)
+
+
+def test_upload_is_streamed_with_hash_and_size(user_id, monkeypatch):
+    monkeypatch.setattr(upload_repository, "UPLOAD_COPY_CHUNK_SIZE", 1000)
+    content = bytes(range(256)) * 10  # 2,560 bytes → 3 청크
+    stream = _CountingStream(content)
+
+    path, sha256, size = save_uploaded_file(user_id, "../거래내역.xlsx", stream)
+
+    assert sha256 == hashlib.sha256(content).hexdigest()
+    assert size == len(content)
+    assert path.read_bytes() == content
+    # 내용 해시를 붙인 파일명 (경로 구성요소는 버림), 임시 파일은 남지 않음
+    assert path.name == f"{sha256[:16]}_거래내역.xlsx"
+    assert [item.name for item in path.parent.iterdir()] == [path.name]
+    assert stream.reads == 4  # 청크 3번 + 끝 확인 1번
+
+
+def test_oversized_upload_stops_at_limit_and_leaves_no_file(user_id, monkeypatch):
+    monkeypatch.setattr(upload_repository, "UPLOAD_COPY_CHUNK_SIZE", 1000)
+    stream = _CountingStream(b"x" * 10_000)
+
+    with pytest.raises(FileTooLargeError):
+        save_uploaded_file(user_id, "big.xlsx", stream, max_size=2500)
+
+    # 제한을 넘는 청크에서 바로 중단
+    assert stream.reads == 3
+    assert list((upload_repository.RAW_DATA_DIR / user_id).iterdir()) == []
+
+
+def _chunk(dates: list[str], memos: list, points: list) -> pd.DataFrame:
+    return pd.DataFrame({
+        "거래일시": pd.to_datetime(dates),
+        "내용": ["가게"] * len(dates),
+        "금액": [-1000] * len(dates),
+        "메모": memos,
+        "포인트": points,
+    })
+
+
+def test_text_columns_become_strings_and_numbers_keep_dtype(tmp_path):
+    with MonthlyStagingWriter(tmp_path) as writer:
+        writer.write(_chunk(["2024-01-05", "2024-02-01"], [None, "점심"], [1.5, 2.0]))
+        writer.write(_chunk(["2024-01-20"], [123], [3]))  # 메모에 숫자, 포인트에 정수
+    staged = dict(writer.staged_files)
+
+    january = pd.read_parquet(staged[(2024, 1)])
+    assert january["메모"].tolist() == [None, "123"]
+    assert january["포인트"].dtype == "float64"
+    assert january["포인트"].tolist() == [1.5, 3.0]
+    assert january["금액"].dtype == "int64"
+    assert sorted(staged) == [(2024, 1), (2024, 2)]
+
+
+def test_non_numeric_value_in_numeric_column_is_rejected(tmp_path):
+    with MonthlyStagingWriter(tmp_path) as writer:
+        writer.write(_chunk(["2024-01-05"], ["a"], [1.5]))
+        with pytest.raises(ValueError, match="포인트"):
+            writer.write(_chunk(["2024-01-06"], ["b"], ["많음"]))
+
+
+def test_fractional_value_in_integer_column_is_rejected(tmp_path):
+    with MonthlyStagingWriter(tmp_path) as writer:
+        writer.write(_chunk(["2024-01-05"], ["a"], [1]))
+        with pytest.raises(ValueError, match="포인트"):
+            writer.write(_chunk(["2024-01-06"], ["b"], [1.5]))
@@ -0,0 +1,149 @@
+"""엑셀 업로드 API (백그라운드 변환 작업) 테스트"""
+import hashlib
+import io
+import os
+import time
+from collections import OrderedDict
+from functools import partial
+
+import pandas as pd
+
+from src.features.transaction.repository.transaction_repository import load_transactions
+from src.features.upload.repository import upload_repository
+from src.features.upload.repository.upload_repository import load_upload_job_state, save_upload_job_state
+from src.features.upload.service import upload_job_service, upload_service
+
+
+def _excel_bytes(amounts: list) -> bytes:
+    n = len(amounts)
+    df = pd.DataFrame({
+        "날짜": pd.date_range("2024-01-01", periods=n, freq="D"),
+        "시간": ["12:00:00"] * n,
+        "타입": ["지출"] * n,
+        "대분류": ["식사"] * n,
+        "내용": [f"가게{i}" for i in range(n)],
+        "금액": amounts,
+        "결제수단": ["카드"] * n,
+    })
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer) as writer:
+        pd.DataFrame({"요약": [1]}).to_excel(writer, sheet_name="요약", index=False)
+        df.to_excel(writer, sheet_name="거래내역", index=False)
+    return buffer.getvalue()
+
+
+def _upload(client, content: bytes, **params) -> dict:
+    response = client.post("/upload/excel", params=params, files={"file": ("거래내역.xlsx", content)})
+    assert response.status_code == 202
+    return response.json()
+
+
+def _wait_for_job(client, job_id: str, timeout: float = 30) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(f"/upload/jobs/{job_id}").json()
+        if job["state"] in ("succeeded", "failed"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"업로드 작업이 끝나지 않음: {job}")
+
+
+def test_upload_job_converts_file_in_background(client, user_id):
+    content = _excel_bytes([-1000, -2000, -3000])
+
+    accepted = _upload(client, content)
+    job = _wait_for_job(client, accepted["job_id"])
+
+    assert accepted["status"] == "accepted"
+    assert job["state"] == "succeeded"
+    assert job["mode"] == "replace"
+    assert (job["row_count"], job["inserted_count"], job["progress"]) == (3, 3, 1.0)
+    assert job["file_size"] == len(content)
+    assert job["sha256"] == hashlib.sha256(content).hexdigest()
+    assert sorted(load_transactions(user_id=user_id)["금액"]) == [-3000, -2000, -1000]
+
+
+def test_merge_upload_job_skips_known_rows(client):
+    _wait_for_job(client, _upload(client, _excel_bytes([-1000, -2000]))["job_id"])
+
+    job = _wait_for_job(client, _upload(client, _excel_bytes([-1000, -2000, -3000]), mode="merge")["job_id"])
+
+    assert (job["mode"], job["inserted_count"], job["skipped_count"]) == ("merge", 1, 2)
+
+
+def test_failed_conversion_is_reported_on_job(client, user_id):
+    job = _wait_for_job(client, _upload(client, _excel_bytes([-1000, -12.5]))["job_id"])
+
+    assert job["state"] == "failed"
+    assert "2번째 거래의 금액이 정수가 아닙니다" in job["error"]
+    assert load_transactions(user_id=user_id).empty
+
+
+def test_job_is_visible_only_to_its_user(client, user_id):
+    job_id = _upload(client, _excel_bytes([-1000]))["job_id"]
+    _wait_for_job(client, job_id)
+
+    other = client.get(f"/upload/jobs/{job_id}", headers={"X-User-Id": f"{user_id}-other"})
+    assert other.status_code == 404
+    assert client.get("/upload/jobs/없는작업").status_code == 404
+
+
+def test_non_excel_file_is_rejected(client):
+    response = client.post("/upload/excel", files={"file": ("거래내역.csv", b"a,b\n1,2\n")})
+    assert response.status_code == 400
+
+
+def test_oversized_upload_is_rejected_while_streaming(client, user_id, monkeypatch):
+    content = _excel_bytes([-1000])
+    monkeypatch.setattr(
+        upload_service, "save_uploaded_file",
+        partial(upload_repository.save_uploaded_file, max_size=len(content) - 1),
+    )
+
+    response = client.post("/upload/excel", files={"file": ("거래내역.xlsx", content)})
+
+    assert response.status_code == 413
+    assert list((upload_repository.RAW_DATA_DIR / user_id).iterdir()) == []
+
+
+def test_upload_reports_content_hash(client, user_id):
+    content = _excel_bytes([-1000, -2000])
+
+    job = _upload(client, content)["job"]
+
+    assert job["sha256"] == hashlib.sha256(content).hexdigest()
+    assert job["file_size"] == len(content)
+    _wait_for_job(client, job["job_id"])
+
+
+def test_job_state_is_shared_with_other_workers(client, monkeypatch):
+    job_id = _upload(client, _excel_bytes([-1000, -2000]))["job_id"]
+    _wait_for_job(client, job_id)
+
+    # 작업을 실행하지 않은 워커 (메모리에 작업 없음)
+    monkeypatch.setattr(upload_job_service, "_jobs", OrderedDict())
+    job = client.get(f"/upload/jobs/{job_id}").json()
+
+    assert (job["state"], job["inserted_count"]) == ("succeeded", 2)
+
+
+def test_job_of_exited_worker_is_reported_as_failed(client, user_id):
+    job_id = _upload(client, _excel_bytes([-1000]))["job_id"]
+    _wait_for_job(client, job_id)
+
+    # 실행 도중 워커가 종료되어 running으로 남은 상태 파일 (이 프로세스 메모리에는 없음)
+    state = {**load_upload_job_state(user_id, job_id), "job_id": "0" * 32, "state": "running", "worker_pid": os.getpid()}
+    save_upload_job_state(user_id, "0" * 32, state)
+    job = client.get(f"/upload/jobs/{'0' * 32}").json()
+
+    assert job["state"] == "failed"
+    assert job["error"] == upload_job_service.WORKER_EXITED_MESSAGE
+
+
+def test_full_queue_removes_saved_file(client, user_id, monkeypatch):
+    monkeypatch.setattr(upload_job_service, "UPLOAD_MAX_PENDING_JOBS", 0)
+
+    response = client.post("/upload/excel", files={"file": ("거래내역.xlsx", _excel_bytes([-1000]))})
+
+    assert response.status_code == 503
+    assert list((upload_repository.RAW_DATA_DIR / user_id).glob("*.xlsx")) == []
@@ -0,0 +1,172 @@
+"""업로드 merge / replace 모드 테스트"""
+import pandas as pd
+import pytest
+
+from src.core.context.user_context import DEFAULT_USER_ID
+from src.features.transaction.repository import transaction_repository
+from src.features.transaction.repository.change_log import read_changes
+from src.features.transaction.repository.partition_storage import get_user_dataset_dir, list_partitions
+from src.features.transaction.repository.transaction_repository import (
+    get_transactions_version,
+    load_transactions,
+    update_transaction,
+)
+from src.features.upload.service import upload_service
+from src.features.upload.service.upload_service import process_excel_upload
+
+
+def _transactions(dates: list[str], stores: list[str] | None = None) -> pd.DataFrame:
+    n = len(dates)
+    return pd.DataFrame({
+        "날짜": dates,
+        "시간": ["12:00:00"] * n,
+        "타입": ["지출"] * n,
+        "대분류": ["식사"] * n,
+        "내용": stores or [f"가게{i}" for i in range(n)],
+        "금액": [-1000 * (i + 1) for i in range(n)],
+        "결제수단": ["카드"] * n,
+    })
+
+
+def _write_excel(path, df: pd.DataFrame):
+    # 실제 내보내기 파일처럼 두 번째 시트에 거래내역
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame({"요약": [1]}).to_excel(writer, sheet_name="요약", index=False)
+        df.to_excel(writer, sheet_name="거래내역", index=False)
+    return path
+
+
+def _stored(user_id: str) -> pd.DataFrame:
+    return load_transactions(user_id=user_id).sort_values("id").reset_index(drop=True)
+
+
+def _month_keys(user_id: str) -> list[tuple[int, int]]:
+    return sorted(key for key, _ in list_partitions(user_id))
+
+
+JAN_FEB = ["2024-01-05", "2024-01-20", "2024-02-03"]
+FEB_MAR = ["2024-02-03", "2024-03-01", "2024-03-15"]
+
+
+def test_default_mode_replaces_dataset(tmp_path, user_id):
+    process_excel_upload(_write_excel(tmp_path / "a.xlsx", _transactions(JAN_FEB)), user_id)
+    result = process_excel_upload(_write_excel(tmp_path / "b.xlsx", _transactions(FEB_MAR)), user_id)
+
+    stored = _stored(user_id)
+    assert result["inserted_count"] == 3
+    assert _month_keys(user_id) == [(2024, 2), (2024, 3)]
+    assert stored["id"].tolist() == [0, 1, 2]
+    assert stored.sort_values("거래일시")["id"].tolist() == [0, 1, 2]  # 오래된 거래부터 ID 부여
+
+
+def test_replace_bumps_version_once_and_logs_changes(tmp_path, user_id):
+    process_excel_upload(_write_excel(tmp_path / "a.xlsx", _transactions(JAN_FEB)), user_id, mode="replace")
+    before = get_transactions_version(user_id)
+    process_excel_upload(_write_excel(tmp_path / "b.xlsx", _transactions(JAN_FEB[:1])), user_id, mode="replace")
+
+    assert get_transactions_version(user_id) == before + 1
+    assert read_changes(user_id, before, before + 1) == {1: "deleted", 2: "deleted"}
+    # staging / 교체 전 디렉토리는 남지 않음
+    assert [p.name for p in get_user_dataset_dir(user_id).iterdir() if p.name.startswith(".") and p.is_dir()] == []
+
+
+def test_failed_replace_keeps_previous_dataset(tmp_path, user_id, monkeypatch):
+    process_excel_upload(_write_excel(tmp_path / "a.xlsx", _transactions(JAN_FEB)), user_id, mode="replace")
+    before_rows = _stored(user_id)
+    before_version = get_transactions_version(user_id)
+
+    # 두 번째 월을 준비하다가 실패
+    prepare = upload_service._prepare_month_rows
+    calls = []
+
+    def failing_prepare(df):
+        calls.append(len(df))
+        if len(calls) == 2:
+            raise OSError("disk full")
+        return prepare(df)
+
+    monkeypatch.setattr(upload_service, "_prepare_month_rows", failing_prepare)
+    with pytest.raises(OSError):
+        process_excel_upload(_write_excel(tmp_path / "b.xlsx", _transactions(FEB_MAR)), user_id, mode="replace")
+
+    pd.testing.assert_frame_equal(_stored(user_id), before_rows)
+    assert _month_keys(user_id) == [(2024, 1), (2024, 2)]
+    assert get_transactions_version(user_id) == before_version
+
+
+def test_merge_appends_new_rows_and_keeps_ids_and_edits(tmp_path, user_id):
+    process_excel_upload(_write_excel(tmp_path / "a.xlsx", _transactions(JAN_FEB, ["A", "B", "C"])), user_id)
+    first = _stored(user_id)
+    edited_id = int(first.loc[first["내용"] == "B", "id"].iloc[0])
+    update_transaction(edited_id, {"대분류": "카페"}, user_id)
+
+    # 2월 거래(C)는 겹치고 3월 거래 2건만 새로 추가
+    merged = _transactions(JAN_FEB + ["2024-03-01", "2024-03-15"], ["A", "B", "C", "D", "E"])
+    result = process_excel_upload(_write_excel(tmp_path / "b.xlsx", merged), user_id, mode="merge")
+
+    stored = _stored(user_id)
+    assert (result["inserted_count"], result["skipped_count"]) == (2, 3)
+    assert stored["id"].tolist() == [0, 1, 2, 3, 4]
+    assert dict(zip(stored["내용"], stored["id"])) == {**dict(zip(first["내용"], first["id"])), "D": 3, "E": 4}
+    assert stored.loc[stored["id"] == edited_id, "대분류"].item() == "카페"
+
+
+def test_merge_after_editing_migrated_rows_inserts_nothing(tmp_path, user_id):
+    # 해시 도입 이전의 단일 파일 데이터 (row_hash 없음)
+    path = _write_excel(tmp_path / "a.xlsx", _transactions(JAN_FEB, ["A", "B", "C"]))
+    process_excel_upload(path, user_id)
+    _stored(user_id).drop(columns="row_hash").to_parquet(transaction_repository.LEGACY_TRANSACTIONS_PARQUET_PATH)
+
+    # 이관 후 자연키(내용)를 수정해도 원래 파일을 다시 병합하면 중복 추가되지 않음
+    migrated = _stored(DEFAULT_USER_ID)
+    update_transaction(int(migrated.loc[migrated["내용"] == "B", "id"].iloc[0]), {"내용": "수정"}, DEFAULT_USER_ID)
+    result = process_excel_upload(path, DEFAULT_USER_ID, mode="merge")
+
+    assert result["inserted_count"] == 0
+    assert sorted(_stored(DEFAULT_USER_ID)["내용"]) == ["A", "C", "수정"]
+
+
+def test_merge_of_same_file_inserts_nothing(tmp_path, user_id):
+    path = _write_excel(tmp_path / "a.xlsx", _transactions(JAN_FEB))
+    process_excel_upload(path, user_id)
+    before = _stored(user_id)
+    version = get_transactions_version(user_id)
+
+    result = process_excel_upload(path, user_id, mode="merge")
+
+    assert result["inserted_count"] == 0
+    pd.testing.assert_frame_equal(_stored(user_id), before)
+    assert get_transactions_version(user_id) == version
+
+
+def test_merge_bumps_version_once_per_upload(tmp_path, user_id):
+    process_excel_upload(_write_excel(tmp_path / "a.xlsx", _transactions(JAN_FEB[:1], ["A"])), user_id)
+    before = get_transactions_version(user_id)
+
+    merged = _transactions(JAN_FEB + FEB_MAR[1:], ["A", "B", "C", "D", "E"])
+    process_excel_upload(_write_excel(tmp_path / "b.xlsx", merged), user_id, mode="merge")
+
+    assert get_transactions_version(user_id) == before + 1
+    assert read_changes(user_id, before, before + 1) == {i: "inserted" for i in range(1, 5)}
+
+
+def test_failed_merge_records_months_already_written(tmp_path, user_id, monkeypatch):
+    process_excel_upload(_write_excel(tmp_path / "a.xlsx", _transactions(JAN_FEB[:1], ["A"])), user_id)
+    before = get_transactions_version(user_id)
+
+    # 1월(B)을 저장한 뒤 2월을 준비하다가 실패
+    prepare = upload_service._prepare_month_rows
+
+    def failing_prepare(df):
+        if df["거래일시"].dt.month.iloc[0] == 2:
+            raise OSError("disk full")
+        return prepare(df)
+
+    monkeypatch.setattr(upload_service, "_prepare_month_rows", failing_prepare)
+    with pytest.raises(OSError):
+        merged = _transactions(JAN_FEB, ["A", "B", "C"])
+        process_excel_upload(_write_excel(tmp_path / "b.xlsx", merged), user_id, mode="merge")
+
+    assert sorted(_stored(user_id)["내용"]) == ["A", "B"]
+    assert get_transactions_version(user_id) == before + 1
+    assert read_changes(user_id, before, before + 1) == {1: "inserted"}
@@ -0,0 +1,48 @@
+"""업로드 변환 (upload_service) 테스트"""
+import pandas as pd
+import pytest
+
+from src.features.upload.service.upload_service import _process_transaction_chunk
+
+
+def _make_chunk(amounts: list, **columns) -> pd.DataFrame:
+    n = len(amounts)
+    return pd.DataFrame({
+        "날짜": ["2024-03-01"] * n,
+        "시간": ["12:30:00"] * n,
+        "타입": ["지출"] * n,
+        "대분류": ["식사"] * n,
+        "내용": ["김밥천국"] * n,
+        "금액": amounts,
+        "결제수단": ["카드A"] * n,
+        **columns,
+    })
+
+
+def test_amounts_become_int64():
+    chunk = _process_transaction_chunk(_make_chunk([-8000, -1234.0, 50000]))
+    assert chunk["금액"].dtype == "int64"
+    assert chunk["금액"].tolist() == [-8000, -1234, 50000]
+    assert chunk.columns[0] == "거래일시"
+    assert chunk["거래일시"].iloc[0] == pd.Timestamp("2024-03-01 12:30:00")
+
+
+def test_fractional_amount_is_rejected_with_row_number():
+    with pytest.raises(ValueError, match=r"12번째 거래.*1234\.56"):
+        _process_transaction_chunk(_make_chunk([-8000, -1234.56]), first_row=11)
+
+
+@pytest.mark.parametrize("value, message", [
+    (None, r"비어 있는 거래가 있습니다 \(2번째 거래\)"),
+    ("abc", r"2번째 거래의 금액이 정수가 아닙니다"),
+    (float("inf"), r"2번째 거래의 금액이 정수가 아닙니다"),
+])
+def test_invalid_amount_is_rejected(value, message):
+    with pytest.raises(ValueError, match=message):
+        _process_transaction_chunk(_make_chunk([-8000, value]))
+
+
+def test_non_text_columns_keep_their_dtype():
+    chunk = _process_transaction_chunk(_make_chunk([-1000, -2000], 포인트=[1.5, 2.0], 메모=["점심", 123]))
+    assert chunk["포인트"].dtype == "float64"
+    assert chunk["메모"].tolist() == ["점심", 123]  # 문자열 변환은 staging writer에서 수행
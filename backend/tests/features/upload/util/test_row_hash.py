@@ -0,0 +1,27 @@
+"""자연키 행 해시 테스트"""
+import numpy as np
+import pandas as pd
+
+from src.features.upload.util.row_hash import compute_row_hash, fill_missing_row_hash
+
+
+def _rows() -> pd.DataFrame:
+    return pd.DataFrame({
+        "거래일시": pd.to_datetime(["2024-01-05 12:00"] * 3),
+        "금액": [-1000, -1000, -2000],
+        "내용": ["가게", "가게", "식당"],
+        "결제수단": ["카드"] * 3,
+    })
+
+
+def test_missing_hashes_are_filled_and_existing_kept():
+    df = _rows()
+    expected = compute_row_hash(df)
+    partial = df.assign(row_hash=pd.Series([123, np.nan, np.nan], dtype="float64"))
+
+    filled = fill_missing_row_hash(partial)["row_hash"]
+
+    assert filled.dtype == "uint64"
+    # 같은 자연키의 두 번째 거래는 등장 순서가 반영된 해시
+    assert filled.tolist() == [123, expected[1], expected[2]]
+    assert fill_missing_row_hash(df)["row_hash"].tolist() == expected.tolist()
@@ -106,13 +106,14 @@ class BaseApiClient {
     String fileName, {                        // 서버/로그에 남길 파일명
     String? logMessage,                       // 로그에 남길 커스텀 메시지
     Map<String, String>? fields,              // 추가로 전송할 폼 필드 (옵션)
+    Map<String, String>? queryParams,         // 쿼리 파라미터 (옵션)
   }) async {
     // 처리 흐름: URI 생성 → MultipartRequest 생성(POST, URI) → 파일 추가(file, 파일 경로, 파일명) 
-    //  → 추가 필드 추가 → 요청 전송 → 응답 검증(200) → JSON 파싱
+    //  → 추가 필드 추가 → 요청 전송 → 응답 검증(200/202) → JSON 파싱
     // 에러: 모든 예외는 로깅 후 rethrow
 
-    // baseUrl + endpoint 로 전체 URI 생성
-    final uri = _buildUri(endpoint);
+    // baseUrl + endpoint + 쿼리 파라미터로 전체 URI 생성
+    final uri = _buildUri(endpoint, queryParams: queryParams);
     LoggerService.debug('API', logMessage ?? 'Multipart POST 요청: $uri');
 
     try {
@@ -138,7 +139,8 @@ class BaseApiClient {
       final response = await http.Response.fromStream(streamedResponse);
 
       // 응답 처리 (상태 코드 검증, JSON 파싱, 에러 처리)
-      return _handleResponse(response, [200]);
+      // 202: 서버가 백그라운드 작업으로 접수한 경우
+      return _handleResponse(response, [200, 202]);
     } catch (e, stackTrace) {
       // 네트워크 에러/파싱 에러 등 모든 예외를 로깅 후 rethrow
       _handleError(uri, e, stackTrace, 'Multipart POST 요청 실패');
@@ -5,6 +5,12 @@ import '../../core/api/api_client.dart';
 import 'upload_file_validator.dart' as validator;
 
 class UploadApi {
+  /// 변환 작업 상태 조회 간격
+  static const Duration _jobPollInterval = Duration(seconds: 1);
+
+  /// 변환 작업 최대 대기 시간
+  static const Duration _jobTimeout = Duration(minutes: 10);
+
   /// 엑셀 파일 업로드 (모바일용 - 파일 경로 사용)
   static Future<Map<String, dynamic>> uploadExcel(
     String filePath,
@@ -18,18 +24,54 @@ class UploadApi {
 
     LoggerService.info('Upload', '파일 업로드 시작: $fileName');
 
-    // 파일 업로드
+    // 파일 업로드 (merge: 기존 거래의 ID/수정 내역은 유지하고 새 거래만 추가)
     final result = await BaseApiClient.postMultipart(
       '/upload/excel',
       filePath,
       fileName,
       logMessage: '엑셀 파일 업로드 API 요청: $fileName',
+      queryParams: {'mode': 'merge'},
     );
 
+    // 백그라운드 변환 작업이면 완료될 때까지 대기
+    if (result['status'] == 'accepted') {
+      return _processJobResult(await _waitForJob(result['job_id']), fileName);
+    }
+
     // 결과 검증 및 처리
     return _processUploadResult(result, fileName);
   }
 
+  /// 변환 작업이 끝날 때까지 상태 조회
+  static Future<Map<String, dynamic>> _waitForJob(String jobId) async {
+    final deadline = DateTime.now().add(_jobTimeout);
+
+    while (DateTime.now().isBefore(deadline)) {
+      final job = await BaseApiClient.get(
+        '/upload/jobs/$jobId',
+        logMessage: '업로드 작업 상태 조회: $jobId',
+      );
+      if (job['state'] == 'succeeded' || job['state'] == 'failed') {
+        return job;
+      }
+      await Future.delayed(_jobPollInterval);
+    }
+    throw Exception('파일 변환 시간이 초과되었습니다');
+  }
+
+  /// 변환 작업 결과 처리
+  static Map<String, dynamic> _processJobResult(
+    Map<String, dynamic> job,
+    String fileName,
+  ) {
+    if (job['state'] != 'succeeded') {
+      throw Exception('파일 변환 실패: ${job['error'] ?? '알 수 없는 오류'}');
+    }
+
+    LoggerService.info('Upload', '파일 업로드 성공: $fileName (${job['inserted_count']}건 추가)');
+    return job;
+  }
+
   /// 파일명 검증 (확장자만 체크 - 웹/모바일 공통)
   static void _validateFileName(String fileName) {
     if (!fileName.toLowerCase().endsWith('.xlsx') && 